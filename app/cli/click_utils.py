@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
+import click
+
+from app.cli.output import FORMATS, output_format, resolve_format
+from app.repositories.list_filters import DEFAULT_PAGE_SIZE, ListFilters
+
 
 @dataclass
 class Args:
@@ -11,3 +19,193 @@ class Args:
     def __init__(self, **kwargs: Any) -> None:
         for k, v in kwargs.items():
             setattr(self, k, v)
+
+
+class DecimalParam(click.ParamType):
+    """Type click pour les montants (Decimal, sans passer par float)."""
+
+    name = "decimal"
+
+    def convert(self, value: Any, param: Any, ctx: Any) -> Decimal:
+        if isinstance(value, Decimal):
+            return value
+        try:
+            return Decimal(str(value).replace(",", "."))
+        except InvalidOperation:
+            self.fail(f"{value!r} n'est pas un montant valide.", param, ctx)
+
+
+class PeriodEndParam(click.ParamType):
+    """
+    Type click de la borne --to : une date seule inclut toute la journée
+    (2026-03-01 -> 2026-03-02 00:00 exclu), une date avec heure est prise telle quelle.
+    """
+
+    name = "date"
+
+    def convert(self, value: Any, param: Any, ctx: Any) -> datetime:
+        if isinstance(value, datetime):
+            return value
+        text = str(value).strip()
+        try:
+            return datetime.strptime(text, "%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(text, "%Y-%m-%d") + timedelta(days=1)
+        except ValueError:
+            self.fail(
+                f"{value!r} n'est pas une date valide (YYYY-MM-DD[ HH:MM]).",
+                param,
+                ctx,
+            )
+
+
+# Options de filtrage / tri partagées par les commandes `list`
+_LIST_OPTIONS: dict[str, Callable[[Callable[..., Any]], Callable[..., Any]]] = {
+    "client_id": click.option(
+        "--client-id", "client_id", type=int, default=None, help="Filtrer par client."
+    ),
+    "contract_id": click.option(
+        "--contract-id",
+        "contract_id",
+        type=int,
+        default=None,
+        help="Filtrer par contrat.",
+    ),
+    "sales_id": click.option(
+        "--sales-id",
+        "sales_id",
+        type=int,
+        default=None,
+        help="Filtrer par commercial (id employé).",
+    ),
+    "support_id": click.option(
+        "--support-id",
+        "support_id",
+        type=int,
+        default=None,
+        help="Filtrer par support (id employé).",
+    ),
+    "company": click.option(
+        "--company",
+        default=None,
+        help="Filtrer par entreprise (insensible à la casse).",
+    ),
+    "min_due": click.option(
+        "--min-due",
+        "min_due",
+        type=DecimalParam(),
+        default=None,
+        help="Montant restant dû minimum.",
+    ),
+    "created_after": click.option(
+        "--created-after",
+        "created_after",
+        type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+        default=None,
+        help="Créés à partir de cette date (YYYY-MM-DD[ HH:MM]).",
+    ),
+    "period_start": click.option(
+        "--from",
+        "period_start",
+        type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+        default=None,
+        help="En cours à partir de cette date (YYYY-MM-DD[ HH:MM]).",
+    ),
+    "period_end": click.option(
+        "--to",
+        "period_end",
+        type=PeriodEndParam(),
+        default=None,
+        help="En cours jusqu'à cette date incluse (YYYY-MM-DD[ HH:MM]).",
+    ),
+}
+
+
+def format_option(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Option --format (auto-détection table / plain selon le terminal)."""
+    return click.option(
+        "--format",
+        "format",
+        type=click.Choice(FORMATS, case_sensitive=False),
+        default=None,
+        callback=lambda _ctx, _param, value: resolve_format(value),
+        help="Format de sortie (défaut : table dans un terminal, plain sinon).",
+    )(func)
+
+
+def list_options(
+    *names: str, sortable: Iterable[str]
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Décorateur ajoutant les options de filtrage `names`, --sort, --format,
+    --pager / --page-size et les modes --count / --approx.
+
+    Les valeurs sont transmises en kwargs à la commande click.
+    """
+    sort_help = f"Tri 'colonne[:asc|desc]' parmi : {', '.join(sortable)}."
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func = click.option(
+            "--approx",
+            is_flag=True,
+            help="Avec --count : estimation instantanée (statistiques PostgreSQL).",
+        )(func)
+        func = click.option(
+            "--count",
+            is_flag=True,
+            help="Affiche uniquement le nombre de résultats (SELECT count(*)).",
+        )(func)
+        func = format_option(func)
+        func = click.option(
+            "--page-size",
+            "page_size",
+            type=click.IntRange(min=1),
+            default=DEFAULT_PAGE_SIZE,
+            show_default=True,
+            help="Lignes chargées par requête (--pager et formats en flux).",
+        )(func)
+        func = click.option(
+            "--pager",
+            is_flag=True,
+            help="Table paginée à largeurs fixes, chargée au fil de la lecture.",
+        )(func)
+        func = click.option("--sort", default=None, help=sort_help)(func)
+        for name in reversed(names):
+            func = _LIST_OPTIONS[name](func)
+        return func
+
+    return decorator
+
+
+def list_filters_from_args(args: Any) -> ListFilters:
+    """Construit les filtres de liste à partir des attributs optionnels de `args`."""
+    return ListFilters(
+        client_id=getattr(args, "client_id", None),
+        contract_id=getattr(args, "contract_id", None),
+        sales_contact_id=getattr(args, "sales_id", None),
+        support_contact_id=getattr(args, "support_id", None),
+        company=getattr(args, "company", None),
+        min_due=getattr(args, "min_due", None),
+        created_after=getattr(args, "created_after", None),
+        period_start=getattr(args, "period_start", None),
+        period_end=getattr(args, "period_end", None),
+        sort=getattr(args, "sort", None),
+    )
+
+
+def count_mode(args: Any) -> tuple[bool, bool]:
+    """Retourne (compter, estimer) : --approx implique --count."""
+    approx = bool(getattr(args, "approx", False))
+    return approx or bool(getattr(args, "count", False)), approx
+
+
+def stream_mode(args: Any) -> bool:
+    """Indique si la liste doit être parcourue page par page (--pager / flux)."""
+    return bool(getattr(args, "pager", False)) or output_format(args) != "table"
+
+
+def page_size(args: Any) -> int:
+    """Taille de page demandée (--page-size)."""
+    return getattr(args, "page_size", None) or DEFAULT_PAGE_SIZE
@@ -1,89 +1,325 @@
 from __future__ import annotations
 
 import argparse
+import json
+import sys
+from typing import Any
 
 import sentry_sdk
-from rich.table import Table
 
-from app.cli.console import console, error, forbidden, info, success
+from app.cli.click_utils import (
+    count_mode,
+    list_filters_from_args,
+    page_size,
+    stream_mode,
+)
+from app.cli.console import console, error, forbidden, print_count, success
+from app.cli.output import Column, output_format, render_rows
 from app.db.session import get_session
 from app.models.employee import Role
+from app.repositories.client_repository import ClientOverview
 from app.services.client_service import (
     ClientAlreadyExistsError,
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
+    count_clients,
     create_client,
+    get_client_overview,
+    iter_clients,
     list_clients,
     reassign_client,
+    search_clients,
     update_client,
 )
 from app.services.current_employee import NotAuthenticatedError, get_current_employee
 from app.utils.phone import format_phone_fr
 
+_COLUMNS = (
+    Column("client_id", "ID Client", justify="center", no_wrap=True),
+    Column("full_name", "Nom complet", justify="center"),
+    Column("email", "Email", justify="center", no_wrap=True),
+    Column("phone", "Téléphone", justify="center", no_wrap=True),
+    Column("company", "Entreprise", justify="center"),
+    Column("sales_name", "Contact Commercial", justify="center"),
+    Column("created_at", "Créé le", justify="center", no_wrap=True),
+    Column("updated_at", "Modifié le", justify="center", no_wrap=True),
+)
+
 
-def cmd_clients_list(_: argparse.Namespace) -> None:
+def _client_row(c: Any) -> dict[str, str]:
+    """Valeurs affichables d'un client, par clé de colonne."""
+    commercial = (
+        f"{c.sales_contact.first_name} {c.sales_contact.last_name}"
+        if getattr(c, "sales_contact", None)
+        else "N/A"
+    )
+    return {
+        "client_id": str(c.id),
+        "full_name": f"{c.first_name} {c.last_name}",
+        "email": c.email,
+        "phone": format_phone_fr(c.phone) or "N/A",
+        "company": c.company_name or "N/A",
+        "sales_name": commercial,
+        "created_at": c.created_at.strftime("%Y-%m-%d %H:%M"),
+        "updated_at": (
+            c.updated_at.strftime("%Y-%m-%d %H:%M") if c.updated_at else "N/A"
+        ),
+    }
+
+
+def cmd_clients_list(args: argparse.Namespace) -> None:
     """Liste les clients accessibles à l'utilisateur courant."""
     session = get_session()
     try:
         employee = get_current_employee(session)
-        clients = list_clients(session=session, current_employee=employee)
 
-        if not clients:
-            info("Aucun client trouvé.")
-            return
+        criteria = {
+            "scope": getattr(args, "scope", None),
+            "filters": list_filters_from_args(args),
+        }
 
-        is_management = employee.role == Role.MANAGEMENT
-        is_sales = employee.role == Role.SALES
+        counting, approx = count_mode(args)
+        if counting:
+            total = count_clients(
+                session=session, current_employee=employee, approx=approx, **criteria
+            )
+            print_count(total, "client(s)", approx=approx)
+            return
 
-        table = Table(title="Clients", show_lines=True)
+        if stream_mode(args):
+            clients = iter_clients(
+                session=session,
+                current_employee=employee,
+                page_size=page_size(args),
+                **criteria,
+            )
+        else:
+            clients = list_clients(
+                session=session, current_employee=employee, **criteria
+            )
 
+        columns = list(_COLUMNS)
         # Affichage de l'ID uniquement pour MANAGEMENT/SALES
-        if is_management or is_sales:
-            table.add_column("ID Client", justify="center", no_wrap=True)
-
-        table.add_column("Nom complet", justify="center")
-        table.add_column("Email", justify="center", no_wrap=True)
-        table.add_column("Téléphone", justify="center", no_wrap=True)
-        table.add_column("Entreprise", justify="center")
-        table.add_column("Contact Commercial", justify="center")
-        table.add_column("Créé le", justify="center", no_wrap=True)
-        table.add_column("Modifié le", justify="center", no_wrap=True)
-
-        for c in clients:
-            commercial = (
-                f"{c.sales_contact.first_name} {c.sales_contact.last_name}"
-                if getattr(c, "sales_contact", None)
-                else "N/A"
-            )
+        if employee.role not in {Role.MANAGEMENT, Role.SALES}:
+            columns = columns[1:]
+
+        render_rows(
+            (_client_row(c) for c in clients),
+            columns,
+            fmt=output_format(args),
+            title="Clients",
+            unit="client(s)",
+            empty_message="Aucun client trouvé.",
+            show_lines=True,
+            target=console,
+            pager=getattr(args, "pager", False),
+        )
 
-            row: list[str] = []
-
-            if is_management or is_sales:
-                row.append(str(c.id))
-
-            row.extend(
-                [
-                    f"{c.first_name} {c.last_name}",
-                    c.email,
-                    format_phone_fr(c.phone) or "N/A",
-                    c.company_name or "N/A",
-                    commercial,
-                    c.created_at.strftime("%Y-%m-%d %H:%M"),
-                    c.updated_at.strftime("%Y-%m-%d %H:%M") if c.updated_at else "N/A",
-                ]
-            )
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la récupération des clients : {exc}")
+    finally:
+        session.close()
+
+
+_SEARCH_COLUMNS = (
+    Column("client_id", "ID Client", justify="right", no_wrap=True),
+    Column("full_name", "Nom complet"),
+    Column("email", "Email", no_wrap=True),
+    Column("company", "Entreprise"),
+    Column("sales_name", "Contact Commercial"),
+    Column("score", "Pertinence", justify="right", no_wrap=True),
+)
+
+
+def cmd_clients_search(args: argparse.Namespace) -> None:
+    """Recherche des clients (nom, prénom, email, entreprise), par pertinence."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        page = getattr(args, "page", 1) or 1
+        results = search_clients(
+            session=session,
+            current_employee=employee,
+            query=args.query,
+            scope=getattr(args, "scope", None),
+            limit=getattr(args, "limit", 20) or 20,
+            page=page,
+        )
+
+        render_rows(
+            ({**_client_row(c), "score": f"{score:.2f}"} for c, score in results),
+            _SEARCH_COLUMNS,
+            fmt=output_format(args),
+            title=f"Recherche « {args.query} » (page {page})",
+            unit="résultat(s)",
+            empty_message="Aucun client ne correspond à la recherche.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la recherche de clients : {exc}")
+    finally:
+        session.close()
 
-            table.add_row(*row)
 
-        table.caption = f"{len(clients)} client(s)"
-        console.print(table)
+_FIELD_COLUMNS = (
+    Column("label", "Champ"),
+    Column("value", "Valeur"),
+)
+
+_SHOW_CONTRACT_COLUMNS = (
+    Column("contract_id", "ID", justify="right", no_wrap=True),
+    Column("status", "Statut", no_wrap=True),
+    Column("total_amount", "Montant total", justify="right", no_wrap=True),
+    Column("amount_due", "Restant dû", justify="right", no_wrap=True),
+    Column("sales_name", "Commercial"),
+    Column("created_at", "Créé le", no_wrap=True),
+)
+
+_SHOW_EVENT_COLUMNS = (
+    Column("event_id", "ID", justify="right", no_wrap=True),
+    Column("contract_id", "Contrat", justify="right", no_wrap=True),
+    Column("start_date", "Début", no_wrap=True),
+    Column("end_date", "Fin", no_wrap=True),
+    Column("location", "Lieu"),
+    Column("attendees", "Participants", justify="right", no_wrap=True),
+    Column("support_name", "Support"),
+)
+
+
+def _overview_document(overview: ClientOverview) -> dict[str, Any]:
+    """Fiche client sous forme de document imbriqué (sortie json)."""
+    client = overview.client
+    return {
+        "id": client.id,
+        "first_name": client.first_name,
+        "last_name": client.last_name,
+        "email": client.email,
+        "phone": client.phone,
+        "company_name": client.company_name,
+        "sales_contact": {
+            "id": client.sales_contact_id,
+            "full_name": (
+                f"{client.sales_contact.first_name} {client.sales_contact.last_name}"
+            ),
+        },
+        "created_at": client.created_at.isoformat(),
+        "contracts": [
+            {
+                "id": ct.id,
+                "total_amount": str(ct.total_amount),
+                "amount_due": str(ct.amount_due),
+                "is_signed": ct.is_signed,
+                "created_at": ct.created_at.isoformat(),
+                "sales_name": ct.sales_name,
+            }
+            for ct in overview.contracts
+        ],
+        "events": [
+            {
+                "id": ev.id,
+                "contract_id": ev.contract_id,
+                "start_date": ev.start_date.isoformat(),
+                "end_date": ev.end_date.isoformat(),
+                "location": ev.location,
+                "attendees": ev.attendees,
+                "support_name": ev.support_name,
+            }
+            for ev in overview.events
+        ],
+    }
+
+
+def _render_overview(overview: ClientOverview) -> None:
+    """Fiche client : champs du client, puis ses contrats et ses événements."""
+    row = _client_row(overview.client)
+    render_rows(
+        (
+            {"label": col.header, "value": row[col.key]}
+            for col in _COLUMNS
+            if col.key != "client_id"
+        ),
+        _FIELD_COLUMNS,
+        fmt="table",
+        title=f"Client #{overview.client.id}",
+        unit="champ(s)",
+        empty_message="Aucun champ.",
+        target=console,
+    )
+    render_rows(
+        (
+            {
+                "contract_id": str(ct.id),
+                "status": "Signé" if ct.is_signed else "Non signé",
+                "total_amount": str(ct.total_amount),
+                "amount_due": str(ct.amount_due),
+                "sales_name": ct.sales_name,
+                "created_at": ct.created_at.strftime("%Y-%m-%d %H:%M"),
+            }
+            for ct in overview.contracts
+        ),
+        _SHOW_CONTRACT_COLUMNS,
+        fmt="table",
+        title="Contrats",
+        unit="contrat(s)",
+        empty_message="Aucun contrat pour ce client.",
+        target=console,
+    )
+    render_rows(
+        (
+            {
+                "event_id": str(ev.id),
+                "contract_id": str(ev.contract_id),
+                "start_date": ev.start_date.strftime("%Y-%m-%d %H:%M"),
+                "end_date": ev.end_date.strftime("%Y-%m-%d %H:%M"),
+                "location": ev.location,
+                "attendees": str(ev.attendees),
+                "support_name": ev.support_name or "— non assigné",
+            }
+            for ev in overview.events
+        ),
+        _SHOW_EVENT_COLUMNS,
+        fmt="table",
+        title="Événements",
+        unit="événement(s)",
+        empty_message="Aucun événement pour ce client.",
+        target=console,
+    )
+
+
+def cmd_clients_show(args: argparse.Namespace) -> None:
+    """Affiche la fiche d'un client : commercial, contrats et événements."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        overview = get_client_overview(session, employee, args.client_id)
+
+        if output_format(args) == "json":
+            sys.stdout.write(
+                json.dumps(_overview_document(overview), ensure_ascii=False, indent=2)
+                + "\n"
+            )
+        else:
+            _render_overview(overview)
 
     except NotAuthenticatedError as exc:
         error(str(exc))
+    except NotFoundError as exc:
+        error(str(exc))
     except Exception as exc:
         sentry_sdk.capture_exception(exc)
-        error(f"Erreur lors de la récupération des clients : {exc}")
+        error(f"Erreur lors de l'affichage du client : {exc}")
     finally:
         session.close()
 
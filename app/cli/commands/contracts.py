@@ -3,11 +3,18 @@ from __future__ import annotations
 import argparse
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 import sentry_sdk
-from rich.table import Table
 
-from app.cli.console import console, error, forbidden, info, success
+from app.cli.click_utils import (
+    count_mode,
+    list_filters_from_args,
+    page_size,
+    stream_mode,
+)
+from app.cli.console import console, error, forbidden, info, print_count, success
+from app.cli.output import Column, output_format, render_rows
 from app.core.authorization import AuthorizationError, require_role
 from app.db.session import get_session
 from app.models.employee import Role
@@ -15,7 +22,9 @@ from app.services.contract_service import (
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
+    count_contracts,
     create_contract,
+    iter_contracts,
     list_contracts,
     reassign_contract,
     sign_contract,
@@ -82,80 +91,104 @@ _VIEWS = {
 }
 
 
+def _contract_row(ct: Any) -> dict[str, str]:
+    """Valeurs affichables d'un contrat, par clé de colonne."""
+    client = getattr(ct, "client", None)
+    sales = getattr(ct, "sales_contact", None)
+
+    client_name = "N/A"
+    client_email = "N/A"
+    client_phone = "N/A"
+    company = "N/A"
+
+    if client:
+        first = getattr(client, "first_name", "") or ""
+        last = getattr(client, "last_name", "") or ""
+        client_name = f"{first} {last}".strip() or "N/A"
+        client_email = getattr(client, "email", None) or "N/A"
+        client_phone = format_phone_fr(getattr(client, "phone", None) or "") or "N/A"
+        company = getattr(client, "company_name", None) or "N/A"
+
+    sales_name = "N/A"
+    if sales:
+        sf = getattr(sales, "first_name", "") or ""
+        sl = getattr(sales, "last_name", "") or ""
+        sales_name = f"{sf} {sl}".strip() or "N/A"
+
+    return {
+        "contract_id": str(getattr(ct, "id", "N/A")),
+        "client_name": client_name,
+        "client_email": client_email,
+        "client_phone": client_phone,
+        "company": company,
+        "sales_name": sales_name,
+        "amount_due": str(getattr(ct, "amount_due", "N/A")),
+        "total": str(getattr(ct, "total_amount", "N/A")),
+        "signed": "✅" if getattr(ct, "is_signed", False) else "❌",
+        "created_at": _fmt_dt(getattr(ct, "created_at", None)),
+        "updated_at": _fmt_dt(getattr(ct, "updated_at", None)),
+    }
+
+
 def cmd_contracts_list(args: argparse.Namespace) -> None:
     """Liste les contrats accessibles à l'utilisateur courant."""
     session = get_session()
     try:
         employee = get_current_employee(session)
-        contracts = list_contracts(
-            session=session,
-            current_employee=employee,
-            unsigned=getattr(args, "unsigned", False),
-            unpaid=getattr(args, "unpaid", False),
-        )
 
-        if not contracts:
-            info("Aucun contrat trouvé.")
+        criteria = {
+            "unsigned": getattr(args, "unsigned", False),
+            "unpaid": getattr(args, "unpaid", False),
+            "scope": getattr(args, "scope", None),
+            "filters": list_filters_from_args(args),
+        }
+
+        counting, approx = count_mode(args)
+        if counting:
+            total = count_contracts(
+                session=session, current_employee=employee, approx=approx, **criteria
+            )
+            print_count(total, "contrat(s)", approx=approx)
             return
 
+        if stream_mode(args):
+            contracts = iter_contracts(
+                session=session,
+                current_employee=employee,
+                page_size=page_size(args),
+                **criteria,
+            )
+        else:
+            contracts = list_contracts(
+                session=session, current_employee=employee, **criteria
+            )
+
         view = (getattr(args, "view", None) or "compact").lower()
-        columns = _VIEWS.get(view, _VIEWS["compact"])
-
-        table = Table(title=f"Contrats ({view})")
-
-        for col in columns:
-            label = _COLUMNS[col]
-            if col in {"contract_id"}:
-                table.add_column(label, justify="right", no_wrap=True)
-            else:
-                table.add_column(label)
-
-        for ct in contracts:
-            client = getattr(ct, "client", None)
-            sales = getattr(ct, "sales_contact", None)
-
-            client_name = "N/A"
-            client_email = "N/A"
-            client_phone = "N/A"
-            company = "N/A"
-
-            if client:
-                first = getattr(client, "first_name", "") or ""
-                last = getattr(client, "last_name", "") or ""
-                client_name = f"{first} {last}".strip() or "N/A"
-                client_email = getattr(client, "email", None) or "N/A"
-                client_phone = (
-                    format_phone_fr(getattr(client, "phone", None) or "") or "N/A"
-                )
-                company = getattr(client, "company_name", None) or "N/A"
-
-            sales_name = "N/A"
-            if sales:
-                sf = getattr(sales, "first_name", "") or ""
-                sl = getattr(sales, "last_name", "") or ""
-                sales_name = f"{sf} {sl}".strip() or "N/A"
-
-            row_map = {
-                "contract_id": str(getattr(ct, "id", "N/A")),
-                "client_name": client_name,
-                "client_email": client_email,
-                "client_phone": client_phone,
-                "company": company,
-                "sales_name": sales_name,
-                "amount_due": str(getattr(ct, "amount_due", "N/A")),
-                "total": str(getattr(ct, "total_amount", "N/A")),
-                "signed": "✅" if getattr(ct, "is_signed", False) else "❌",
-                "created_at": _fmt_dt(getattr(ct, "created_at", None)),
-                "updated_at": _fmt_dt(getattr(ct, "updated_at", None)),
-            }
-
-            table.add_row(*[row_map[c] for c in columns])
-
-        table.caption = f"{len(contracts)} contrat(s)"
-        console.print(table)
+        columns = [
+            Column(
+                key,
+                _COLUMNS[key],
+                justify="right" if key == "contract_id" else "left",
+                no_wrap=key == "contract_id",
+            )
+            for key in _VIEWS.get(view, _VIEWS["compact"])
+        ]
+
+        render_rows(
+            (_contract_row(ct) for ct in contracts),
+            columns,
+            fmt=output_format(args),
+            title=f"Contrats ({view})",
+            unit="contrat(s)",
+            empty_message="Aucun contrat trouvé.",
+            target=console,
+            pager=getattr(args, "pager", False),
+        )
 
     except NotAuthenticatedError as exc:
         error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
     except Exception as exc:
         sentry_sdk.capture_exception(exc)
         error(f"Erreur lors de la récupération des contrats : {exc}")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+
+import sentry_sdk
+
+from app.cli.console import console, error, forbidden
+from app.cli.output import Column, render_rows
+from app.db.session import get_session
+from app.services.current_employee import NotAuthenticatedError, get_current_employee
+from app.services.dashboard_service import PermissionDeniedError, build_dashboard
+
+_SUMMARY_COLUMNS = (
+    Column("label", "Indicateur"),
+    Column("value", "Valeur", justify="right", no_wrap=True),
+)
+
+_SALES_COLUMNS = (
+    Column("employee_id", "ID", justify="right", no_wrap=True),
+    Column("full_name", "Commercial"),
+    Column("signed", "Signés", justify="right", no_wrap=True),
+    Column("unsigned", "Non signés", justify="right", no_wrap=True),
+    Column("total_amount", "Montant total", justify="right", no_wrap=True),
+    Column("amount_due", "Restant dû", justify="right", no_wrap=True),
+)
+
+_SUPPORT_COLUMNS = (
+    Column("employee_id", "ID", justify="right", no_wrap=True),
+    Column("full_name", "Support"),
+    Column("events", "Événements", justify="right", no_wrap=True),
+    Column("upcoming", "À venir / en cours", justify="right", no_wrap=True),
+)
+
+
+def cmd_dashboard(args: argparse.Namespace) -> None:
+    """Affiche le tableau de bord management (agrégats calculés en base)."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        dashboard = build_dashboard(session, employee)
+
+        summary = [
+            ("Contrats", str(dashboard.contracts)),
+            ("Contrats signés", str(dashboard.signed_contracts)),
+            ("Montant total des contrats", str(dashboard.total_amount)),
+            ("Restant dû", str(dashboard.amount_due)),
+            ("Événements à venir sans support", str(dashboard.unassigned_upcoming)),
+            ("… dont dans les 7 jours", str(dashboard.unassigned_within_week)),
+            ("Clients sans contrat", str(dashboard.clients_without_contract)),
+        ]
+        render_rows(
+            ({"label": label, "value": value} for label, value in summary),
+            _SUMMARY_COLUMNS,
+            fmt="table",
+            title="Tableau de bord",
+            unit="indicateur(s)",
+            empty_message="Aucun indicateur.",
+            target=console,
+        )
+        render_rows(
+            (
+                {
+                    "employee_id": str(s.employee_id),
+                    "full_name": s.full_name,
+                    "signed": str(s.signed),
+                    "unsigned": str(s.unsigned),
+                    "total_amount": str(s.total_amount),
+                    "amount_due": str(s.amount_due),
+                }
+                for s in dashboard.sales
+            ),
+            _SALES_COLUMNS,
+            fmt="table",
+            title="Contrats par commercial",
+            unit="commercial(aux)",
+            empty_message="Aucun commercial actif.",
+            target=console,
+        )
+        render_rows(
+            (
+                {
+                    "employee_id": str(s.employee_id),
+                    "full_name": s.full_name,
+                    "events": str(s.events),
+                    "upcoming": str(s.upcoming),
+                }
+                for s in dashboard.supports
+            ),
+            _SUPPORT_COLUMNS,
+            fmt="table",
+            title="Événements par support",
+            unit="support(s)",
+            empty_message="Aucun support actif.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors du calcul du tableau de bord : {exc}")
+    finally:
+        session.close()
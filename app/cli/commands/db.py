@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+
+import sentry_sdk
+
+from app.cli.console import console, error, forbidden, success, warning
+from app.cli.output import Column, output_format, render_rows
+from app.db.session import get_session
+from app.services.consistency_service import (
+    DEFAULT_FIX_BATCH_SIZE,
+    CheckReport,
+    PermissionDeniedError,
+    ValidationError,
+    check_consistency,
+)
+from app.services.current_employee import NotAuthenticatedError, get_current_employee
+from app.services.rls_service import PermissionDeniedError as RlsPermissionDeniedError
+from app.services.rls_service import ValidationError as RlsValidationError
+from app.services.rls_service import set_rls_mode
+
+_COLUMNS = (
+    Column("name", "Contrôle", no_wrap=True),
+    Column("label", "Description"),
+    Column("count", "Anomalies", justify="right", no_wrap=True),
+    Column("samples", "Exemples (id)"),
+    Column("fixed", "Corrigées", justify="right", no_wrap=True),
+)
+
+
+def _report_row(report: CheckReport) -> dict[str, str]:
+    """Valeurs affichables d'un contrôle, par clé de colonne."""
+    samples = ", ".join(str(i) for i in report.samples)
+    if report.count > len(report.samples):
+        samples += ", …"
+    return {
+        "name": report.name,
+        "label": report.label,
+        "count": str(report.count),
+        "samples": samples or "—",
+        "fixed": str(report.fixed) if report.fixable else "—",
+    }
+
+
+def cmd_db_check_consistency(args: argparse.Namespace) -> None:
+    """Contrôle (et corrige avec --fix) la cohérence entre tables — MANAGEMENT."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        fix = getattr(args, "fix", False)
+        reports = check_consistency(
+            session,
+            employee,
+            fix=fix,
+            batch_size=getattr(args, "batch_size", None) or DEFAULT_FIX_BATCH_SIZE,
+        )
+
+        fmt = output_format(args)
+        render_rows(
+            (_report_row(r) for r in reports),
+            _COLUMNS,
+            fmt=fmt,
+            title="Cohérence de la base",
+            unit="contrôle(s)",
+            empty_message="Aucun contrôle.",
+            target=console,
+        )
+
+        if fmt == "table":
+            remaining = sum(r.count - r.fixed for r in reports)
+            if not remaining:
+                success("Aucune anomalie restante.")
+            else:
+                hint = "" if fix else " (--fix corrige les contrôles corrigibles)"
+                warning(f"{remaining} anomalie(s) restante(s){hint}.")
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        session.rollback()
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors du contrôle de cohérence : {exc}")
+    finally:
+        session.close()
+
+
+def cmd_db_rls(args: argparse.Namespace) -> None:
+    """Pose (enable) ou retire (disable) les policies du mode RLS — MANAGEMENT."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        enabled = args.mode == "enable"
+        set_rls_mode(session, employee, enabled=enabled)
+
+        if enabled:
+            success("Policies RLS posées : activer le filtrage avec EPICCRM_RLS=true.")
+        else:
+            success("Policies RLS retirées.")
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except RlsPermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except RlsValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        session.rollback()
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la configuration RLS : {exc}")
+    finally:
+        session.close()
@@ -3,20 +3,31 @@ from __future__ import annotations
 import argparse
 
 import sentry_sdk
-from rich.table import Table
 
-from app.cli.console import console, error, forbidden, info, success, warning
+from app.cli.click_utils import count_mode, page_size, stream_mode
+from app.cli.console import (
+    console,
+    error,
+    forbidden,
+    print_count,
+    success,
+    warning,
+)
+from app.cli.output import Column, output_format, render_rows
 from app.core.authorization import AuthorizationError, require_role
 from app.core.security import hash_password
 from app.db.session import get_session
 from app.models.employee import Employee, Role
 from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.list_filters import InvalidSortError
 from app.services.current_employee import NotAuthenticatedError, get_current_employee
 from app.services.employee_service import (
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
+    available_employees,
     deactivate_employee,
+    employee_workload,
     hard_delete_employee,
     reactivate_employee,
 )
@@ -43,13 +54,12 @@ def cmd_create_employee(args: argparse.Namespace) -> None:
         new_employee = Employee(
             first_name=args.first_name,
             last_name=args.last_name,
-            email=args.email,
+            email=args.email.strip().lower(),
             role=Role[args.role],
             password_hash=hash_password(args.password),
         )
         session.add(new_employee)
         session.commit()
-        session.refresh(new_employee)
 
         success(
             f"Employé créé : {new_employee.first_name} {new_employee.last_name} "
@@ -70,6 +80,35 @@ def cmd_create_employee(args: argparse.Namespace) -> None:
         session.close()
 
 
+_COLUMNS = (
+    Column("employee_id", "ID", justify="right", no_wrap=True),
+    Column("full_name", "Nom"),
+    Column("email", "Email"),
+    Column("role", "Rôle", no_wrap=True),
+    Column("status", "Statut", justify="center", no_wrap=True),
+)
+
+_MANAGEMENT_COLUMNS = (
+    Column("created_at", "Créé le", no_wrap=True),
+    Column("deactivated_at", "Désactivé le", no_wrap=True),
+    Column("reactivated_at", "Réactivé le", no_wrap=True),
+)
+
+
+def _employee_row(e: Employee) -> dict[str, str]:
+    """Valeurs affichables d'un employé, par clé de colonne."""
+    return {
+        "employee_id": str(e.id),
+        "full_name": f"{e.first_name} {e.last_name}",
+        "email": e.email,
+        "role": e.role.value,
+        "status": "✅ Actif" if e.is_active else "⛔ Désactivé",
+        "created_at": _fmt_dt(e.created_at),
+        "deactivated_at": _fmt_dt(e.deactivated_at) if not e.is_active else "—",
+        "reactivated_at": _fmt_dt(e.reactivated_at),
+    }
+
+
 def cmd_employees_list(args: argparse.Namespace) -> None:
     """Liste les employés (avec filtre optionnel par rôle)."""
     session = get_session()
@@ -78,53 +117,43 @@ def cmd_employees_list(args: argparse.Namespace) -> None:
         is_management = current_employee.role == Role.MANAGEMENT
 
         repo = EmployeeRepository(session)
-        employees = repo.list_by_role(Role[args.role]) if args.role else repo.list_all()
 
-        if not employees:
-            info("Aucun employé trouvé.")
+        counting, approx = count_mode(args)
+        if counting:
+            role = Role[args.role] if args.role else None
+            total = repo.count(role, approx=approx)
+            print_count(total, "employé(s)", approx=approx)
             return
 
-        table = Table(title="Employés")
-
-        table.add_column("ID", justify="right", no_wrap=True)
-        table.add_column("Nom")
-        table.add_column("Email")
-        table.add_column("Rôle", no_wrap=True)
-        table.add_column("Statut", justify="center", no_wrap=True)
+        sort = getattr(args, "sort", None)
+        if stream_mode(args):
+            role = Role[args.role] if args.role else None
+            employees = repo.iter_all(role, sort=sort, page_size=page_size(args))
+        else:
+            employees = (
+                repo.list_by_role(Role[args.role], sort=sort)
+                if args.role
+                else repo.list_all(sort=sort)
+            )
 
         # Colonnes sensibles : uniquement MANAGEMENT
-        if is_management:
-            table.add_column("Créé le", no_wrap=True)
-            table.add_column("Désactivé le", no_wrap=True)
-            table.add_column("Réactivé le", no_wrap=True)
-
-        for e in employees:
-            status = "✅ Actif" if e.is_active else "⛔ Désactivé"
-
-            base_row = [
-                str(e.id),
-                f"{e.first_name} {e.last_name}",
-                e.email,
-                e.role.value,
-                status,
-            ]
-
-            if is_management:
-                base_row.extend(
-                    [
-                        _fmt_dt(e.created_at),
-                        _fmt_dt(e.deactivated_at) if not e.is_active else "—",
-                        _fmt_dt(e.reactivated_at),
-                    ]
-                )
-
-            table.add_row(*base_row)
-
-        table.caption = f"{len(employees)} employé(s)"
-        console.print(table)
+        columns = _COLUMNS + (_MANAGEMENT_COLUMNS if is_management else ())
+
+        render_rows(
+            (_employee_row(e) for e in employees),
+            columns,
+            fmt=output_format(args),
+            title="Employés",
+            unit="employé(s)",
+            empty_message="Aucun employé trouvé.",
+            target=console,
+            pager=getattr(args, "pager", False),
+        )
 
     except NotAuthenticatedError as exc:
         error(str(exc))
+    except InvalidSortError as exc:
+        error(f"Données invalides : {exc}")
     except Exception as exc:
         sentry_sdk.capture_exception(exc)
         error(f"Erreur lors de la récupération des employés : {exc}")
@@ -132,6 +161,108 @@ def cmd_employees_list(args: argparse.Namespace) -> None:
         session.close()
 
 
+_AVAILABLE_COLUMNS = (
+    Column("employee_id", "ID", justify="right", no_wrap=True),
+    Column("full_name", "Nom"),
+    Column("email", "Email"),
+    Column("role", "Rôle", no_wrap=True),
+    Column("workload", "Événements à venir", justify="right", no_wrap=True),
+)
+
+
+def cmd_employees_available(args: argparse.Namespace) -> None:
+    """Liste les employés libres sur une période, les moins chargés d'abord."""
+    session = get_session()
+    try:
+        current_employee = get_current_employee(session)
+
+        available = available_employees(
+            session=session,
+            current_employee=current_employee,
+            period_start=args.period_start,
+            period_end=args.period_end,
+            role=Role[getattr(args, "role", None) or Role.SUPPORT.name],
+        )
+
+        render_rows(
+            (
+                {**_employee_row(e), "workload": str(workload)}
+                for e, workload in available
+            ),
+            _AVAILABLE_COLUMNS,
+            fmt=output_format(args),
+            title=(
+                f"Disponibles du {_fmt_dt(args.period_start)} "
+                f"au {_fmt_dt(args.period_end)}"
+            ),
+            unit="employé(s)",
+            empty_message="Aucun employé disponible sur cette période.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la recherche d'employés disponibles : {exc}")
+    finally:
+        session.close()
+
+
+_FIELD_COLUMNS = (
+    Column("label", "Champ"),
+    Column("value", "Valeur"),
+)
+
+
+def cmd_employees_show(args: argparse.Namespace) -> None:
+    """Affiche un employé et son portefeuille (clients, contrats, événements)."""
+    session = get_session()
+    try:
+        current_employee = get_current_employee(session)
+        employee, load = employee_workload(
+            session, current_employee, employee_id=args.employee_id
+        )
+
+        fields = [
+            ("Nom", f"{employee.first_name} {employee.last_name}"),
+            ("Email", employee.email),
+            ("Rôle", employee.role.name),
+            ("Statut", "actif" if employee.is_active else "désactivé"),
+            ("Clients suivis", str(load.clients)),
+            ("Contrats", str(load.contracts)),
+            ("… dont signés", str(load.signed_contracts)),
+            ("… dont impayés", str(load.unpaid_contracts)),
+            ("Montant total des contrats", str(load.total_amount)),
+            ("Restant dû", str(load.amount_due)),
+            ("Événements à venir / en cours", str(load.upcoming_events)),
+            ("Événements passés", str(load.past_events)),
+        ]
+        render_rows(
+            ({"label": label, "value": value} for label, value in fields),
+            _FIELD_COLUMNS,
+            fmt=output_format(args),
+            title=f"Employé #{employee.id}",
+            unit="champ(s)",
+            empty_message="Aucun champ.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except NotFoundError as exc:
+        error(str(exc))
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de l'affichage de l'employé : {exc}")
+    finally:
+        session.close()
+
+
 def cmd_employees_deactivate(args: argparse.Namespace) -> None:
     """Désactive un employé (soft delete) — réservé MANAGEMENT."""
     session = get_session()
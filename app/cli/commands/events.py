@@ -1,21 +1,43 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
 import sentry_sdk
-from rich.table import Table
 
-from app.cli.console import console, error, forbidden, info, success, warning
+from app.cli.click_utils import (
+    count_mode,
+    list_filters_from_args,
+    page_size,
+    stream_mode,
+)
+from app.cli.console import (
+    console,
+    error,
+    forbidden,
+    info,
+    print_count,
+    success,
+    warning,
+)
+from app.cli.output import Column, output_format, render_rows
 from app.db.session import get_session
 from app.services.current_employee import NotAuthenticatedError, get_current_employee
 from app.services.event_service import (
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
+    auto_assign_events,
+    calendar_events,
+    claim_events,
+    count_events,
     create_event,
+    iter_events,
     list_events,
     reassign_event,
+    search_events,
     unassign_event_support,
     update_event,
 )
@@ -85,85 +107,109 @@ _VIEWS = {
 }
 
 
+def _event_row(ev: Any) -> dict[str, str]:
+    """Valeurs affichables d'un événement, par clé de colonne."""
+    client = getattr(ev, "client", None)
+    support = getattr(ev, "support_contact", None)
+
+    client_name = "N/A"
+    client_contact = "N/A"
+    if client:
+        first = getattr(client, "first_name", "") or ""
+        last = getattr(client, "last_name", "") or ""
+        client_name = f"{first} {last}".strip() or "N/A"
+
+        email = getattr(client, "email", None) or "N/A"
+        phone = getattr(client, "phone", None) or "N/A"
+        # ✅ contact sur 2 lignes, lisible sans réglages Rich
+        client_contact = f"{email}\n{phone}"
+
+    support_name = "N/A"
+    if support:
+        sf = getattr(support, "first_name", "") or ""
+        sl = getattr(support, "last_name", "") or ""
+        support_name = f"{sf} {sl}".strip() or "N/A"
+
+    notes = (getattr(ev, "notes", None) or "").strip() or "N/A"
+
+    return {
+        "event_id": str(getattr(ev, "id", "N/A")),
+        "contract_id": str(getattr(ev, "contract_id", "N/A")),
+        "client_name": client_name,
+        "client_contact": client_contact,
+        "start": _fmt_event_dt(getattr(ev, "start_date", None)),
+        "end": _fmt_event_dt(getattr(ev, "end_date", None)),
+        "support_name": support_name,
+        "location": getattr(ev, "location", None) or "N/A",
+        "attendees": (
+            str(getattr(ev, "attendees", "N/A"))
+            if getattr(ev, "attendees", None) is not None
+            else "N/A"
+        ),
+        "notes": notes,
+        "created_at": _fmt_datetime(getattr(ev, "created_at", None)),
+        "updated_at": _fmt_datetime(getattr(ev, "updated_at", None)),
+    }
+
+
 def cmd_events_list(args: argparse.Namespace) -> None:
     """Liste les événements accessibles à l'utilisateur courant."""
     session = get_session()
     try:
         employee = get_current_employee(session)
-        events = list_events(
-            session=session,
-            current_employee=employee,
-            without_support=getattr(args, "without_support", False),
-            assigned_to_me=getattr(args, "assigned_to_me", False),
-        )
 
-        if not events:
-            info("Aucun événement trouvé.")
+        criteria = {
+            "without_support": getattr(args, "without_support", False),
+            "assigned_to_me": getattr(args, "assigned_to_me", False),
+            "scope": getattr(args, "scope", None),
+            "filters": list_filters_from_args(args),
+        }
+
+        counting, approx = count_mode(args)
+        if counting:
+            total = count_events(
+                session=session, current_employee=employee, approx=approx, **criteria
+            )
+            print_count(total, "événement(s)", approx=approx)
             return
 
+        if stream_mode(args):
+            events = iter_events(
+                session=session,
+                current_employee=employee,
+                page_size=page_size(args),
+                **criteria,
+            )
+        else:
+            events = list_events(session=session, current_employee=employee, **criteria)
+
         view = (getattr(args, "view", None) or "compact").lower()
-        columns = _VIEWS.get(view, _VIEWS["compact"])
-
-        table = Table(title=f"Événements ({view})")
-
-        # Ajout dynamique des colonnes
-        for col in columns:
-            label = _COLUMNS[col]
-            if col in {"event_id", "contract_id", "attendees"}:
-                table.add_column(label, justify="right", no_wrap=True)
-            else:
-                table.add_column(label)
-
-        for ev in events:
-            client = getattr(ev, "client", None)
-            support = getattr(ev, "support_contact", None)
-
-            client_name = "N/A"
-            client_contact = "N/A"
-            if client:
-                first = getattr(client, "first_name", "") or ""
-                last = getattr(client, "last_name", "") or ""
-                client_name = f"{first} {last}".strip() or "N/A"
-
-                email = getattr(client, "email", None) or "N/A"
-                phone = getattr(client, "phone", None) or "N/A"
-                # ✅ contact sur 2 lignes, lisible sans réglages Rich
-                client_contact = f"{email}\n{phone}"
-
-            support_name = "N/A"
-            if support:
-                sf = getattr(support, "first_name", "") or ""
-                sl = getattr(support, "last_name", "") or ""
-                support_name = f"{sf} {sl}".strip() or "N/A"
-
-            notes = (getattr(ev, "notes", None) or "").strip() or "N/A"
-
-            row_map = {
-                "event_id": str(getattr(ev, "id", "N/A")),
-                "contract_id": str(getattr(ev, "contract_id", "N/A")),
-                "client_name": client_name,
-                "client_contact": client_contact,
-                "start": _fmt_event_dt(getattr(ev, "start_date", None)),
-                "end": _fmt_event_dt(getattr(ev, "end_date", None)),
-                "support_name": support_name,
-                "location": getattr(ev, "location", None) or "N/A",
-                "attendees": (
-                    str(getattr(ev, "attendees", "N/A"))
-                    if getattr(ev, "attendees", None) is not None
-                    else "N/A"
-                ),
-                "notes": notes,
-                "created_at": _fmt_datetime(getattr(ev, "created_at", None)),
-                "updated_at": _fmt_datetime(getattr(ev, "updated_at", None)),
-            }
-
-            table.add_row(*[row_map[c] for c in columns])
-
-        table.caption = f"{len(events)} événement(s)"
-        console.print(table)
+        numeric = {"event_id", "contract_id", "attendees"}
+        columns = [
+            Column(
+                key,
+                _COLUMNS[key],
+                justify="right" if key in numeric else "left",
+                no_wrap=key in numeric,
+            )
+            for key in _VIEWS.get(view, _VIEWS["compact"])
+        ]
+
+        render_rows(
+            (_event_row(ev) for ev in events),
+            columns,
+            fmt=output_format(args),
+            title=f"Événements ({view})",
+            unit="événement(s)",
+            empty_message="Aucun événement trouvé.",
+            target=console,
+            pager=getattr(args, "pager", False),
+        )
 
     except NotAuthenticatedError as exc:
         error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
     except Exception as exc:
         sentry_sdk.capture_exception(exc)
         error(f"Erreur lors de la récupération des événements : {exc}")
@@ -171,6 +217,124 @@ def cmd_events_list(args: argparse.Namespace) -> None:
         session.close()
 
 
+_SEARCH_COLUMNS = (
+    Column("event_id", "ID Event", justify="right", no_wrap=True),
+    Column("client_name", "Client"),
+    Column("start", "Début", no_wrap=True),
+    Column("support_name", "Support"),
+    Column("snippet", "Extrait"),
+    Column("score", "Pertinence", justify="right", no_wrap=True),
+)
+
+
+def cmd_events_search(args: argparse.Namespace) -> None:
+    """Recherche plein texte dans le lieu et les notes des événements."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        page = getattr(args, "page", 1) or 1
+        results = search_events(
+            session=session,
+            current_employee=employee,
+            query=args.query,
+            scope=getattr(args, "scope", None),
+            limit=getattr(args, "limit", 20) or 20,
+            page=page,
+        )
+
+        render_rows(
+            (
+                {**_event_row(ev), "snippet": snippet, "score": f"{score:.3f}"}
+                for ev, score, snippet in results
+            ),
+            _SEARCH_COLUMNS,
+            fmt=output_format(args),
+            title=f"Recherche « {args.query} » (page {page})",
+            unit="résultat(s)",
+            empty_message="Aucun événement ne correspond à la recherche.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la recherche d'événements : {exc}")
+    finally:
+        session.close()
+
+
+_CALENDAR_COLUMNS = (
+    Column("bucket", "Case", no_wrap=True),
+    Column("event_id", "ID Event", justify="right", no_wrap=True),
+    Column("start", "Début", no_wrap=True),
+    Column("end", "Fin", no_wrap=True),
+    Column("client_name", "Client"),
+    Column("location", "Lieu"),
+    Column("support_name", "Support"),
+)
+
+_WEEKDAYS = ("lun.", "mar.", "mer.", "jeu.", "ven.", "sam.", "dim.")
+
+
+def _fmt_bucket(bucket: datetime, unit: str) -> str:
+    """Libellé d'une case de calendrier (jour ou semaine ISO)."""
+    if unit == "week":
+        year, week, _ = bucket.isocalendar()
+        return f"S{week:02d} {year} (lun. {bucket:%d/%m})"
+    return f"{_WEEKDAYS[bucket.weekday()]} {bucket:%d/%m/%y}"
+
+
+def cmd_events_calendar(args: argparse.Namespace) -> None:
+    """Affiche les événements d'une période, regroupés par jour ou par semaine."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        unit = (getattr(args, "by", None) or "day").lower()
+
+        buckets = calendar_events(
+            session=session,
+            current_employee=employee,
+            period_start=getattr(args, "period_start", None),
+            period_end=getattr(args, "period_end", None),
+            unit=unit,
+            assigned_to_me=getattr(args, "assigned_to_me", False),
+            scope=getattr(args, "scope", None),
+        )
+
+        fmt = output_format(args)
+
+        def rows() -> Iterator[dict[str, str]]:
+            for bucket, events in buckets:
+                label = f"{_fmt_bucket(bucket, unit)} · {len(events)}"
+                for index, ev in enumerate(events):
+                    # En table, le libellé de la case n'apparaît qu'une fois
+                    shown = label if index == 0 or fmt != "table" else ""
+                    yield {**_event_row(ev), "bucket": shown}
+
+        render_rows(
+            rows(),
+            _CALENDAR_COLUMNS,
+            fmt=fmt,
+            title="Calendrier (" + ("semaines" if unit == "week" else "jours") + ")",
+            unit="événement(s)",
+            empty_message="Aucun événement sur la période.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la récupération du calendrier : {exc}")
+    finally:
+        session.close()
+
+
 def cmd_events_create(args: argparse.Namespace) -> None:
     """Crée un événement."""
     session = get_session()
@@ -328,3 +492,114 @@ def cmd_events_reassign(args: argparse.Namespace) -> None:
         error(f"Erreur lors de la réassignation de l'événement : {exc}")
     finally:
         session.close()
+
+
+_AUTO_ASSIGN_COLUMNS = (
+    Column("event_id", "ID Event", justify="right", no_wrap=True),
+    Column("start", "Début", no_wrap=True),
+    Column("end", "Fin", no_wrap=True),
+    Column("client_name", "Client"),
+    Column("location", "Lieu"),
+    Column("support_name", "Support"),
+)
+
+
+def cmd_events_auto_assign(args: argparse.Namespace) -> None:
+    """Assigne automatiquement un support aux événements sans support."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        dry_run = getattr(args, "dry_run", False)
+
+        plan = auto_assign_events(
+            session=session,
+            current_employee=employee,
+            period_start=getattr(args, "period_start", None),
+            period_end=getattr(args, "period_end", None),
+            dry_run=dry_run,
+        )
+
+        def rows() -> Iterator[dict[str, str]]:
+            for ev, support in plan:
+                row = _event_row(ev)
+                row["support_name"] = (
+                    f"{support.first_name} {support.last_name} (id={support.id})"
+                    if support is not None
+                    else "— aucun support libre"
+                )
+                yield row
+
+        render_rows(
+            rows(),
+            _AUTO_ASSIGN_COLUMNS,
+            fmt=output_format(args),
+            title="Assignation automatique" + (" (simulation)" if dry_run else ""),
+            unit="événement(s)",
+            empty_message="Aucun événement sans support sur la période.",
+            target=console,
+        )
+        if not plan:
+            return
+
+        assigned = sum(1 for _, support in plan if support is not None)
+        if dry_run:
+            info(f"Simulation : {assigned} événement(s) seraient assignés.")
+        else:
+            success(f"{assigned} événement(s) assigné(s).")
+        unassigned = len(plan) - assigned
+        if unassigned:
+            warning(f"{unassigned} événement(s) sans support libre sur leur créneau.")
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(str(exc))
+    except ValidationError as exc:
+        warning(str(exc))
+    except Exception as exc:
+        session.rollback()
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de l'assignation automatique : {exc}")
+    finally:
+        session.close()
+
+
+def cmd_events_claim(args: argparse.Namespace) -> None:
+    """Prend en charge les prochains événements sans support (SUPPORT)."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+
+        claimed = claim_events(
+            session=session,
+            current_employee=employee,
+            count=getattr(args, "count", 1) or 1,
+        )
+
+        render_rows(
+            (_event_row(ev) for ev in claimed),
+            [
+                Column(key, _COLUMNS[key], no_wrap=key == "event_id")
+                for key in _VIEWS["compact"]
+            ],
+            fmt=output_format(args),
+            title="Événements pris en charge",
+            unit="événement(s)",
+            empty_message="Aucun événement disponible à prendre en charge.",
+            target=console,
+        )
+        if claimed:
+            success(f"{len(claimed)} événement(s) vous sont désormais assignés.")
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(str(exc))
+    except ValidationError as exc:
+        warning(str(exc))
+    except Exception as exc:
+        session.rollback()
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la prise en charge des événements : {exc}")
+    finally:
+        session.close()
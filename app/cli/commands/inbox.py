@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+from itertools import groupby
+
+import sentry_sdk
+
+from app.cli.console import console, error, info
+from app.cli.output import Column, output_format, render_rows
+from app.db.session import get_session
+from app.repositories.inbox_repository import (
+    INBOX_MY_EVENT,
+    INBOX_UNPAID_CONTRACT,
+    INBOX_UNSIGNED_CONTRACT,
+    INBOX_UNSTAFFED_EVENT,
+    LATER,
+    SOON,
+    URGENT,
+    InboxItem,
+)
+from app.services.current_employee import NotAuthenticatedError, get_current_employee
+from app.services.inbox_service import ValidationError, build_inbox
+
+_KIND_LABELS = {
+    INBOX_UNSIGNED_CONTRACT: "Contrat à faire signer",
+    INBOX_UNPAID_CONTRACT: "Paiement en attente",
+    INBOX_MY_EVENT: "Événement à préparer",
+    INBOX_UNSTAFFED_EVENT: "Événement sans support",
+}
+
+_URGENCY_LABELS = {
+    URGENT: "Urgent",
+    SOON: "Bientôt",
+    LATER: "Plus tard",
+}
+
+_COLUMNS = (
+    Column("urgency", "Urgence", no_wrap=True),
+    Column("kind", "À faire"),
+    Column("item_id", "ID", justify="right", no_wrap=True),
+    Column("client", "Client"),
+    Column("date", "Date", no_wrap=True),
+    Column("detail", "Détail"),
+)
+
+
+def _inbox_row(item: InboxItem) -> dict[str, str]:
+    """Valeurs affichables d'un élément de la file, par clé de colonne."""
+    if item.kind in (INBOX_MY_EVENT, INBOX_UNSTAFFED_EVENT):
+        detail = item.location or "—"
+    else:
+        detail = f"{item.amount} €"
+    return {
+        "urgency": _URGENCY_LABELS[item.urgency],
+        "kind": _KIND_LABELS[item.kind],
+        "item_id": str(item.item_id),
+        "client": item.client_name,
+        "date": item.date.strftime("%Y-%m-%d %H:%M"),
+        "detail": detail,
+    }
+
+
+def cmd_inbox(args: argparse.Namespace) -> None:
+    """Affiche la file de travail de l'utilisateur courant, groupée par urgence."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        items = build_inbox(session, employee, limit=getattr(args, "limit", None))
+
+        fmt = output_format(args)
+        if fmt != "table":
+            render_rows(
+                (_inbox_row(item) for item in items),
+                _COLUMNS,
+                fmt=fmt,
+                title="À faire",
+                unit="élément(s)",
+                empty_message="Rien à faire.",
+                target=console,
+            )
+            return
+
+        if not items:
+            info("Rien à faire.")
+            return
+
+        # Une table par niveau d'urgence (les éléments arrivent déjà triés)
+        for urgency, group in groupby(items, key=lambda item: item.urgency):
+            render_rows(
+                (_inbox_row(item) for item in group),
+                _COLUMNS[1:],
+                fmt="table",
+                title=_URGENCY_LABELS[urgency],
+                unit="élément(s)",
+                empty_message="Rien à faire.",
+                target=console,
+            )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors du calcul de la file de travail : {exc}")
+    finally:
+        session.close()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+
+import sentry_sdk
+
+from app.cli.click_utils import page_size
+from app.cli.console import console, error, forbidden, info, success, warning
+from app.cli.output import Column, output_format, render_rows
+from app.db.session import get_session
+from app.repositories.report_repository import AGING_BUCKETS, AgingRow
+from app.services.current_employee import NotAuthenticatedError, get_current_employee
+from app.services.report_service import (
+    PermissionDeniedError,
+    ValidationError,
+    aging_report,
+    financial_report,
+    refresh_reports,
+)
+
+
+def _bucket_header(low: int, high: int | None) -> str:
+    return f"{max(low - 1, 0)}+ j" if high is None else f"{low}–{high} j"
+
+
+# Colonnes de tranches : bucket_0_30, bucket_31_60, ..., bucket_91_plus
+_AGING_KEYS = tuple(
+    f"bucket_{low}_{'plus' if high is None else high}" for low, high in AGING_BUCKETS
+)
+
+
+def _aging_row(row: AgingRow) -> dict[str, str]:
+    data = {
+        "entity_id": str(row.entity_id),
+        "label": row.label,
+        "contracts": str(row.contracts),
+        "amount_due": str(row.amount_due),
+        "oldest_days": str(row.oldest_days),
+        "share": str(row.share),
+    }
+    data.update(zip(_AGING_KEYS, (str(amount) for amount in row.buckets)))
+    return data
+
+
+def _fmt_age(refreshed_at: datetime | None) -> str:
+    """Âge lisible d'un instantané ("il y a 3 h 05 min")."""
+    if refreshed_at is None:
+        return "jamais rafraîchi"
+    seconds = int((datetime.now(timezone.utc) - refreshed_at).total_seconds())
+    minutes = max(seconds, 0) // 60
+    if minutes < 1:
+        age = "moins d'une minute"
+    elif minutes < 60:
+        age = f"{minutes} min"
+    elif minutes < 24 * 60:
+        age = f"{minutes // 60} h {minutes % 60:02d} min"
+    else:
+        age = f"{minutes // (24 * 60)} j"
+    return f"{refreshed_at.astimezone():%d/%m/%Y %H:%M} (il y a {age})"
+
+
+def cmd_reports_refresh(args: argparse.Namespace) -> None:
+    """Rafraîchit les vues de reporting (MANAGEMENT)."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        refreshed_at = refresh_reports(
+            session, employee, concurrently=not getattr(args, "blocking", False)
+        )
+        stamp = f"{refreshed_at.astimezone():%d/%m/%Y %H:%M}"
+        success(f"Rapports rafraîchis : instantané du {stamp}.")
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except Exception as exc:
+        session.rollback()
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors du rafraîchissement des rapports : {exc}")
+    finally:
+        session.close()
+
+
+def cmd_reports_financial(args: argparse.Namespace) -> None:
+    """Affiche les totaux de contrats par client ou par commercial (instantané)."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        by = (getattr(args, "by", None) or "client").lower()
+        rows, refreshed_at = financial_report(session, employee, by=by)
+
+        fmt = output_format(args)
+        if fmt == "table":
+            # En flux (csv, json...), stdout ne contient que les données
+            info(f"Instantané : {_fmt_age(refreshed_at)}")
+            if refreshed_at is None:
+                warning("Lancez `epicevents reports refresh` pour calculer les totaux.")
+
+        render_rows(
+            (
+                {
+                    "entity_id": str(r.entity_id),
+                    "label": r.label,
+                    "contracts": str(r.contracts),
+                    "signed": str(r.signed_contracts),
+                    "unpaid": str(r.unpaid_contracts),
+                    "total_amount": str(r.total_amount),
+                    "amount_due": str(r.amount_due),
+                }
+                for r in rows
+            ),
+            (
+                Column("entity_id", "ID", justify="right", no_wrap=True),
+                Column("label", "Client" if by == "client" else "Commercial"),
+                Column("contracts", "Contrats", justify="right", no_wrap=True),
+                Column("signed", "Signés", justify="right", no_wrap=True),
+                Column("unpaid", "Impayés", justify="right", no_wrap=True),
+                Column("total_amount", "Montant total", justify="right", no_wrap=True),
+                Column("amount_due", "Restant dû", justify="right", no_wrap=True),
+            ),
+            fmt=fmt,
+            title="Synthèse financière par "
+            + ("client" if by == "client" else "commercial"),
+            unit="ligne(s)",
+            empty_message="Aucun contrat dans l'instantané.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors de la lecture des rapports : {exc}")
+    finally:
+        session.close()
+
+
+def cmd_reports_aging(args: argparse.Namespace) -> None:
+    """Balance âgée des impayés par client ou par commercial (MANAGEMENT)."""
+    session = get_session()
+    try:
+        employee = get_current_employee(session)
+        by = (getattr(args, "by", None) or "client").lower()
+        rows = aging_report(session, employee, by=by, page_size=page_size(args))
+
+        columns = [
+            Column("entity_id", "ID", justify="right", no_wrap=True),
+            Column("label", "Client" if by == "client" else "Commercial"),
+            Column("contracts", "Contrats", justify="right", no_wrap=True),
+        ]
+        columns += [
+            Column(key, _bucket_header(low, high), justify="right", no_wrap=True)
+            for key, (low, high) in zip(_AGING_KEYS, AGING_BUCKETS)
+        ]
+        columns += [
+            Column("amount_due", "Restant dû", justify="right", no_wrap=True),
+            Column("oldest_days", "Plus ancien (j)", justify="right", no_wrap=True),
+            Column("share", "Part (%)", justify="right", no_wrap=True),
+        ]
+
+        render_rows(
+            (_aging_row(r) for r in rows),
+            columns,
+            fmt=output_format(args),
+            title="Balance âgée des impayés par "
+            + ("client" if by == "client" else "commercial"),
+            unit="ligne(s)",
+            empty_message="Aucun contrat impayé.",
+            target=console,
+        )
+
+    except NotAuthenticatedError as exc:
+        error(str(exc))
+    except PermissionDeniedError as exc:
+        forbidden(f"Accès refusé : {exc}")
+    except ValidationError as exc:
+        error(f"Données invalides : {exc}")
+    except Exception as exc:
+        sentry_sdk.capture_exception(exc)
+        error(f"Erreur lors du calcul de la balance âgée : {exc}")
+    finally:
+        session.close()
@@ -23,3 +23,11 @@ def error(message: str) -> None:
 
 def forbidden(message: str) -> None:
     console.print(f"⛔ {message}", style="red")
+
+
+def print_count(total: int, label: str, *, approx: bool = False) -> None:
+    """Affiche le résultat d'un mode --count / --approx."""
+    if approx:
+        console.print(f"≈ {total} {label} (estimation)", style="cyan")
+    else:
+        console.print(f"{total} {label}", style="cyan")
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any, TextIO
+
+import click
+from rich.cells import cell_len, set_cell_size
+from rich.console import Console
+from rich.table import Table
+
+from app.cli.console import console, info
+
+FORMATS = ("table", "plain", "tsv", "csv", "json", "ndjson")
+
+# Mode --pager : largeurs calculées sur un échantillon, puis figées
+PAGER_SAMPLE_SIZE = 50
+PAGER_MAX_COLUMN_WIDTH = 40
+
+
+@dataclass(frozen=True)
+class Column:
+    """Colonne d'une liste : clé (json / ndjson) et en-tête affiché."""
+
+    key: str
+    header: str
+    justify: str = "left"
+    no_wrap: bool = False
+
+
+def resolve_format(fmt: str | None, stream: TextIO | None = None) -> str:
+    """
+    Retourne le format de sortie effectif.
+
+    Sans --format : table Rich dans un terminal, sinon sortie "plain" en flux
+    (pipe / redirection), sans mesure préalable des cellules.
+    """
+    if fmt:
+        return fmt.lower()
+    stream = stream or sys.stdout
+    isatty = getattr(stream, "isatty", None)
+    return "table" if isatty is not None and isatty() else "plain"
+
+
+def output_format(args: Any) -> str:
+    """Format demandé par la commande (table par défaut)."""
+    return (getattr(args, "format", None) or "table").lower()
+
+
+def render_rows(
+    rows: Iterable[dict[str, str]],
+    columns: Sequence[Column],
+    *,
+    fmt: str,
+    title: str,
+    unit: str,
+    empty_message: str,
+    show_lines: bool = False,
+    target: Console = console,
+    pager: bool = False,
+) -> None:
+    """
+    Affiche des lignes (dict clé -> texte) dans le format demandé.
+
+    Le format "table" construit une table Rich (titre, légende avec le total)
+    imprimée sur `target`, ou, avec `pager`, une table à largeurs fixes envoyée
+    au pager au fil de la lecture ; les autres formats écrivent chaque ligne
+    sur stdout dès qu'elle est produite.
+    """
+    if fmt == "table" and pager:
+        _render_paged_table(
+            rows, columns, title=title, unit=unit, empty_message=empty_message
+        )
+        return
+
+    if fmt == "table":
+        _render_table(
+            rows,
+            columns,
+            target=target,
+            title=title,
+            unit=unit,
+            empty_message=empty_message,
+            show_lines=show_lines,
+        )
+        return
+
+    writer = _WRITERS.get(fmt)
+    if writer is None:
+        raise ValueError(f"Format inconnu : {fmt!r} ({', '.join(FORMATS)}).")
+
+    out = sys.stdout
+    writer(out, rows, columns)
+    out.flush()
+
+
+def _render_table(
+    rows: Iterable[dict[str, str]],
+    columns: Sequence[Column],
+    *,
+    target: Console,
+    title: str,
+    unit: str,
+    empty_message: str,
+    show_lines: bool,
+) -> None:
+    table = Table(title=title, show_lines=show_lines)
+    for col in columns:
+        table.add_column(col.header, justify=col.justify, no_wrap=col.no_wrap)
+
+    count = 0
+    for row in rows:
+        table.add_row(*[row[col.key] for col in columns])
+        count += 1
+
+    if not count:
+        info(empty_message)
+        return
+
+    table.caption = f"{count} {unit}"
+    target.print(table)
+
+
+def _render_paged_table(
+    rows: Iterable[dict[str, str]],
+    columns: Sequence[Column],
+    *,
+    title: str,
+    unit: str,
+    empty_message: str,
+) -> None:
+    rows = iter(rows)
+    sample = list(islice(rows, PAGER_SAMPLE_SIZE))
+    if not sample:
+        info(empty_message)
+        return
+
+    # Largeurs figées d'après l'en-tête et l'échantillon : les lignes suivantes
+    # sont tronquées / complétées sans être re-mesurées.
+    widths = [
+        min(
+            max([cell_len(col.header)] + [cell_len(_flat(r[col.key])) for r in sample]),
+            PAGER_MAX_COLUMN_WIDTH,
+        )
+        for col in columns
+    ]
+
+    def lines() -> Iterator[str]:
+        yield f"{title}\n"
+        yield _fixed_line([col.header for col in columns], columns, widths)
+        yield "-+-".join("-" * width for width in widths) + "\n"
+
+        count = 0
+        for row in chain(sample, rows):
+            count += 1
+            yield _fixed_line([row[col.key] for col in columns], columns, widths)
+
+        yield f"\n{count} {unit}\n"
+
+    # Le générateur n'est consommé (et les pages suivantes chargées) qu'au
+    # rythme de la lecture dans le pager.
+    click.echo_via_pager(lines())
+
+
+def _fixed_line(
+    values: Sequence[str], columns: Sequence[Column], widths: Sequence[int]
+) -> str:
+    cells = []
+    for value, col, width in zip(values, columns, widths):
+        text = _flat(value)
+        if cell_len(text) > width:
+            text = set_cell_size(text, width - 1) + "…"
+        padding = width - cell_len(text)
+        if col.justify == "right":
+            text = " " * padding + text
+        elif col.justify == "center":
+            text = " " * (padding // 2) + text + " " * (padding - padding // 2)
+        else:
+            text = text + " " * padding
+        cells.append(text)
+    return " | ".join(cells).rstrip() + "\n"
+
+
+def _flat(value: str) -> str:
+    """Une cellule par ligne : les retours à la ligne deviennent des espaces."""
+    return " ".join(value.split("\n")).replace("\t", " ")
+
+
+def _write_plain(
+    out: TextIO, rows: Iterable[dict[str, str]], columns: Sequence[Column]
+) -> None:
+    out.write("  ".join(col.header for col in columns) + "\n")
+    for row in rows:
+        out.write("  ".join(_flat(row[col.key]) for col in columns) + "\n")
+
+
+def _write_tsv(
+    out: TextIO, rows: Iterable[dict[str, str]], columns: Sequence[Column]
+) -> None:
+    out.write("\t".join(col.key for col in columns) + "\n")
+    for row in rows:
+        out.write("\t".join(_flat(row[col.key]) for col in columns) + "\n")
+
+
+def _write_csv(
+    out: TextIO, rows: Iterable[dict[str, str]], columns: Sequence[Column]
+) -> None:
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow([col.key for col in columns])
+    for row in rows:
+        writer.writerow([row[col.key] for col in columns])
+
+
+def _write_json(
+    out: TextIO, rows: Iterable[dict[str, str]], columns: Sequence[Column]
+) -> None:
+    # Tableau JSON écrit élément par élément (pas de liste en mémoire)
+    out.write("[")
+    for index, row in enumerate(rows):
+        out.write(",\n" if index else "\n")
+        out.write(
+            json.dumps({col.key: row[col.key] for col in columns}, ensure_ascii=False)
+        )
+    out.write("\n]\n")
+
+
+def _write_ndjson(
+    out: TextIO, rows: Iterable[dict[str, str]], columns: Sequence[Column]
+) -> None:
+    for row in rows:
+        out.write(
+            json.dumps({col.key: row[col.key] for col in columns}, ensure_ascii=False)
+            + "\n"
+        )
+
+
+_WRITERS = {
+    "plain": _write_plain,
+    "tsv": _write_tsv,
+    "csv": _write_csv,
+    "json": _write_json,
+    "ndjson": _write_ndjson,
+}
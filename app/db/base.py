@@ -2,4 +2,6 @@ from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
-    pass
+    # Les valeurs générées côté serveur (id, défauts, triggers) sont récupérées
+    # via RETURNING dans l'INSERT/UPDATE lui-même, sans SELECT supplémentaire.
+    __mapper_args__ = {"eager_defaults": True}
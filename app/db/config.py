@@ -7,3 +7,9 @@ load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL manquant. Vérifie ton fichier .env")
+
+# Replica en lecture (optionnel) : listes, recherches, rapports et exports
+DATABASE_URL_REPLICA = os.getenv("DATABASE_URL_REPLICA") or None
+
+# Retard de réplication toléré (secondes) avant de relire sur la base principale
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("EPICCRM_REPLICA_MAX_LAG", "5"))
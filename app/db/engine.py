@@ -1,8 +1,9 @@
 from sqlalchemy import create_engine
 
-from app.db.config import DATABASE_URL
+from app.db.config import DATABASE_URL, DATABASE_URL_REPLICA
 
 _engine = None
+_replica_engine = None
 
 
 def get_engine():
@@ -19,3 +20,16 @@ def get_engine():
         )
 
     return _engine
+
+
+def get_replica_engine():
+    """Retourne l'engine du replica en lecture, ou None s'il n'est pas configuré."""
+    global _replica_engine
+
+    if _replica_engine is None and DATABASE_URL_REPLICA:
+        _replica_engine = create_engine(
+            DATABASE_URL_REPLICA,
+            pool_pre_ping=True,
+        )
+
+    return _replica_engine
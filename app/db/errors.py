@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+def constraint_name(exc: IntegrityError) -> str | None:
+    """Retourne le nom de la contrainte PostgreSQL violée (si disponible)."""
+    diag = getattr(exc.orig, "diag", None)
+    return getattr(diag, "constraint_name", None)
+
+
+@contextmanager
+def translate_check_violations(
+    session: Session, messages: Mapping[str, str], *, error: type[Exception]
+) -> Iterator[None]:
+    """
+    Traduit les violations de contraintes nommées (CHECK / EXCLUDE) en `error`.
+
+    La transaction est annulée ; une contrainte absente de `messages` laisse
+    remonter l'IntegrityError d'origine.
+    """
+    try:
+        yield
+    except IntegrityError as exc:
+        session.rollback()
+        message = messages.get(constraint_name(exc) or "")
+        if message is None:
+            raise
+        raise error(message) from exc
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from sqlalchemy import Select, Table, text
+from sqlalchemy.orm import Session
+
+
+def table_reltuples(session: Session, table: Table) -> int | None:
+    """
+    Retourne le nombre de lignes estimé d'une table (pg_class.reltuples).
+
+    None si la table n'a jamais été analysée (reltuples = -1) : la statistique
+    n'est alors pas exploitable.
+    """
+    value = session.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table.name},
+    )
+    if value is None or value < 0:
+        return None
+    return int(value)
+
+
+def planner_rows(session: Session, stmt: Select) -> int:
+    """Retourne l'estimation du planificateur (EXPLAIN, sans exécuter la requête)."""
+    connection = session.connection()
+    compiled = stmt.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_count(session: Session, stmt: Select, table: Table) -> int:
+    """
+    Estimation instantanée du nombre de lignes de `stmt` (mode --approx).
+
+    Sans filtre, pg_class.reltuples suffit ; sinon on s'appuie sur EXPLAIN,
+    qui applique les statistiques de colonnes aux critères du WHERE.
+    """
+    if stmt.whereclause is None:
+        estimate = table_reltuples(session, table)
+        if estimate is not None:
+            return estimate
+    return planner_rows(session, stmt)
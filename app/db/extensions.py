@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+# Extensions installées, par moteur : une extension n'est posée que par
+# migration, le catalogue n'est donc interrogé qu'une fois par processus.
+_installed: WeakKeyDictionary[Engine, dict[str, bool]] = WeakKeyDictionary()
+
+
+def extension_installed(session: Session, name: str) -> bool:
+    """Indique si une extension PostgreSQL est installée dans la base courante."""
+    cache = _installed.setdefault(session.get_bind().engine, {})
+    if name not in cache:
+        stmt = text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = :name)")
+        cache[name] = bool(session.scalar(stmt, {"name": name}))
+    return cache[name]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Integer, MetaData, Numeric, column, event, table
+
+FINANCIAL_SUMMARY_VIEW = "contract_financial_summary"
+
+# Une ligne par (client, commercial du contrat) : les rapports par client ou
+# par commercial agrègent ces lignes, bien moins nombreuses que les contrats.
+FINANCIAL_SUMMARY_SQL = """
+    SELECT client_id,
+           sales_contact_id,
+           count(*) AS contracts,
+           count(*) FILTER (WHERE is_signed) AS signed_contracts,
+           count(*) FILTER (WHERE amount_due > 0) AS unpaid_contracts,
+           sum(total_amount) AS total_amount,
+           sum(amount_due) AS amount_due
+    FROM contracts
+    GROUP BY client_id, sales_contact_id
+"""
+
+# Vue matérialisée interrogée comme une table (hors metadata : non créée en table)
+financial_summary = table(
+    FINANCIAL_SUMMARY_VIEW,
+    column("client_id", Integer),
+    column("sales_contact_id", Integer),
+    column("contracts", Integer),
+    column("signed_contracts", Integer),
+    column("unpaid_contracts", Integer),
+    column("total_amount", Numeric(12, 2)),
+    column("amount_due", Numeric(12, 2)),
+)
+
+
+def register_financial_summary_view(metadata: MetaData) -> None:
+    """
+    Crée / supprime la vue matérialisée avec le schéma (create_all / drop_all).
+
+    En production elle est créée par la migration Alembic correspondante.
+    L'index unique est requis par REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    """
+    event.listen(
+        metadata,
+        "after_create",
+        DDL(
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {FINANCIAL_SUMMARY_VIEW} AS "
+            f"{FINANCIAL_SUMMARY_SQL}"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        metadata,
+        "after_create",
+        DDL(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{FINANCIAL_SUMMARY_VIEW} "
+            f"ON {FINANCIAL_SUMMARY_VIEW} (client_id, sales_contact_id)"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        metadata,
+        "before_drop",
+        DDL(f"DROP MATERIALIZED VIEW IF EXISTS {FINANCIAL_SUMMARY_VIEW}").execute_if(
+            dialect="postgresql"
+        ),
+    )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Clé de session.info : portée RLS positionnée dans la transaction courante
+RLS_SCOPE = "epiccrm_rls_scope"
+
+# Table -> colonne propriétaire filtrée en portée "mine"
+SCOPED_TABLES = {
+    "clients": "sales_contact_id",
+    "contracts": "sales_contact_id",
+    "events": "support_contact_id",
+}
+
+# Tables lisibles pendant une lecture en portée (jointures des listes)
+SCOPE_READ_TABLES = ("employees", "clients", "contracts", "events")
+
+
+def scope_role(table: str) -> str:
+    """Rôle PostgreSQL endossé pour lire `table` en portée "mine"."""
+    return f"epiccrm_scope_{table}"
+
+
+SCOPE_ROLES = tuple(scope_role(table) for table in SCOPED_TABLES)
+
+
+def rls_enabled() -> bool:
+    """Indique si le filtrage par row-level security PostgreSQL est activé."""
+    # Lu dynamiquement pour respecter les changements d'env
+    raw = os.getenv("EPICCRM_RLS", "")
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def set_rls_scope(session: Session, *, table: str, employee_id: int) -> None:
+    """
+    Endosse le rôle de portée de `table` pour la transaction courante.
+
+    Équivalent de `SET LOCAL ROLE epiccrm_scope_<table>` et `SET LOCAL
+    epiccrm.employee_id = ...` (set_config(..., true) accepte des paramètres
+    liés). Seule la policy de `table` filtre ; elle est effacée avant toute
+    écriture de la session (clear_rls_scope).
+    """
+    session.execute(
+        text(
+            "SELECT set_config('role', :role, true), "
+            "set_config('epiccrm.employee_id', :employee_id, true)"
+        ),
+        {"role": scope_role(table), "employee_id": str(employee_id)},
+    )
+    session.info[RLS_SCOPE] = table
+
+
+def clear_rls_scope(session: Session) -> None:
+    """Rend le rôle de connexion (sans effet si aucune portée n'est posée)."""
+    if session.info.pop(RLS_SCOPE, None) is None:
+        return
+    session.execute(
+        text(
+            "SELECT set_config('role', 'none', true), "
+            "set_config('epiccrm.employee_id', '', true)"
+        )
+    )
+
+
+# Les écritures se font toujours sous le rôle de connexion : PostgreSQL
+# appliquerait sinon la policy de lecture aux lignes lues par un UPDATE /
+# DELETE (WHERE, RETURNING), et les rôles de portée n'ont que SELECT.
+@event.listens_for(Session, "do_orm_execute")
+def _clear_scope_before_write(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        clear_rls_scope(state.session)
+
+
+@event.listens_for(Session, "before_flush")
+def _clear_scope_before_flush(session: Session, *_args: Any) -> None:
+    clear_rls_scope(session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _forget_scope(session: Session) -> None:
+    # set_config(..., true) expire avec la transaction
+    session.info.pop(RLS_SCOPE, None)
+
+
+# Écritures permises à tout rôle soumis à la RLS (elles n'ont pas de portée)
+_WRITE_POLICIES = (
+    ("INSERT", "WITH CHECK (true)"),
+    ("UPDATE", "USING (true) WITH CHECK (true)"),
+    ("DELETE", "USING (true)"),
+)
+
+
+def enable_rls_statements() -> list[str]:
+    """
+    DDL du mode RLS (exécuté par `db rls enable`, propriétaire des tables).
+
+    Les rôles de portée (SCOPE_ROLES) sont créés au préalable par un
+    administrateur. La RLS n'est pas forcée : le propriétaire des tables (le
+    compte applicatif) n'y est pas soumis, les lectures hors portée ne
+    paient donc aucun filtre. Sous le rôle de portée d'une table, seule sa
+    policy `<table>_scope` (`<propriétaire> = epiccrm.employee_id`, sans OR)
+    s'applique, et le planificateur la résout par l'index de la clé étrangère.
+    Les autres policies sont vraies (réduites à la compilation) : tables
+    jointes lisibles, écritures d'un éventuel rôle non propriétaire permises.
+    """
+    roles = ", ".join(SCOPE_ROLES)
+    statements = [f"GRANT SELECT ON {', '.join(SCOPE_READ_TABLES)} TO {roles}"]
+    for table, column in SCOPED_TABLES.items():
+        others = ", ".join(role for role in SCOPE_ROLES if role != scope_role(table))
+        statements += [
+            f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY",
+            f"CREATE POLICY {table}_scope ON {table} FOR SELECT "
+            f"TO {scope_role(table)} USING ({column} = "
+            "current_setting('epiccrm.employee_id')::integer)",
+            f"CREATE POLICY {table}_read ON {table} FOR SELECT "
+            f"TO {others} USING (true)",
+        ]
+        statements += [
+            f"CREATE POLICY {table}_{command.lower()} ON {table} FOR {command} "
+            f"TO PUBLIC {clause}"
+            for command, clause in _WRITE_POLICIES
+        ]
+    return statements
+
+
+def disable_rls_statements(*, revoke: bool = True) -> list[str]:
+    """
+    DDL inverse de enable_rls_statements (`db rls disable`). `revoke` retire
+    aussi les droits des rôles de portée (à omettre s'ils n'existent pas).
+    """
+    roles = ", ".join(SCOPE_ROLES)
+    statements = []
+    for table in SCOPED_TABLES:
+        policies = ["scope", "read"] + [c.lower() for c, _ in _WRITE_POLICIES]
+        statements += [
+            f"DROP POLICY IF EXISTS {table}_{name} ON {table}" for name in policies
+        ]
+        statements.append(f"ALTER TABLE {table} DISABLE ROW LEVEL SECURITY")
+    if revoke:
+        statements.append(
+            f"REVOKE SELECT ON {', '.join(SCOPE_READ_TABLES)} FROM {roles}"
+        )
+    return statements
+
+
+def missing_scope_roles(session: Session) -> list[str]:
+    """Rôles de portée absents du serveur (à créer par un administrateur)."""
+    existing = set(
+        session.scalars(
+            text("SELECT rolname FROM pg_roles WHERE rolname = ANY(:roles)"),
+            {"roles": list(SCOPE_ROLES)},
+        )
+    )
+    return [role for role in SCOPE_ROLES if role not in existing]
+
+
+def apply_rls_mode(session: Session, *, enabled: bool) -> None:
+    """
+    Active ou retire les policies RLS dans la transaction courante.
+
+    L'activation repart d'un état propre (policies supprimées puis recréées) :
+    elle peut être relancée sans erreur.
+    """
+    statements = disable_rls_statements(revoke=not missing_scope_roles(session))
+    if enabled:
+        statements += enable_rls_statements()
+    for statement in statements:
+        session.execute(text(statement))
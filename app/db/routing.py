@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, TypeVar
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.db import config
+from app.db.engine import get_replica_engine
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Clés de session.info
+READ_REPLICA = "epiccrm_read_replica"  # lectures routables vers le replica
+READ_PRIMARY = "epiccrm_read_primary"  # lectures forcées sur la base principale
+REPLICA_FRESH = "epiccrm_replica_fresh"  # résultat du contrôle de retard
+
+# Retard de réplication en secondes : 0 si le replica a rejoué tout ce qu'il a
+# reçu (ou s'il s'agit d'un primaire), NULL si aucune transaction n'a été rejouée.
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+def primary_reads_forced() -> bool:
+    """Indique si toutes les lectures doivent aller sur la base principale."""
+    # Lu dynamiquement pour respecter les changements d'env
+    raw = os.getenv("EPICCRM_READ_PRIMARY", "")
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def replica_lag(engine: Any) -> float | None:
+    """Retard du replica en secondes (None : inconnu)."""
+    with engine.connect() as connection:
+        lag = connection.execute(text(REPLICA_LAG_SQL)).scalar()
+    return None if lag is None else float(lag)
+
+
+class RoutingSession(Session):
+    """
+    Session qui envoie au replica (DATABASE_URL_REPLICA) les lectures des
+    fonctions de service marquées @replica_reads, et tout le reste au primaire.
+
+    Reste sur le primaire :
+    - les écritures (flush) et les SELECT ... FOR UPDATE ;
+    - toutes les lectures d'une session qui a déjà écrit (read-your-writes) ;
+    - les lectures forcées (primary_reads / EPICCRM_READ_PRIMARY) ;
+    - tout, si le replica est injoignable ou en retard de plus de
+      EPICCRM_REPLICA_MAX_LAG secondes (contrôlé une fois par session).
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        replica = get_replica_engine()
+        if replica is not None and self._routes_to_replica(clause, replica):
+            return replica
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _routes_to_replica(self, clause: Any, replica: Any) -> bool:
+        if not self.info.get(READ_REPLICA) or self.info.get(READ_PRIMARY):
+            return False
+        if self._flushing or primary_reads_forced():
+            return False
+        if getattr(clause, "_for_update_arg", None) is not None:
+            return False
+        return self._replica_fresh(replica)
+
+    def _replica_fresh(self, replica: Any) -> bool:
+        fresh = self.info.get(REPLICA_FRESH)
+        if fresh is None:
+            try:
+                lag = replica_lag(replica)
+            except DBAPIError:
+                lag = None
+            fresh = lag is not None and lag <= config.REPLICA_MAX_LAG_SECONDS
+            self.info[REPLICA_FRESH] = fresh
+        return fresh
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _stick_to_primary(session: Session, _flush_context: Any) -> None:
+    """Après une écriture, la session relit ses propres données sur le primaire."""
+    session.info[READ_PRIMARY] = True
+
+
+@contextmanager
+def primary_reads(session: Session) -> Iterator[None]:
+    """Force les lectures de `session` sur la base principale (read-your-writes)."""
+    previous = session.info.get(READ_PRIMARY, False)
+    session.info[READ_PRIMARY] = True
+    try:
+        yield
+    finally:
+        session.info[READ_PRIMARY] = previous
+
+
+@contextmanager
+def _replica_scope(session: Any) -> Iterator[None]:
+    info = getattr(session, "info", None)
+    if info is None:
+        yield
+        return
+    previous = info.get(READ_REPLICA, False)
+    info[READ_REPLICA] = True
+    try:
+        yield
+    finally:
+        info[READ_REPLICA] = previous
+
+
+def _iter_in_scope(session: Any, iterator: Iterator[Any]) -> Iterator[Any]:
+    # Les pages suivantes sont chargées pendant l'itération, hors de l'appel
+    while True:
+        with _replica_scope(session):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def replica_reads(func: F) -> F:
+    """
+    Marque une fonction de service en lecture seule : ses requêtes peuvent être
+    servies par le replica, y compris pendant l'itération d'un résultat
+    paresseux (listes en flux, exports).
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        session = kwargs["session"] if "session" in kwargs else args[0]
+        with _replica_scope(session):
+            result = func(*args, **kwargs)
+        if isinstance(result, Iterator):
+            return _iter_in_scope(session, result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
@@ -1,10 +1,16 @@
 from sqlalchemy.orm import sessionmaker
 
 from app.db.engine import get_engine
+from app.db.routing import RoutingSession
 
+# expire_on_commit=False : les objets gardent leur état après commit, ce qui évite
+# un SELECT de rechargement (avec ses jointures) à chaque accès post-écriture.
+# RoutingSession : lectures des services @replica_reads sur DATABASE_URL_REPLICA.
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autoflush=False,
     autocommit=False,
+    expire_on_commit=False,
 )
 
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Table, event
+
+SET_UPDATED_AT_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+
+
+def updated_at_condition(table: Table) -> str:
+    """
+    Condition WHEN du trigger `updated_at` : la ligne entière, ou la liste des
+    colonnes stockées si la table a des colonnes générées (PostgreSQL interdit
+    de les référencer dans le WHEN, y compris via OLD.* / NEW.*).
+    """
+    if all(column.computed is None for column in table.columns):
+        return "OLD.* IS DISTINCT FROM NEW.*"
+    stored = [column.name for column in table.columns if column.computed is None]
+    old_row = ", ".join(f"OLD.{name}" for name in stored)
+    new_row = ", ".join(f"NEW.{name}" for name in stored)
+    return f"ROW({old_row}) IS DISTINCT FROM ROW({new_row})"
+
+
+def register_updated_at_trigger(table: Table) -> None:
+    """
+    Attache à la table un trigger PostgreSQL maintenant `updated_at`.
+
+    Le trigger est créé avec la table (create_all / tests) ; en production il
+    est posé par la migration Alembic correspondante. La condition WHEN
+    (updated_at_condition) écarte les UPDATE sans effet sans appeler la
+    fonction.
+    """
+    event.listen(
+        table,
+        "before_create",
+        SET_UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{table.name}_updated_at "
+            f"BEFORE UPDATE ON {table.name} "
+            f"FOR EACH ROW WHEN ({updated_at_condition(table)}) "
+            "EXECUTE FUNCTION set_updated_at()"
+        ).execute_if(dialect="postgresql"),
+    )
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from typing import Any
+
 import click
 from dotenv import find_dotenv, load_dotenv
 
-from app.cli.click_utils import Args
+from app.cli.click_utils import Args, PeriodEndParam, format_option, list_options
 from app.cli.commands.auth import cmd_login, cmd_logout, cmd_refresh_token, cmd_whoami
 from app.cli.commands.clients import (
     cmd_clients_create,
     cmd_clients_list,
     cmd_clients_reassign,
+    cmd_clients_search,
+    cmd_clients_show,
     cmd_clients_update,
 )
 from app.cli.commands.contracts import (
@@ -18,22 +22,47 @@ from app.cli.commands.contracts import (
     cmd_contracts_sign,
     cmd_contracts_update,
 )
+from app.cli.commands.dashboard import cmd_dashboard
+from app.cli.commands.db import cmd_db_check_consistency, cmd_db_rls
 from app.cli.commands.employees import (
     cmd_create_employee,
+    cmd_employees_available,
     cmd_employees_deactivate,
     cmd_employees_delete,
     cmd_employees_list,
     cmd_employees_reactivate,
+    cmd_employees_show,
 )
 from app.cli.commands.events import (
+    cmd_events_auto_assign,
+    cmd_events_calendar,
+    cmd_events_claim,
     cmd_events_create,
     cmd_events_list,
     cmd_events_reassign,
+    cmd_events_search,
     cmd_events_update,
 )
+from app.cli.commands.inbox import cmd_inbox
+from app.cli.commands.reports import (
+    cmd_reports_aging,
+    cmd_reports_financial,
+    cmd_reports_refresh,
+)
 from app.core.observability import init_sentry
 from app.db.init_db import init_db
 from app.models.employee import Role
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+from app.repositories.list_filters import DEFAULT_PAGE_SIZE
+from app.services.client_service import SEARCH_MAX_LIMIT
+from app.services.consistency_service import DEFAULT_FIX_BATCH_SIZE
+from app.services.event_service import CALENDAR_UNITS, CLAIM_MAX_COUNT
+from app.services.event_service import SEARCH_MAX_LIMIT as EVENT_SEARCH_MAX_LIMIT
+from app.services.report_service import FINANCIAL_GROUPS
+from app.services.scopes import SCOPE_MINE, SCOPES
 
 dotenv_path = find_dotenv(usecwd=True)
 loaded = load_dotenv(dotenv_path, override=True)
@@ -72,6 +101,108 @@ def whoami() -> None:
     cmd_whoami(Args())
 
 
+# ---------
+# PILOTAGE
+# ---------
+
+
+@cli.command("inbox")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Nombre maximal d'éléments (les plus urgents).",
+)
+@format_option
+def inbox(limit: int | None, format: str) -> None:
+    cmd_inbox(Args(limit=limit, format=format))
+
+
+@cli.command("dashboard")
+def dashboard() -> None:
+    cmd_dashboard(Args())
+
+
+@cli.group("reports")
+def reports() -> None:
+    pass
+
+
+@reports.command("refresh")
+@click.option(
+    "--blocking",
+    is_flag=True,
+    help="REFRESH sans CONCURRENTLY (plus rapide, bloque les lectures).",
+)
+def reports_refresh(blocking: bool) -> None:
+    cmd_reports_refresh(Args(blocking=blocking))
+
+
+@reports.command("financial")
+@click.option(
+    "--by",
+    type=click.Choice(FINANCIAL_GROUPS, case_sensitive=False),
+    default="client",
+    show_default=True,
+    help="Regroupement des totaux.",
+)
+@format_option
+def reports_financial(by: str, format: str) -> None:
+    cmd_reports_financial(Args(by=by, format=format))
+
+
+@reports.command("aging")
+@click.option(
+    "--by",
+    type=click.Choice(FINANCIAL_GROUPS, case_sensitive=False),
+    default="client",
+    show_default=True,
+    help="Regroupement de la balance âgée.",
+)
+@click.option(
+    "--page-size",
+    "page_size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGE_SIZE,
+    show_default=True,
+    help="Lignes lues par lot (curseur serveur).",
+)
+@format_option
+def reports_aging(by: str, page_size: int, format: str) -> None:
+    cmd_reports_aging(Args(by=by, page_size=page_size, format=format))
+
+
+@cli.group("db")
+def db() -> None:
+    pass
+
+
+@db.command("check-consistency")
+@click.option(
+    "--fix",
+    is_flag=True,
+    help="Corrige les anomalies corrigibles (par lots, une transaction par lot).",
+)
+@click.option(
+    "--batch-size",
+    "batch_size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FIX_BATCH_SIZE,
+    show_default=True,
+    help="Lignes corrigées par transaction.",
+)
+@format_option
+def db_check_consistency(fix: bool, batch_size: int, format: str) -> None:
+    cmd_db_check_consistency(Args(fix=fix, batch_size=batch_size, format=format))
+
+
+@db.command("rls")
+@click.argument("mode", type=click.Choice(["enable", "disable"]))
+def db_rls(mode: str) -> None:
+    """Pose ou retire les policies du mode RLS (EPICCRM_RLS)."""
+    cmd_db_rls(Args(mode=mode))
+
+
 # -----------------
 # EMPLOYEES (boot)
 # -----------------
@@ -108,8 +239,47 @@ def employees() -> None:
     type=click.Choice([r.name for r in Role], case_sensitive=True),
     default=None,
 )
-def employees_list(role: str | None) -> None:
-    cmd_employees_list(Args(role=role))
+@list_options(sortable=EmployeeRepository.SORTABLE_COLUMNS)
+def employees_list(role: str | None, **options: Any) -> None:
+    cmd_employees_list(Args(role=role, **options))
+
+
+@employees.command("available")
+@click.option(
+    "--from",
+    "period_start",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    required=True,
+    help="Début de période (YYYY-MM-DD[ HH:MM]).",
+)
+@click.option(
+    "--to",
+    "period_end",
+    type=PeriodEndParam(),
+    required=True,
+    help="Fin de période, journée incluse (YYYY-MM-DD[ HH:MM]).",
+)
+@click.option(
+    "--role",
+    type=click.Choice([r.name for r in Role], case_sensitive=True),
+    default=Role.SUPPORT.name,
+    show_default=True,
+    help="Rôle des employés recherchés.",
+)
+@format_option
+def employees_available(
+    period_start: Any, period_end: Any, role: str, format: str
+) -> None:
+    cmd_employees_available(
+        Args(period_start=period_start, period_end=period_end, role=role, format=format)
+    )
+
+
+@employees.command("show")
+@click.argument("employee_id", type=int)
+@format_option
+def employees_show(employee_id: int, format: str) -> None:
+    cmd_employees_show(Args(employee_id=employee_id, format=format))
 
 
 @employees.command("deactivate")
@@ -143,8 +313,59 @@ def clients() -> None:
 
 
 @clients.command("list")
-def clients_list() -> None:
-    cmd_clients_list(Args())
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes clients). Par défaut selon le rôle.",
+)
+@click.option("--mine", is_flag=True, help="Raccourci pour --scope mine.")
+@list_options(
+    "sales_id", "company", "created_after", sortable=ClientRepository.SORTABLE_COLUMNS
+)
+def clients_list(scope: str | None, mine: bool, **filters: Any) -> None:
+    cmd_clients_list(Args(scope=SCOPE_MINE if mine else scope, **filters))
+
+
+@clients.command("search")
+@click.argument("query")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1, max=SEARCH_MAX_LIMIT),
+    default=20,
+    show_default=True,
+    help="Nombre de résultats par page.",
+)
+@click.option(
+    "--page", type=click.IntRange(min=1), default=1, show_default=True, help="Page."
+)
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes clients). Par défaut selon le rôle.",
+)
+@format_option
+def clients_search(
+    query: str, limit: int, page: int, scope: str | None, format: str
+) -> None:
+    cmd_clients_search(
+        Args(query=query, limit=limit, page=page, scope=scope, format=format)
+    )
+
+
+@clients.command("show")
+@click.argument("client_id", type=int)
+@click.option(
+    "--format",
+    "format",
+    type=click.Choice(("table", "json"), case_sensitive=False),
+    default="table",
+    show_default=True,
+    help="Fiche en tables, ou document JSON imbriqué.",
+)
+def clients_show(client_id: int, format: str) -> None:
+    cmd_clients_show(Args(client_id=client_id, format=format))
 
 
 @clients.command("create")
@@ -231,8 +452,38 @@ def contracts() -> None:
     is_flag=True,
     help="Afficher uniquement les contrats non entièrement payés.",
 )
-def contracts_list(view: str, unsigned: bool, unpaid: bool) -> None:
-    cmd_contracts_list(Args(view=view, unsigned=unsigned, unpaid=unpaid))
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes contrats). Par défaut selon le rôle.",
+)
+@click.option("--mine", is_flag=True, help="Raccourci pour --scope mine.")
+@list_options(
+    "client_id",
+    "sales_id",
+    "company",
+    "min_due",
+    "created_after",
+    sortable=ContractRepository.SORTABLE_COLUMNS,
+)
+def contracts_list(
+    view: str,
+    unsigned: bool,
+    unpaid: bool,
+    scope: str | None,
+    mine: bool,
+    **filters: Any,
+) -> None:
+    cmd_contracts_list(
+        Args(
+            view=view,
+            unsigned=unsigned,
+            unpaid=unpaid,
+            scope=SCOPE_MINE if mine else scope,
+            **filters,
+        )
+    )
 
 
 @contracts.command("create")
@@ -303,9 +554,119 @@ def events() -> None:
     is_flag=True,
     help="Afficher uniquement les événements qui me sont assignés.",
 )
-def events_list(view: str, without_support: bool, assigned_to_me: bool) -> None:
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes événements). Par défaut selon le rôle.",
+)
+@list_options(
+    "client_id",
+    "contract_id",
+    "support_id",
+    "created_after",
+    "period_start",
+    "period_end",
+    sortable=EventRepository.SORTABLE_COLUMNS,
+)
+def events_list(
+    view: str,
+    without_support: bool,
+    assigned_to_me: bool,
+    scope: str | None,
+    **filters: Any,
+) -> None:
     cmd_events_list(
-        Args(view=view, without_support=without_support, assigned_to_me=assigned_to_me)
+        Args(
+            view=view,
+            without_support=without_support,
+            assigned_to_me=assigned_to_me,
+            scope=scope,
+            **filters,
+        )
+    )
+
+
+@events.command("calendar")
+@click.option(
+    "--by",
+    type=click.Choice(CALENDAR_UNITS, case_sensitive=False),
+    default="day",
+    show_default=True,
+    help="Regroupement : par jour ou par semaine.",
+)
+@click.option(
+    "--from",
+    "period_start",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    default=None,
+    help="Début de période (défaut : aujourd'hui).",
+)
+@click.option(
+    "--to",
+    "period_end",
+    type=PeriodEndParam(),
+    default=None,
+    help="Fin de période incluse (défaut : 7 jours, ou 4 semaines avec --by week).",
+)
+@click.option(
+    "--assigned-to-me",
+    "--mine",
+    "assigned_to_me",
+    is_flag=True,
+    help="Uniquement les événements qui me sont assignés.",
+)
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes événements). Par défaut selon le rôle.",
+)
+@format_option
+def events_calendar(
+    by: str,
+    period_start: Any,
+    period_end: Any,
+    assigned_to_me: bool,
+    scope: str | None,
+    format: str,
+) -> None:
+    cmd_events_calendar(
+        Args(
+            by=by,
+            period_start=period_start,
+            period_end=period_end,
+            assigned_to_me=assigned_to_me,
+            scope=scope,
+            format=format,
+        )
+    )
+
+
+@events.command("search")
+@click.argument("query")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1, max=EVENT_SEARCH_MAX_LIMIT),
+    default=20,
+    show_default=True,
+    help="Nombre de résultats par page.",
+)
+@click.option(
+    "--page", type=click.IntRange(min=1), default=1, show_default=True, help="Page."
+)
+@click.option(
+    "--scope",
+    type=click.Choice(SCOPES, case_sensitive=False),
+    default=None,
+    help="Portée : all (tous) ou mine (mes événements). Par défaut selon le rôle.",
+)
+@format_option
+def events_search(
+    query: str, limit: int, page: int, scope: str | None, format: str
+) -> None:
+    cmd_events_search(
+        Args(query=query, limit=limit, page=page, scope=scope, format=format)
     )
 
 
@@ -401,6 +762,53 @@ def events_reassign(
     )
 
 
+@events.command("auto-assign")
+@click.option(
+    "--from",
+    "period_start",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    default=None,
+    help="Événements en cours à partir de cette date.",
+)
+@click.option(
+    "--to",
+    "period_end",
+    type=PeriodEndParam(),
+    default=None,
+    help="Événements en cours jusqu'à cette date incluse.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Affiche le plan d'assignation sans rien enregistrer.",
+)
+@format_option
+def events_auto_assign(
+    period_start: Any, period_end: Any, dry_run: bool, format: str
+) -> None:
+    cmd_events_auto_assign(
+        Args(
+            period_start=period_start,
+            period_end=period_end,
+            dry_run=dry_run,
+            format=format,
+        )
+    )
+
+
+@events.command("claim")
+@click.option(
+    "--count",
+    type=click.IntRange(min=1, max=CLAIM_MAX_COUNT),
+    default=1,
+    show_default=True,
+    help="Nombre d'événements à prendre en charge.",
+)
+@format_option
+def events_claim(count: int, format: str) -> None:
+    cmd_events_claim(Args(count=count, format=format))
+
+
 def main() -> None:
     cli()
 
@@ -2,3 +2,4 @@ from app.models.client import Client  # noqa: F401
 from app.models.contract import Contract  # noqa: F401
 from app.models.employee import Employee  # noqa: F401
 from app.models.event import Event  # noqa: F401
+from app.models.report_snapshot import ReportSnapshot  # noqa: F401
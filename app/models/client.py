@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.triggers import register_updated_at_trigger
 from app.models.employee import Employee
 
+SEARCH_DOCUMENT_SQL = (
+    "first_name || ' ' || last_name || ' ' || email || ' ' "
+    "|| coalesce(company_name, '')"
+)
+
 
 class Client(Base):
     __tablename__ = "clients"
@@ -16,7 +32,7 @@ class Client(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
 
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
 
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -25,18 +41,38 @@ class Client(Base):
     sales_contact_id: Mapped[int] = mapped_column(
         ForeignKey("employees.id"),
         nullable=False,
+        index=True,
     )
 
     sales_contact: Mapped["Employee"] = relationship("Employee", lazy="joined")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
+        index=True,
     )
 
+    # Maintenu par le trigger trg_clients_updated_at (y compris UPDATE en masse)
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
-        default=None,
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_onupdate=FetchedValue(),
+    )
+
+    # Texte de `clients search` (colonne générée), indexé en trigrammes (pg_trgm)
+    # par la migration ; non chargé avec le client.
+    search_document: Mapped[str] = mapped_column(
+        Text,
+        Computed(SEARCH_DOCUMENT_SQL, persisted=True),
+        deferred=True,
     )
+
+
+# Unicité insensible à la casse : sert aussi d'index pour les recherches par email
+Index("uq_clients_email_lower", func.lower(Client.email), unique=True)
+
+# Filtre --company (égalité insensible à la casse)
+Index("ix_clients_company_name_lower", func.lower(Client.company_name))
+
+
+register_updated_at_trigger(Client.__table__)
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Numeric,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.triggers import register_updated_at_trigger
 from app.models.client import Client
 from app.models.employee import Employee
 
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (
+        CheckConstraint("total_amount > 0", name="ck_contracts_total_amount_positive"),
+        CheckConstraint("amount_due >= 0", name="ck_contracts_amount_due_non_negative"),
+        CheckConstraint(
+            "amount_due <= total_amount", name="ck_contracts_amount_due_lte_total"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -20,6 +36,7 @@ class Contract(Base):
     client_id: Mapped[int] = mapped_column(
         ForeignKey("clients.id"),
         nullable=False,
+        index=True,
     )
     client: Mapped["Client"] = relationship(
         "Client",
@@ -29,6 +46,7 @@ class Contract(Base):
     sales_contact_id: Mapped[int] = mapped_column(
         ForeignKey("employees.id"),
         nullable=False,
+        index=True,
     )
     sales_contact: Mapped["Employee"] = relationship(
         "Employee",
@@ -44,6 +62,7 @@ class Contract(Base):
     amount_due: Mapped[Decimal] = mapped_column(
         Numeric(10, 2),
         nullable=False,
+        index=True,
     )
 
     is_signed: Mapped[bool] = mapped_column(
@@ -55,12 +74,16 @@ class Contract(Base):
     # --- Timestamps ---
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
+        index=True,
     )
 
+    # Maintenu par le trigger trg_contracts_updated_at (y compris UPDATE en masse)
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
-        default=None,
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_onupdate=FetchedValue(),
     )
+
+
+register_updated_at_trigger(Contract.__table__)
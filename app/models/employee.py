@@ -1,7 +1,15 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, String, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    Index,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -21,7 +29,7 @@ class Employee(Base):
 
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
-    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
 
     email: Mapped[str] = mapped_column(String(255), nullable=False)
 
@@ -31,8 +39,9 @@ class Employee(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
+        index=True,
     )
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -46,3 +55,7 @@ class Employee(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+
+
+# Unicité insensible à la casse : sert aussi d'index pour les recherches par email
+Index("uq_employees_email_lower", func.lower(Employee.email), unique=True)
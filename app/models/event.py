@@ -1,18 +1,56 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
-from sqlalchemy import DateTime, ForeignKey, String
+from datetime import datetime
+
+from sqlalchemy import (
+    CheckConstraint,
+    Computed,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.triggers import register_updated_at_trigger
 from app.models.client import Client
 from app.models.contract import Contract
 from app.models.employee import Employee
 
+# Configuration plein texte (stemming français) de `events search`
+SEARCH_CONFIG = "french"
+
+# Document plein texte : le lieu pèse plus lourd (A) que les notes (B)
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(notes, '')), 'B')"
+)
+
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        CheckConstraint("start_date < end_date", name="ck_events_start_before_end"),
+        CheckConstraint("attendees >= 0", name="ck_events_attendees_non_negative"),
+        # Un support ne peut pas couvrir deux événements qui se chevauchent.
+        # int4range(id, id, '[]') WITH = tient lieu d'égalité btree dans l'index
+        # GiST (opclass range_ops, sans l'extension btree_gist).
+        ExcludeConstraint(
+            (
+                text("int4range(support_contact_id, support_contact_id, '[]')"),
+                "=",
+            ),
+            (text("tstzrange(start_date, end_date)"), "&&"),
+            name="ex_events_support_no_overlap",
+            using="gist",
+            where=text("support_contact_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -20,6 +58,7 @@ class Event(Base):
     contract_id: Mapped[int] = mapped_column(
         ForeignKey("contracts.id"),
         nullable=False,
+        index=True,
     )
     contract: Mapped["Contract"] = relationship(
         "Contract",
@@ -29,6 +68,7 @@ class Event(Base):
     client_id: Mapped[int] = mapped_column(
         ForeignKey("clients.id"),
         nullable=False,
+        index=True,
     )
     client: Mapped["Client"] = relationship(
         "Client",
@@ -38,6 +78,7 @@ class Event(Base):
     support_contact_id: Mapped[int | None] = mapped_column(
         ForeignKey("employees.id"),
         nullable=True,
+        index=True,
     )
     support_contact: Mapped["Employee | None"] = relationship(
         "Employee",
@@ -49,6 +90,7 @@ class Event(Base):
     start_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
     )
 
     end_date: Mapped[datetime] = mapped_column(
@@ -73,12 +115,30 @@ class Event(Base):
     # --- Timestamps ---
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
+        index=True,
     )
 
+    # Maintenu par le trigger trg_events_updated_at (y compris UPDATE en masse)
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
-        default=None,
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_onupdate=FetchedValue(),
+    )
+
+    # Document de `events search` (colonne générée), non chargé avec l'événement
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
     )
+
+
+Index("ix_events_search_vector", Event.search_vector, postgresql_using="gin")
+
+# Plage [début, fin) de l'événement : les recherches par période (--from / --to,
+# calendrier) s'écrivent `period && tstzrange(:from, :to)` et utilisent l'index GiST
+EVENT_PERIOD = func.tstzrange(Event.start_date, Event.end_date)
+Index("ix_events_period", EVENT_PERIOD, postgresql_using="gist")
+
+register_updated_at_trigger(Event.__table__)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.reports import register_financial_summary_view
+
+
+class ReportSnapshot(Base):
+    """Date du dernier rafraîchissement de chaque vue de reporting."""
+
+    __tablename__ = "report_snapshots"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+
+register_financial_summary_view(Base.metadata)
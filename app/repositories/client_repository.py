@@ -1,21 +1,204 @@
 from __future__ import annotations
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
 
+from sqlalchemy import (
+    ColumnElement,
+    Text,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+
+from app.db.estimates import estimate_count
+from app.db.extensions import extension_installed
 from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.guarded import row_exists, update_guarded
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    ListFilters,
+    iter_keyset,
+    sort_clauses,
+)
+
+
+@dataclass(frozen=True)
+class ContractLine:
+    """Contrat d'une fiche client."""
+
+    id: int
+    total_amount: Decimal
+    amount_due: Decimal
+    is_signed: bool
+    created_at: datetime
+    sales_name: str
+
+
+@dataclass(frozen=True)
+class EventLine:
+    """Événement d'une fiche client, avec son support."""
+
+    id: int
+    contract_id: int
+    start_date: datetime
+    end_date: datetime
+    location: str
+    attendees: int
+    support_name: str | None
+
+
+@dataclass(frozen=True)
+class ClientOverview:
+    """Fiche client : le client (et son commercial), ses contrats et événements."""
+
+    client: Client
+    contracts: list[ContractLine]
+    events: list[EventLine]
 
 
 class ClientRepository:
+    # Colonnes triables (chacune adossée à un index)
+    SORTABLE_COLUMNS = {
+        "id": Client.id,
+        "created_at": Client.created_at,
+        "last_name": Client.last_name,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialise le repository avec une session SQLAlchemy."""
         self.session = session
 
     def list_all(self) -> list[Client]:
         """Retourne tous les clients."""
-        stmt = select(Client).order_by(Client.id)
+        return self.list_filtered()
+
+    def list_filtered(
+        self,
+        *,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+    ) -> list[Client]:
+        """
+        Retourne les clients, éventuellement limités à un commercial.
+
+        `filters` ajoute les critères --sales-id / --company / --created-after
+        et le tri (lève InvalidSortError si la colonne n'est pas autorisée).
+        """
+        filters = filters or ListFilters()
+        stmt = (
+            select(Client)
+            .where(*self._conditions(sales_contact_id, filters))
+            .order_by(*sort_clauses(filters.sort, self.SORTABLE_COLUMNS, Client.id))
+        )
         return list(self.session.scalars(stmt).all())
 
+    def iter_filtered(
+        self,
+        *,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Client]:
+        """Comme list_filtered, mais chargé page par page (pagination par clé)."""
+        filters = filters or ListFilters()
+        stmt = select(Client).where(*self._conditions(sales_contact_id, filters))
+        return iter_keyset(
+            self.session,
+            stmt,
+            sort=filters.sort,
+            sortable=self.SORTABLE_COLUMNS,
+            pk=Client.id,
+            page_size=page_size,
+        )
+
+    def count_filtered(
+        self,
+        *,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        approx: bool = False,
+    ) -> int:
+        """
+        Compte les clients avec les mêmes critères que list_filtered.
+
+        `approx` retourne une estimation (statistiques PostgreSQL) sans parcourir
+        la table.
+        """
+        conditions = self._conditions(sales_contact_id, filters or ListFilters())
+        if approx:
+            stmt = select(Client.id).where(*conditions)
+            return estimate_count(self.session, stmt, Client.__table__)
+
+        stmt = select(func.count()).select_from(Client).where(*conditions)
+        return self.session.scalar(stmt) or 0
+
+    @staticmethod
+    def _conditions(
+        sales_contact_id: int | None, filters: ListFilters
+    ) -> list[ColumnElement[bool]]:
+        """Compile la portée et les filtres en critères WHERE."""
+        conditions: list[ColumnElement[bool]] = []
+
+        if sales_contact_id is not None:
+            conditions.append(Client.sales_contact_id == sales_contact_id)
+
+        if filters.sales_contact_id is not None:
+            conditions.append(Client.sales_contact_id == filters.sales_contact_id)
+
+        if filters.company:
+            conditions.append(
+                func.lower(Client.company_name) == filters.company.strip().lower()
+            )
+
+        if filters.created_after is not None:
+            conditions.append(Client.created_at >= filters.created_after)
+
+        return conditions
+
+    def search(
+        self,
+        query: str,
+        *,
+        sales_contact_id: int | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[Client, float]]:
+        """
+        Recherche des clients (nom, prénom, email, entreprise), classés par pertinence.
+
+        Avec pg_trgm : similarité par trigrammes (`search_document %> :q`, faute
+        de frappe tolérée) ou sous-chaîne, servies par l'index GIN
+        ix_clients_search_trgm. Sans l'extension : sous-chaîne seule (ILIKE).
+        """
+        document = Client.search_document
+        substring = document.ilike(f"%{_escape_like(query)}%", escape="\\")
+
+        if extension_installed(self.session, "pg_trgm"):
+            score = func.word_similarity(query, document)
+            match = or_(document.op("%>")(query), substring)
+        else:
+            score = literal(1.0)
+            match = substring
+
+        stmt = select(Client, score.label("score")).where(match)
+        if sales_contact_id is not None:
+            stmt = stmt.where(Client.sales_contact_id == sales_contact_id)
+
+        stmt = stmt.order_by(score.desc(), Client.id).limit(limit).offset(offset)
+        return [(client, float(rank)) for client, rank in self.session.execute(stmt)]
+
     def add(self, client: Client) -> Client:
         """Ajoute un client en base."""
         self.session.add(client)
@@ -27,7 +210,136 @@ class ClientRepository:
         stmt = select(Client).where(Client.id == client_id)
         return self.session.scalars(stmt).first()
 
+    def get_overview(self, client_id: int) -> ClientOverview | None:
+        """
+        Charge la fiche d'un client en une seule requête.
+
+        Le commercial est joint au client ; contrats et événements (avec leur
+        support) sont agrégés en tableaux JSON par deux sous-requêtes LATERAL
+        (`json_agg`), servies par les index sur `client_id`.
+        """
+        contract_sales = aliased(Employee)
+        contracts = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id",
+                            Contract.id,
+                            "total_amount",
+                            cast(Contract.total_amount, Text),
+                            "amount_due",
+                            cast(Contract.amount_due, Text),
+                            "is_signed",
+                            Contract.is_signed,
+                            "created_at",
+                            Contract.created_at,
+                            "sales_name",
+                            _full_name(contract_sales),
+                        ),
+                        Contract.created_at,
+                        Contract.id,
+                    )
+                ).label("contracts")
+            )
+            .select_from(Contract)
+            .join(contract_sales, contract_sales.id == Contract.sales_contact_id)
+            .where(Contract.client_id == Client.id)
+            .lateral("client_contracts")
+        )
+
+        support = aliased(Employee)
+        events = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id",
+                            Event.id,
+                            "contract_id",
+                            Event.contract_id,
+                            "start_date",
+                            Event.start_date,
+                            "end_date",
+                            Event.end_date,
+                            "location",
+                            Event.location,
+                            "attendees",
+                            Event.attendees,
+                            "support_name",
+                            _full_name(support),
+                        ),
+                        Event.start_date,
+                        Event.id,
+                    )
+                ).label("events")
+            )
+            .select_from(Event)
+            .outerjoin(support, support.id == Event.support_contact_id)
+            .where(Event.client_id == Client.id)
+            .lateral("client_events")
+        )
+
+        stmt = (
+            select(Client, contracts.c.contracts, events.c.events)
+            .select_from(Client)
+            .outerjoin(contracts, true())
+            .outerjoin(events, true())
+            .where(Client.id == client_id)
+        )
+        row = self.session.execute(stmt).first()
+        if row is None:
+            return None
+
+        client, contract_items, event_items = row
+        return ClientOverview(
+            client=client,
+            contracts=[
+                ContractLine(
+                    id=item["id"],
+                    total_amount=Decimal(item["total_amount"]),
+                    amount_due=Decimal(item["amount_due"]),
+                    is_signed=item["is_signed"],
+                    created_at=datetime.fromisoformat(item["created_at"]),
+                    sales_name=item["sales_name"],
+                )
+                for item in contract_items or []
+            ],
+            events=[
+                EventLine(
+                    id=item["id"],
+                    contract_id=item["contract_id"],
+                    start_date=datetime.fromisoformat(item["start_date"]),
+                    end_date=datetime.fromisoformat(item["end_date"]),
+                    location=item["location"],
+                    attendees=item["attendees"],
+                    support_name=item["support_name"],
+                )
+                for item in event_items or []
+            ],
+        )
+
     def get_by_email(self, email: str) -> Client | None:
-        """Retourne un client par son email."""
-        stmt = select(Client).where(Client.email == email)
+        """Retourne un client par son email (insensible à la casse)."""
+        stmt = select(Client).where(func.lower(Client.email) == email.strip().lower())
         return self.session.scalars(stmt).first()
+
+    def update_guarded(
+        self, client_id: int, values: dict[str, Any], *guards: ColumnElement[bool]
+    ) -> Client | None:
+        """Met à jour un client (UPDATE gardé, None si refusé)."""
+        return update_guarded(self.session, Client, client_id, values, *guards)
+
+    def exists(self, client_id: int) -> bool:
+        """Indique si un client existe (sonde légère, sans jointure)."""
+        return row_exists(self.session, Client, client_id)
+
+
+def _full_name(employee: Any) -> ColumnElement[str]:
+    """Nom complet d'un employé (NULL si l'employé est absent)."""
+    return func.nullif(func.concat_ws(" ", employee.first_name, employee.last_name), "")
+
+
+def _escape_like(value: str) -> str:
+    """Échappe les jokers LIKE (%, _) saisis par l'utilisateur."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Select, Table, Update, exists, func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee
+from app.models.event import Event
+
+# Nombre d'ids fautifs donnés en exemple par contrôle
+SAMPLE_SIZE = 5
+
+
+@dataclass(frozen=True)
+class ConsistencyCheck:
+    """
+    Contrôle de cohérence : `violations` sélectionne la clé primaire (`key`) des
+    lignes fautives (anti-jointure / jointure, sans boucle Python) ; `fix`, s'il
+    existe, corrige les lignes dont l'id est dans la sous-requête donnée.
+    """
+
+    name: str
+    label: str
+    key: Any
+    violations: Callable[[], Select]
+    fix: Callable[[Select], Update] | None = None
+
+
+@dataclass(frozen=True)
+class CheckCount:
+    """Nombre de lignes fautives d'un contrôle, et quelques ids en exemple."""
+
+    check: ConsistencyCheck
+    count: int
+    samples: list[int]
+
+
+def _event_client_mismatch() -> Select:
+    return (
+        select(Event.id)
+        .join(Contract, Contract.id == Event.contract_id)
+        .where(Event.client_id != Contract.client_id)
+    )
+
+
+def _fix_event_client(ids: Select) -> Update:
+    return (
+        update(Event)
+        .where(
+            Event.id.in_(ids),
+            Event.contract_id == Contract.id,
+            Event.client_id != Contract.client_id,
+        )
+        .values(client_id=Contract.client_id)
+        .returning(Event.id)
+    )
+
+
+def _contract_sales_mismatch() -> Select:
+    """
+    Contrats suivis par un autre commercial que leur client.
+
+    Signalement seulement : `reassign_client` aligne tous les contrats du
+    client, mais `reassign_contract` confie légitimement un contrat à un autre
+    commercial, et rien ne distingue ces deux cas a posteriori. Un alignement
+    automatique annulerait ces réassignations volontaires.
+    """
+    return (
+        select(Contract.id)
+        .join(Client, Client.id == Contract.client_id)
+        .where(Contract.sales_contact_id != Client.sales_contact_id)
+    )
+
+
+def _inactive_client_sales() -> Select:
+    return (
+        select(Client.id)
+        .join(Employee, Employee.id == Client.sales_contact_id)
+        .where(Employee.is_active.is_(False))
+    )
+
+
+def _inactive_event_support() -> Select:
+    return (
+        select(Event.id)
+        .join(Employee, Employee.id == Event.support_contact_id)
+        .where(Employee.is_active.is_(False), Event.end_date > func.now())
+    )
+
+
+def _fix_event_support(ids: Select) -> Update:
+    # Désassigne : l'événement rejoint la file des événements sans support
+    return (
+        update(Event)
+        .where(Event.id.in_(ids))
+        .values(support_contact_id=None)
+        .returning(Event.id)
+    )
+
+
+def _orphan_checks(tables: list[Table]) -> list[ConsistencyCheck]:
+    """
+    Une anti-jointure NOT EXISTS par clé étrangère du schéma (références vers
+    une ligne absente : contrainte désactivée, import partiel...).
+    """
+    checks = []
+    for table in tables:
+        (pk,) = table.primary_key.columns
+        for fk in sorted(table.foreign_keys, key=lambda fk: fk.parent.name):
+            column, target = fk.parent, fk.column
+
+            def violations(pk=pk, column=column, target=target) -> Select:
+                return select(pk).where(
+                    column.is_not(None), ~exists().where(target == column)
+                )
+
+            checks.append(
+                ConsistencyCheck(
+                    name=f"orphan_{table.name}_{column.name}",
+                    label=(
+                        f"{table.name}.{column.name} référence un "
+                        f"{target.table.name} inexistant"
+                    ),
+                    key=pk,
+                    violations=violations,
+                )
+            )
+    return checks
+
+
+CHECKS: tuple[ConsistencyCheck, ...] = (
+    ConsistencyCheck(
+        name="event_client_mismatch",
+        label="Événement rattaché à un autre client que son contrat",
+        key=Event.id,
+        violations=_event_client_mismatch,
+        fix=_fix_event_client,
+    ),
+    ConsistencyCheck(
+        name="contract_sales_mismatch",
+        label="Contrat suivi par un autre commercial que son client (à vérifier)",
+        key=Contract.id,
+        violations=_contract_sales_mismatch,
+    ),
+    ConsistencyCheck(
+        name="inactive_client_sales",
+        label="Client suivi par un commercial désactivé (à réassigner)",
+        key=Client.id,
+        violations=_inactive_client_sales,
+    ),
+    ConsistencyCheck(
+        name="inactive_event_support",
+        label="Événement à venir assigné à un support désactivé",
+        key=Event.id,
+        violations=_inactive_event_support,
+        fix=_fix_event_support,
+    ),
+    *_orphan_checks(
+        [Base.metadata.tables[name] for name in ("clients", "contracts", "events")]
+    ),
+)
+
+
+class ConsistencyRepository:
+    """Contrôles de cohérence entre tables, exécutés en SQL ensembliste."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialise le repository avec une session SQLAlchemy."""
+        self.session = session
+
+    def count(self, checks: tuple[ConsistencyCheck, ...] = CHECKS) -> list[CheckCount]:
+        """
+        Compte les lignes fautives de chaque contrôle, en une seule requête
+        (un count(*) et un ARRAY(... LIMIT n) par contrôle).
+        """
+        columns = []
+        for check in checks:
+            violations = check.violations()
+            columns.append(
+                select(func.count())
+                .select_from(violations.subquery())
+                .scalar_subquery()
+            )
+            sample = violations.order_by(check.key).limit(SAMPLE_SIZE)
+            columns.append(func.array(sample.scalar_subquery()))
+
+        row = self.session.execute(select(*columns)).one()
+        return [
+            CheckCount(check=check, count=row[2 * i], samples=list(row[2 * i + 1]))
+            for i, check in enumerate(checks)
+        ]
+
+    def fix_batch(
+        self, check: ConsistencyCheck, *, after_id: int, batch_size: int
+    ) -> list[int]:
+        """
+        Corrige au plus `batch_size` lignes fautives d'id > `after_id` (parcours
+        par clé primaire) ; retourne les ids corrigés, triés.
+        """
+        if check.fix is None:
+            raise ValueError(f"Le contrôle {check.name!r} n'a pas de correction.")
+
+        # Sous-requête autonome : ne pas corréler events / contracts à l'UPDATE
+        ids = (
+            check.violations()
+            .where(check.key > after_id)
+            .order_by(check.key)
+            .limit(batch_size)
+            .correlate(None)
+        )
+        return sorted(self.session.scalars(check.fix(ids)).all())
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.orm import Session
 
+from app.db.estimates import estimate_count
+from app.models.client import Client
 from app.models.contract import Contract
+from app.repositories.guarded import row_exists, update_guarded
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    ListFilters,
+    iter_keyset,
+    sort_clauses,
+)
 
 
 class ContractRepository:
+    # Colonnes triables (chacune adossée à un index)
+    SORTABLE_COLUMNS = {
+        "id": Contract.id,
+        "created_at": Contract.created_at,
+        "amount_due": Contract.amount_due,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialise le repository avec une session SQLAlchemy."""
         self.session = session
@@ -16,19 +35,119 @@ class ContractRepository:
         return self.list_filtered()
 
     def list_filtered(
-        self, *, unsigned: bool = False, unpaid: bool = False
+        self,
+        *,
+        unsigned: bool = False,
+        unpaid: bool = False,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
     ) -> list[Contract]:
-        """Retourne les contrats filtrés (non signés / non payés)."""
-        stmt = select(Contract)
+        """
+        Retourne les contrats filtrés (non signés / non payés / commercial).
+
+        `filters` ajoute les critères --client-id / --sales-id / --company /
+        --min-due / --created-after et le tri (InvalidSortError si non autorisé).
+        """
+        filters = filters or ListFilters()
+        stmt = (
+            select(Contract)
+            .where(*self._conditions(unsigned, unpaid, sales_contact_id, filters))
+            .order_by(*sort_clauses(filters.sort, self.SORTABLE_COLUMNS, Contract.id))
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def iter_filtered(
+        self,
+        *,
+        unsigned: bool = False,
+        unpaid: bool = False,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Contract]:
+        """Comme list_filtered, mais chargé page par page (pagination par clé)."""
+        filters = filters or ListFilters()
+        stmt = select(Contract).where(
+            *self._conditions(unsigned, unpaid, sales_contact_id, filters)
+        )
+        return iter_keyset(
+            self.session,
+            stmt,
+            sort=filters.sort,
+            sortable=self.SORTABLE_COLUMNS,
+            pk=Contract.id,
+            page_size=page_size,
+        )
+
+    def count_filtered(
+        self,
+        *,
+        unsigned: bool = False,
+        unpaid: bool = False,
+        sales_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        approx: bool = False,
+    ) -> int:
+        """
+        Compte les contrats avec les mêmes critères que list_filtered.
+
+        `approx` retourne une estimation (statistiques PostgreSQL) sans parcourir
+        la table.
+        """
+        conditions = self._conditions(
+            unsigned, unpaid, sales_contact_id, filters or ListFilters()
+        )
+        if approx:
+            stmt = select(Contract.id).where(*conditions)
+            return estimate_count(self.session, stmt, Contract.__table__)
+
+        stmt = select(func.count()).select_from(Contract).where(*conditions)
+        return self.session.scalar(stmt) or 0
+
+    @staticmethod
+    def _conditions(
+        unsigned: bool,
+        unpaid: bool,
+        sales_contact_id: int | None,
+        filters: ListFilters,
+    ) -> list[ColumnElement[bool]]:
+        """Compile la portée et les filtres en critères WHERE."""
+        conditions: list[ColumnElement[bool]] = []
+
+        if sales_contact_id is not None:
+            conditions.append(Contract.sales_contact_id == sales_contact_id)
 
         if unsigned:
-            stmt = stmt.where(Contract.is_signed.is_(False))
+            conditions.append(Contract.is_signed.is_(False))
 
         if unpaid:
-            stmt = stmt.where(Contract.amount_due > 0)
+            conditions.append(Contract.amount_due > 0)
 
-        stmt = stmt.order_by(Contract.id)
-        return list(self.session.scalars(stmt).all())
+        if filters.client_id is not None:
+            conditions.append(Contract.client_id == filters.client_id)
+
+        if filters.sales_contact_id is not None:
+            conditions.append(Contract.sales_contact_id == filters.sales_contact_id)
+
+        if filters.company:
+            # Sous-requête plutôt que jointure : la relation client est déjà
+            # chargée en eager et ne doit pas être dupliquée.
+            conditions.append(
+                Contract.client_id.in_(
+                    select(Client.id).where(
+                        func.lower(Client.company_name)
+                        == filters.company.strip().lower()
+                    )
+                )
+            )
+
+        if filters.min_due is not None:
+            conditions.append(Contract.amount_due >= filters.min_due)
+
+        if filters.created_after is not None:
+            conditions.append(Contract.created_at >= filters.created_after)
+
+        return conditions
 
     def add(self, contract: Contract) -> Contract:
         """Ajoute un contrat en base."""
@@ -40,3 +159,13 @@ class ContractRepository:
         """Retourne un contrat par son id."""
         stmt = select(Contract).where(Contract.id == contract_id)
         return self.session.scalars(stmt).first()
+
+    def update_guarded(
+        self, contract_id: int, values: dict[str, Any], *guards: ColumnElement[bool]
+    ) -> Contract | None:
+        """Met à jour un contrat (UPDATE gardé, None si refusé)."""
+        return update_guarded(self.session, Contract, contract_id, values, *guards)
+
+    def exists(self, contract_id: int) -> bool:
+        """Indique si un contrat existe (sonde légère, sans jointure)."""
+        return row_exists(self.session, Contract, contract_id)
@@ -1,13 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import exists, func, select, true
 from sqlalchemy.orm import Session
 
+from app.db.estimates import estimate_count
+from app.models.client import Client
+from app.models.contract import Contract
 from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.repositories.event_repository import overlaps_period
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    iter_keyset,
+    sort_clauses,
+)
+
+
+@dataclass(frozen=True)
+class EmployeeWorkload:
+    """Portefeuille d'un employé : clients et contrats suivis, événements assignés."""
+
+    clients: int
+    contracts: int
+    signed_contracts: int
+    unpaid_contracts: int
+    total_amount: Decimal
+    amount_due: Decimal
+    upcoming_events: int
+    past_events: int
 
 
 class EmployeeRepository:
     """Accès aux données Employee (requêtes SQLAlchemy)."""
 
+    # Colonnes triables (chacune adossée à un index)
+    SORTABLE_COLUMNS = {
+        "id": Employee.id,
+        "created_at": Employee.created_at,
+        "last_name": Employee.last_name,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialise le repository avec une session SQLAlchemy."""
         self.session = session
@@ -17,20 +55,156 @@ class EmployeeRepository:
         return self.session.get(Employee, employee_id)
 
     def get_by_email(self, email: str) -> Employee | None:
-        """Retourne un employé par son email."""
+        """Retourne un employé par son email (insensible à la casse)."""
         return (
-            self.session.query(Employee).filter(Employee.email == email).one_or_none()
+            self.session.query(Employee)
+            .filter(func.lower(Employee.email) == email.strip().lower())
+            .one_or_none()
         )
 
-    def list_all(self) -> list[Employee]:
-        """Retourne tous les employés."""
-        return self.session.query(Employee).order_by(Employee.id).all()
+    def list_all(self, *, sort: str | None = None) -> list[Employee]:
+        """Retourne tous les employés (tri optionnel "colonne[:asc|desc]")."""
+        return (
+            self.session.query(Employee)
+            .order_by(*sort_clauses(sort, self.SORTABLE_COLUMNS, Employee.id))
+            .all()
+        )
 
-    def list_by_role(self, role: Role) -> list[Employee]:
-        """Retourne les employés filtrés par rôle."""
+    def list_by_role(self, role: Role, *, sort: str | None = None) -> list[Employee]:
+        """Retourne les employés filtrés par rôle (tri optionnel)."""
         return (
             self.session.query(Employee)
             .filter(Employee.role == role)
-            .order_by(Employee.id)
+            .order_by(*sort_clauses(sort, self.SORTABLE_COLUMNS, Employee.id))
             .all()
         )
+
+    def iter_all(
+        self,
+        role: Role | None = None,
+        *,
+        sort: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Employee]:
+        """Employés (filtre optionnel par rôle), chargés page par page."""
+        stmt = select(Employee)
+        if role is not None:
+            stmt = stmt.where(Employee.role == role)
+        return iter_keyset(
+            self.session,
+            stmt,
+            sort=sort,
+            sortable=self.SORTABLE_COLUMNS,
+            pk=Employee.id,
+            page_size=page_size,
+        )
+
+    def count(self, role: Role | None = None, *, approx: bool = False) -> int:
+        """
+        Compte les employés (filtre optionnel par rôle).
+
+        `approx` retourne une estimation (statistiques PostgreSQL).
+        """
+        conditions = [Employee.role == role] if role is not None else []
+        if approx:
+            stmt = select(Employee.id).where(*conditions)
+            return estimate_count(self.session, stmt, Employee.__table__)
+
+        stmt = select(func.count()).select_from(Employee).where(*conditions)
+        return self.session.scalar(stmt) or 0
+
+    def list_available(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        *,
+        role: Role = Role.SUPPORT,
+    ) -> list[tuple[Employee, int]]:
+        """
+        Employés actifs du rôle donné sans événement chevauchant [period_start,
+        period_end), avec leur charge (événements assignés non terminés).
+
+        Une seule requête : NOT EXISTS sur events (support_contact_id indexé,
+        plage tstzrange) ; tri par charge croissante puis id.
+        """
+        busy = exists().where(
+            Event.support_contact_id == Employee.id,
+            overlaps_period(period_start, period_end),
+        )
+        workload = _workload()
+        stmt = (
+            select(Employee, workload.label("workload"))
+            .where(Employee.role == role, Employee.is_active.is_(True), ~busy)
+            .order_by(workload, Employee.id)
+        )
+        return [(employee, int(load)) for employee, load in self.session.execute(stmt)]
+
+    def get_with_workload(
+        self, employee_id: int
+    ) -> tuple[Employee, EmployeeWorkload] | None:
+        """
+        Retourne l'employé et son portefeuille, en une seule requête.
+
+        Trois agrégats LATERAL, chacun servi par l'index de la clé étrangère
+        (clients / contracts.sales_contact_id, events.support_contact_id).
+        Les événements non terminés (fin > maintenant) sont comptés « à venir ».
+        """
+        clients = (
+            select(func.count().label("clients"))
+            .select_from(Client)
+            .where(Client.sales_contact_id == Employee.id)
+            .lateral("employee_clients")
+        )
+        contracts = (
+            select(
+                func.count().label("contracts"),
+                func.count().filter(Contract.is_signed.is_(True)).label("signed"),
+                func.count().filter(Contract.amount_due > 0).label("unpaid"),
+                func.coalesce(func.sum(Contract.total_amount), 0).label("total"),
+                func.coalesce(func.sum(Contract.amount_due), 0).label("due"),
+            )
+            .where(Contract.sales_contact_id == Employee.id)
+            .lateral("employee_contracts")
+        )
+        events = (
+            select(
+                func.count().filter(Event.end_date > func.now()).label("upcoming"),
+                func.count().filter(Event.end_date <= func.now()).label("past"),
+            )
+            .where(Event.support_contact_id == Employee.id)
+            .lateral("employee_events")
+        )
+        stmt = (
+            select(Employee, clients, contracts, events)
+            .select_from(Employee)
+            .join(clients, true())
+            .join(contracts, true())
+            .join(events, true())
+            .where(Employee.id == employee_id)
+        )
+        row = self.session.execute(stmt).first()
+        if row is None:
+            return None
+
+        employee, *counts = row
+        n_clients, n_contracts, signed, unpaid, total, due, upcoming, past = counts
+        return employee, EmployeeWorkload(
+            clients=n_clients,
+            contracts=n_contracts,
+            signed_contracts=signed,
+            unpaid_contracts=unpaid,
+            total_amount=Decimal(total),
+            amount_due=Decimal(due),
+            upcoming_events=upcoming,
+            past_events=past,
+        )
+
+
+def _workload() -> Any:
+    """Sous-requête corrélée : événements assignés à l'employé et non terminés."""
+    return (
+        select(func.count(Event.id))
+        .where(Event.support_contact_id == Employee.id, Event.end_date > func.now())
+        .correlate(Employee)
+        .scalar_subquery()
+    )
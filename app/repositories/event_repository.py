@@ -1,12 +1,70 @@
 from __future__ import annotations
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
 
-from app.models.event import Event
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Integer,
+    cast,
+    column,
+    exists,
+    func,
+    literal,
+    null,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSTZRANGE, array
+from sqlalchemy.orm import Session, aliased
+
+from app.db.estimates import estimate_count
+from app.models.employee import Employee, Role
+from app.models.event import EVENT_PERIOD, SEARCH_CONFIG, Event
+from app.repositories.guarded import row_exists, update_guarded
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    ListFilters,
+    iter_keyset,
+    sort_clauses,
+)
+
+# Extraits de `events search` : termes trouvés encadrés par des astérisques
+HEADLINE_OPTIONS = (
+    "StartSel=*, StopSel=*, MaxWords=20, MinWords=8, "
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def overlaps_period(
+    period_start: datetime | None, period_end: datetime | None
+) -> ColumnElement[bool]:
+    """
+    Critère "l'événement chevauche [period_start, period_end)".
+
+    Une borne None est ouverte. Écrit sur l'expression de ix_events_period.
+    """
+    period = func.tstzrange(
+        cast(period_start, DateTime(timezone=True)),
+        cast(period_end, DateTime(timezone=True)),
+    )
+    return EVENT_PERIOD.op("&&")(period)
 
 
 class EventRepository:
+    # Colonnes triables (chacune adossée à un index)
+    SORTABLE_COLUMNS = {
+        "id": Event.id,
+        "created_at": Event.created_at,
+        "start_date": Event.start_date,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialise le repository avec une session SQLAlchemy."""
         self.session = session
@@ -16,6 +74,390 @@ class EventRepository:
         stmt = select(Event).order_by(Event.id)
         return list(self.session.scalars(stmt).all())
 
+    def list_filtered(
+        self,
+        *,
+        without_support: bool = False,
+        support_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+    ) -> list[Event]:
+        """
+        Retourne les événements filtrés (sans support / support assigné).
+
+        `filters` ajoute les critères --client-id / --contract-id / --support-id /
+        --created-after et le tri (InvalidSortError si non autorisé).
+        """
+        filters = filters or ListFilters()
+        stmt = (
+            select(Event)
+            .where(*self._conditions(without_support, support_contact_id, filters))
+            .order_by(*sort_clauses(filters.sort, self.SORTABLE_COLUMNS, Event.id))
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def iter_filtered(
+        self,
+        *,
+        without_support: bool = False,
+        support_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Event]:
+        """Comme list_filtered, mais chargé page par page (pagination par clé)."""
+        filters = filters or ListFilters()
+        stmt = select(Event).where(
+            *self._conditions(without_support, support_contact_id, filters)
+        )
+        return iter_keyset(
+            self.session,
+            stmt,
+            sort=filters.sort,
+            sortable=self.SORTABLE_COLUMNS,
+            pk=Event.id,
+            page_size=page_size,
+        )
+
+    def count_filtered(
+        self,
+        *,
+        without_support: bool = False,
+        support_contact_id: int | None = None,
+        filters: ListFilters | None = None,
+        approx: bool = False,
+    ) -> int:
+        """
+        Compte les événements avec les mêmes critères que list_filtered.
+
+        `approx` retourne une estimation (statistiques PostgreSQL) sans parcourir
+        la table.
+        """
+        conditions = self._conditions(
+            without_support, support_contact_id, filters or ListFilters()
+        )
+        if approx:
+            stmt = select(Event.id).where(*conditions)
+            return estimate_count(self.session, stmt, Event.__table__)
+
+        stmt = select(func.count()).select_from(Event).where(*conditions)
+        return self.session.scalar(stmt) or 0
+
+    @staticmethod
+    def _conditions(
+        without_support: bool,
+        support_contact_id: int | None,
+        filters: ListFilters,
+    ) -> list[ColumnElement[bool]]:
+        """Compile la portée et les filtres en critères WHERE."""
+        conditions: list[ColumnElement[bool]] = []
+
+        if without_support:
+            conditions.append(Event.support_contact_id.is_(None))
+
+        if support_contact_id is not None:
+            conditions.append(Event.support_contact_id == support_contact_id)
+
+        if filters.client_id is not None:
+            conditions.append(Event.client_id == filters.client_id)
+
+        if filters.contract_id is not None:
+            conditions.append(Event.contract_id == filters.contract_id)
+
+        if filters.support_contact_id is not None:
+            conditions.append(Event.support_contact_id == filters.support_contact_id)
+
+        if filters.created_after is not None:
+            conditions.append(Event.created_at >= filters.created_after)
+
+        if filters.period_start is not None or filters.period_end is not None:
+            conditions.append(overlaps_period(filters.period_start, filters.period_end))
+
+        return conditions
+
+    def calendar(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        *,
+        unit: str,
+        support_contact_id: int | None = None,
+    ) -> list[tuple[datetime, Event]]:
+        """
+        Retourne les événements de la période [period_start, period_end) avec
+        leur case de calendrier (date_trunc(unit), unit = "day" ou "week").
+
+        Un événement commencé avant la période est rangé dans sa première case.
+        Tri : case, puis début, puis id.
+        """
+        start = cast(period_start, DateTime(timezone=True))
+        bucket = func.date_trunc(unit, func.greatest(Event.start_date, start))
+
+        stmt = select(bucket.label("bucket"), Event).where(
+            overlaps_period(period_start, period_end)
+        )
+        if support_contact_id is not None:
+            stmt = stmt.where(Event.support_contact_id == support_contact_id)
+
+        stmt = stmt.order_by(bucket, Event.start_date, Event.id)
+        return [(day, event) for day, event in self.session.execute(stmt)]
+
+    def search(
+        self,
+        query: str,
+        *,
+        support_contact_id: int | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[Event, float, str]]:
+        """
+        Recherche plein texte dans le lieu et les notes, classée par pertinence.
+
+        La requête (syntaxe websearch : mots, "expression", -exclu, or) est
+        évaluée sur la colonne search_vector (index GIN ix_events_search_vector).
+        Retourne des triplets (événement, score, extrait) : l'extrait surligné
+        (ts_headline) n'est calculé que pour les lignes de la page.
+        """
+        config = cast(SEARCH_CONFIG, REGCONFIG)
+        tsquery = func.websearch_to_tsquery(config, query)
+        rank = func.ts_rank_cd(Event.search_vector, tsquery)
+
+        page = select(Event.id.label("id"), rank.label("rank")).where(
+            Event.search_vector.op("@@")(tsquery)
+        )
+        if support_contact_id is not None:
+            page = page.where(Event.support_contact_id == support_contact_id)
+        page = (
+            page.order_by(rank.desc(), Event.id).limit(limit).offset(offset).subquery()
+        )
+
+        snippet = func.ts_headline(
+            config,
+            func.concat_ws(" — ", Event.location, Event.notes),
+            tsquery,
+            HEADLINE_OPTIONS,
+        )
+        stmt = (
+            select(Event, page.c.rank, snippet)
+            .join(page, page.c.id == Event.id)
+            .order_by(page.c.rank.desc(), Event.id)
+        )
+        return [
+            (event, float(score), headline)
+            for event, score, headline in self.session.execute(stmt)
+        ]
+
+    def list_unassigned_in(
+        self,
+        period_start: datetime | None,
+        period_end: datetime | None,
+        *,
+        lock: bool = False,
+    ) -> list[Event]:
+        """
+        Événements sans support chevauchant la période, par date de début.
+
+        `lock` pose un verrou FOR UPDATE (jusqu'au commit) pour qu'une
+        assignation concurrente ne les modifie pas entre calcul et écriture.
+        """
+        stmt = (
+            select(Event)
+            .where(
+                Event.support_contact_id.is_(None),
+                overlaps_period(period_start, period_end),
+            )
+            .order_by(Event.start_date, Event.id)
+        )
+        if lock:
+            stmt = stmt.with_for_update(of=Event)
+        return list(self.session.scalars(stmt).unique().all())
+
+    def plan_assignments(
+        self, event_ids: list[int]
+    ) -> list[tuple[int, Employee | None]]:
+        """
+        Plan d'assignation équilibré des événements donnés, calculé en SQL.
+
+        CTE récursive : une étape par événement (date de début, puis id), qui
+        choisit par LATERAL le support actif libre le moins chargé (événements
+        non terminés + choix des étapes précédentes, puis id). « Libre » : NOT
+        EXISTS sur ses événements (support_contact_id indexé, plage tstzrange)
+        et sur les créneaux déjà choisis, portés d'une étape à l'autre dans
+        deux tableaux. Retourne (id d'événement, support ou None), dans l'ordre.
+        """
+        period = func.tstzrange(Event.start_date, Event.end_date, type_=TSTZRANGE)
+        pending = (
+            select(
+                Event.id,
+                period.label("period"),
+                func.row_number()
+                .over(order_by=(Event.start_date, Event.id))
+                .label("n"),
+            )
+            .where(Event.id.in_(event_ids))
+            .cte("pending")
+        )
+
+        assigned = aliased(Event)
+        workload = (
+            select(func.count(assigned.id))
+            .where(
+                assigned.support_contact_id == Employee.id,
+                assigned.end_date > func.now(),
+            )
+            .scalar_subquery()
+        )
+        supports = (
+            select(Employee.id, workload.label("load"))
+            .where(Employee.role == Role.SUPPORT, Employee.is_active.is_(True))
+            .cte("supports")
+        )
+
+        plan = select(
+            literal(0, BigInteger).label("n"),
+            cast(null(), Integer).label("event_id"),
+            cast(null(), Integer).label("support_id"),
+            array([], type_=Integer).label("picked"),
+            array([], type_=TSTZRANGE).label("periods"),
+        ).cte("plan", recursive=True)
+
+        busy = (
+            exists()
+            .where(
+                assigned.support_contact_id == supports.c.id,
+                func.tstzrange(assigned.start_date, assigned.end_date).op("&&")(
+                    pending.c.period
+                ),
+            )
+            .correlate(supports, pending)
+        )
+        taken = (
+            func.unnest(plan.c.picked, plan.c.periods)
+            .table_valued(column("support_id", Integer), column("period", TSTZRANGE))
+            .render_derived()
+        )
+        picked_before = (
+            exists()
+            .where(
+                taken.c.support_id == supports.c.id,
+                taken.c.period.op("&&")(pending.c.period),
+            )
+            .correlate(supports, pending, plan)
+        )
+        pick = (
+            select(supports.c.id)
+            .where(~busy, ~picked_before)
+            .order_by(
+                supports.c.load
+                + func.cardinality(func.array_positions(plan.c.picked, supports.c.id)),
+                supports.c.id,
+            )
+            .limit(1)
+            .lateral("pick")
+        )
+        step = select(
+            pending.c.n,
+            pending.c.id,
+            pick.c.id,
+            plan.c.picked.op("||")(pick.c.id),
+            plan.c.periods.op("||")(pending.c.period),
+        ).select_from(
+            plan.join(pending, pending.c.n == plan.c.n + 1).outerjoin(pick, true())
+        )
+        plan = plan.union_all(step)
+
+        stmt = (
+            select(plan.c.event_id, Employee)
+            .outerjoin(Employee, Employee.id == plan.c.support_id)
+            .where(plan.c.n > 0)
+            .order_by(plan.c.n)
+        )
+        return [(event_id, support) for event_id, support in self.session.execute(stmt)]
+
+    def assign_supports(self, assignments: dict[int, int]) -> list[Event]:
+        """
+        Assigne les supports en une seule requête (UPDATE ... FROM (VALUES ...)).
+
+        Seuls les événements encore sans support sont modifiés. Les lignes
+        modifiées sont relues par RETURNING : les objets déjà chargés dans la
+        session (populate_existing) reflètent le support et `updated_at`.
+        """
+        if not assignments:
+            return []
+        pairs = values(
+            column("event_id", Integer),
+            column("support_id", Integer),
+            name="assignments",
+        ).data(list(assignments.items()))
+        stmt = (
+            update(Event)
+            .where(Event.id == pairs.c.event_id, Event.support_contact_id.is_(None))
+            .values(support_contact_id=pairs.c.support_id)
+            .returning(Event)
+            .execution_options(synchronize_session=False)
+        )
+        return list(
+            self.session.scalars(stmt, execution_options={"populate_existing": True})
+        )
+
+    def claim_unassigned(self, support_id: int, count: int) -> list[Event]:
+        """
+        Assigne à `support_id` les prochains événements sans support (file de travail).
+
+        Les candidats (non terminés, sans chevauchement avec les événements du
+        support, par date de début) sont verrouillés par lots avec SELECT ...
+        FOR UPDATE SKIP LOCKED : les lignes déjà prises par une autre
+        transaction sont ignorées sans attente. Dans un lot, ceux qui se
+        chevauchent entre eux ne sont retenus qu'une fois ; le lot suivant
+        (après le dernier candidat, hors créneaux retenus) complète jusqu'à
+        `count` ou jusqu'à épuisement de la file. Un seul UPDATE ... RETURNING
+        assigne ensuite les événements retenus.
+        """
+        own = aliased(Event)
+        conflict = exists().where(
+            own.support_contact_id == support_id,
+            func.tstzrange(own.start_date, own.end_date).op("&&")(EVENT_PERIOD),
+        )
+        base = (
+            select(Event.id, Event.start_date, Event.end_date)
+            .where(
+                Event.support_contact_id.is_(None),
+                Event.end_date > func.now(),
+                ~conflict,
+            )
+            .order_by(Event.start_date, Event.id)
+            .with_for_update(skip_locked=True)
+        )
+
+        picked: list[int] = []
+        taken: list[tuple[datetime, datetime]] = []
+        last: tuple[datetime, int] | None = None
+        while len(picked) < count:
+            wanted = count - len(picked)
+            stmt = base.where(*(~overlaps_period(s, e) for s, e in taken))
+            if last is not None:
+                stmt = stmt.where(tuple_(Event.start_date, Event.id) > tuple_(*last))
+            candidates = self.session.execute(stmt.limit(wanted)).all()
+
+            for event_id, start, end in candidates:
+                if all(end <= s or start >= e for s, e in taken):
+                    picked.append(event_id)
+                    taken.append((start, end))
+            if len(candidates) < wanted:
+                break
+            last = (candidates[-1].start_date, candidates[-1].id)
+
+        if not picked:
+            return []
+        stmt = (
+            update(Event)
+            .where(Event.id.in_(picked))
+            .values(support_contact_id=support_id)
+            .returning(Event)
+        )
+        claimed = self.session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).all()
+        return sorted(claimed, key=lambda ev: (ev.start_date, ev.id))
+
     def list_without_support(self) -> list[Event]:
         """Retourne les événements sans support assigné."""
         stmt = (
@@ -42,3 +484,13 @@ class EventRepository:
         """Retourne un événement par son id."""
         stmt = select(Event).where(Event.id == event_id)
         return self.session.scalars(stmt).first()
+
+    def update_guarded(
+        self, event_id: int, values: dict[str, Any], *guards: ColumnElement[bool]
+    ) -> Event | None:
+        """Met à jour un événement (UPDATE gardé, None si refusé)."""
+        return update_guarded(self.session, Event, event_id, values, *guards)
+
+    def exists(self, event_id: int) -> bool:
+        """Indique si un événement existe (sonde légère, sans jointure)."""
+        return row_exists(self.session, Event, event_id)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, select, update
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+def update_guarded(
+    session: Session,
+    model: type[T],
+    entity_id: int,
+    values: dict[str, Any],
+    *guards: ColumnElement[bool],
+) -> T | None:
+    """
+    Met à jour une ligne de `model` en une seule requête
+    (UPDATE ... WHERE ... RETURNING).
+
+    Les `guards` (ex. règle de propriété) sont ajoutés au WHERE : retourne
+    None si aucune ligne ne correspond (inexistante ou non autorisée). L'objet
+    déjà présent dans la session est rafraîchi avec les valeurs retournées
+    (populate_existing) ; sans valeurs, un simple SELECT gardé est émis.
+    """
+    pk = model.id  # type: ignore[attr-defined]
+    if not values:
+        return session.scalars(select(model).where(pk == entity_id, *guards)).first()
+
+    stmt = update(model).where(pk == entity_id, *guards).values(**values)
+    return session.scalars(
+        stmt.returning(model), execution_options={"populate_existing": True}
+    ).first()
+
+
+def row_exists(session: Session, model: type[Any], entity_id: int) -> bool:
+    """Indique si une ligne de `model` existe (sonde légère, sans jointure)."""
+    pk = model.id
+    return session.scalar(select(pk).where(pk == entity_id)) is not None
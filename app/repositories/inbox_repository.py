@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    Numeric,
+    Select,
+    String,
+    case,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.event import Event
+
+# Types d'éléments de la file de travail
+INBOX_UNSIGNED_CONTRACT = "unsigned_contract"
+INBOX_UNPAID_CONTRACT = "unpaid_contract"
+INBOX_MY_EVENT = "my_event"
+INBOX_UNSTAFFED_EVENT = "unstaffed_event"
+
+# Urgence : 0 = urgent, 1 = bientôt, 2 = plus tard
+URGENT, SOON, LATER = 0, 1, 2
+
+# Événement qui commence dans moins de 7 jours / 30 jours ; contrat ouvert
+# depuis plus de 30 jours / 7 jours
+URGENT_WINDOW = timedelta(days=7)
+SOON_WINDOW = timedelta(days=30)
+
+
+@dataclass(frozen=True)
+class InboxItem:
+    """Élément de la file de travail d'un employé."""
+
+    kind: str
+    urgency: int
+    item_id: int
+    client_name: str
+    date: datetime
+    amount: Decimal | None
+    location: str | None
+
+
+class InboxRepository:
+    """File de travail d'un employé, construite en une seule requête UNION ALL."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialise le repository avec une session SQLAlchemy."""
+        self.session = session
+
+    def items(
+        self, kinds: dict[str, int | None], *, limit: int | None = None
+    ) -> list[InboxItem]:
+        """
+        Éléments des types demandés, du plus urgent au moins urgent.
+
+        `kinds` associe chaque type à l'id de l'employé qui le possède (None :
+        tous les employés). Chaque branche de l'UNION ALL est filtrée sur une
+        clé étrangère indexée ; l'urgence est calculée en SQL (CASE).
+        """
+        branches = [_BRANCHES[kind](owner_id) for kind, owner_id in kinds.items()]
+        if not branches:
+            return []
+
+        inbox = union_all(*branches).subquery("inbox")
+        stmt = select(inbox).order_by(
+            inbox.c.urgency, inbox.c.date, inbox.c.kind, inbox.c.item_id
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [
+            InboxItem(
+                kind=kind,
+                urgency=urgency,
+                item_id=item_id,
+                client_name=client_name,
+                date=date,
+                amount=None if amount is None else Decimal(amount),
+                location=location,
+            )
+            for kind, urgency, item_id, client_name, date, amount, location in (
+                self.session.execute(stmt)
+            )
+        ]
+
+
+def _client_name() -> Any:
+    return func.concat_ws(" ", Client.first_name, Client.last_name)
+
+
+def _upcoming_urgency(date: Any) -> Any:
+    """Urgence d'une échéance : proche = urgent."""
+    return case(
+        (date < func.now() + URGENT_WINDOW, URGENT),
+        (date < func.now() + SOON_WINDOW, SOON),
+        else_=LATER,
+    )
+
+
+def _age_urgency(date: Any) -> Any:
+    """Urgence d'un élément en attente : ancien = urgent."""
+    return case(
+        (date < func.now() - SOON_WINDOW, URGENT),
+        (date < func.now() - URGENT_WINDOW, SOON),
+        else_=LATER,
+    )
+
+
+def _row(
+    kind: str, urgency: Any, item_id: Any, date: Any, amount: Any, location: Any
+) -> tuple[Any, ...]:
+    """Colonnes communes à toutes les branches de l'UNION ALL."""
+    return (
+        literal(kind, String).label("kind"),
+        urgency.label("urgency"),
+        item_id.label("item_id"),
+        _client_name().label("client_name"),
+        date.label("date"),
+        cast(amount, Numeric(12, 2)).label("amount"),
+        cast(location, String).label("location"),
+    )
+
+
+def _unsigned_contracts(owner_id: int | None) -> Select:
+    stmt = (
+        select(
+            *_row(
+                INBOX_UNSIGNED_CONTRACT,
+                _age_urgency(Contract.created_at),
+                Contract.id,
+                Contract.created_at,
+                Contract.total_amount,
+                null(),
+            )
+        )
+        .join(Client, Client.id == Contract.client_id)
+        .where(Contract.is_signed.is_(False))
+    )
+    if owner_id is not None:
+        stmt = stmt.where(Contract.sales_contact_id == owner_id)
+    return stmt
+
+
+def _unpaid_contracts(owner_id: int | None) -> Select:
+    stmt = (
+        select(
+            *_row(
+                INBOX_UNPAID_CONTRACT,
+                _age_urgency(Contract.created_at),
+                Contract.id,
+                Contract.created_at,
+                Contract.amount_due,
+                null(),
+            )
+        )
+        .join(Client, Client.id == Contract.client_id)
+        .where(Contract.is_signed.is_(True), Contract.amount_due > 0)
+    )
+    if owner_id is not None:
+        stmt = stmt.where(Contract.sales_contact_id == owner_id)
+    return stmt
+
+
+def _my_events(owner_id: int | None) -> Select:
+    stmt = (
+        select(
+            *_row(
+                INBOX_MY_EVENT,
+                _upcoming_urgency(Event.start_date),
+                Event.id,
+                Event.start_date,
+                null(),
+                Event.location,
+            )
+        )
+        .join(Client, Client.id == Event.client_id)
+        .where(Event.end_date > func.now())
+    )
+    if owner_id is not None:
+        stmt = stmt.where(Event.support_contact_id == owner_id)
+    else:
+        stmt = stmt.where(Event.support_contact_id.is_not(None))
+    return stmt
+
+
+def _unstaffed_events(owner_id: int | None) -> Select:
+    stmt = (
+        select(
+            *_row(
+                INBOX_UNSTAFFED_EVENT,
+                _upcoming_urgency(Event.start_date),
+                Event.id,
+                Event.start_date,
+                null(),
+                Event.location,
+            )
+        )
+        .join(Client, Client.id == Event.client_id)
+        .where(Event.support_contact_id.is_(None), Event.end_date > func.now())
+    )
+    if owner_id is not None:
+        # Événements des clients dont je suis le commercial
+        stmt = stmt.where(Client.sales_contact_id == owner_id)
+    return stmt
+
+
+_BRANCHES = {
+    INBOX_UNSIGNED_CONTRACT: _unsigned_contracts,
+    INBOX_UNPAID_CONTRACT: _unpaid_contracts,
+    INBOX_MY_EVENT: _my_events,
+    INBOX_UNSTAFFED_EVENT: _unstaffed_events,
+}
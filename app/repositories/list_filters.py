@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import Session
+
+
+class InvalidSortError(ValueError):
+    """Spécification de tri invalide (colonne non autorisée / sens inconnu)."""
+
+
+@dataclass(frozen=True)
+class ListFilters:
+    """
+    Filtres et tri optionnels des commandes `list`.
+
+    Chaque repository n'applique que les critères pertinents pour son entité ;
+    ils sont compilés en clauses WHERE / ORDER BY (aucun filtrage en Python).
+    """
+
+    client_id: int | None = None
+    contract_id: int | None = None
+    sales_contact_id: int | None = None
+    support_contact_id: int | None = None
+    company: str | None = None
+    min_due: Decimal | None = None
+    created_after: datetime | None = None
+    period_start: datetime | None = None
+    period_end: datetime | None = None
+    sort: str | None = None
+
+
+# Taille de page par défaut des parcours incrémentaux (--pager, formats en flux)
+DEFAULT_PAGE_SIZE = 200
+
+
+def parse_sort(sort: str | None, sortable: dict[str, Any], pk: Any) -> tuple[Any, bool]:
+    """
+    Traduit "colonne[:asc|desc]" en (colonne, décroissant).
+
+    Seules les colonnes de `sortable` (adossées à un index) sont acceptées ;
+    sans tri, la clé primaire croissante est utilisée.
+    """
+    if not sort:
+        return pk, False
+
+    name, _, direction = sort.strip().partition(":")
+    name = name.strip().lower()
+    direction = (direction or "asc").strip().lower()
+
+    if name not in sortable:
+        raise InvalidSortError(
+            f"Tri impossible sur {name!r}. "
+            f"Colonnes autorisées : {', '.join(sortable)}."
+        )
+    if direction not in {"asc", "desc"}:
+        raise InvalidSortError(f"Sens de tri invalide : {direction!r} (asc|desc).")
+
+    return sortable[name], direction == "desc"
+
+
+def sort_clauses(sort: str | None, sortable: dict[str, Any], pk: Any) -> list[Any]:
+    """
+    Clauses ORDER BY pour `sort`, la clé primaire servant de second critère
+    (dans le même sens, pour un ordre stable compatible avec la pagination).
+    """
+    column, descending = parse_sort(sort, sortable, pk)
+    if descending:
+        return [column.desc(), pk.desc()]
+    return [column.asc(), pk.asc()]
+
+
+def iter_keyset(
+    session: Session,
+    stmt: Select,
+    *,
+    sort: str | None,
+    sortable: dict[str, Any],
+    pk: Any,
+    page_size: int,
+) -> Iterator[Any]:
+    """
+    Parcourt `stmt` page par page (pagination par clé, sans OFFSET).
+
+    Chaque page reprend après le dernier couple (colonne triée, id) lu :
+    WHERE (col, id) > (:col, :id) ORDER BY col, id LIMIT :page_size. Une page
+    n'est chargée que lorsque la précédente a été consommée. Le tri est validé
+    dès l'appel (InvalidSortError), avant toute lecture.
+    """
+    column, descending = parse_sort(sort, sortable, pk)
+    stmt = stmt.order_by(*sort_clauses(sort, sortable, pk)).limit(page_size)
+    key = tuple_(column, pk)
+
+    def pages() -> Iterator[Any]:
+        last: tuple[Any, Any] | None = None
+        while True:
+            page_stmt = stmt
+            if last is not None:
+                bound = tuple_(*last)
+                page_stmt = stmt.where(key < bound if descending else key > bound)
+
+            rows = session.scalars(page_stmt).all()
+            yield from rows
+
+            if len(rows) < page_size:
+                return
+            tail = rows[-1]
+            last = (getattr(tail, column.key), getattr(tail, pk.key))
+
+    return pages()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Date, cast, exists, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.reports import FINANCIAL_SUMMARY_VIEW, financial_summary
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.models.report_snapshot import ReportSnapshot
+from app.repositories.list_filters import DEFAULT_PAGE_SIZE
+
+# Tranches d'ancienneté des impayés, en jours depuis la création du contrat
+AGING_BUCKETS = ((0, 30), (31, 60), (61, 90), (91, None))
+
+
+@dataclass(frozen=True)
+class SalesPipeline:
+    """Portefeuille de contrats d'un commercial (une ligne de GROUP BY)."""
+
+    employee_id: int
+    full_name: str
+    signed: int
+    unsigned: int
+    total_amount: Decimal
+    amount_due: Decimal
+
+
+@dataclass(frozen=True)
+class SupportLoad:
+    """Événements d'un support : total et non terminés."""
+
+    employee_id: int
+    full_name: str
+    events: int
+    upcoming: int
+
+
+@dataclass(frozen=True)
+class FinancialSummary:
+    """Totaux de contrats d'un client ou d'un commercial (vue matérialisée)."""
+
+    entity_id: int
+    label: str
+    contracts: int
+    signed_contracts: int
+    unpaid_contracts: int
+    total_amount: Decimal
+    amount_due: Decimal
+
+
+@dataclass(frozen=True)
+class AgingRow:
+    """Restant dû d'un client ou d'un commercial, ventilé par ancienneté."""
+
+    entity_id: int
+    label: str
+    contracts: int
+    buckets: tuple[Decimal, ...]
+    amount_due: Decimal
+    oldest_days: int
+    share: Decimal
+
+
+class ReportRepository:
+    """Agrégats de pilotage calculés par PostgreSQL (sans charger les lignes)."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialise le repository avec une session SQLAlchemy."""
+        self.session = session
+
+    def sales_pipeline(self) -> list[SalesPipeline]:
+        """
+        Contrats par commercial actif : signés / non signés, montants totaux et
+        restant dus (0 pour un commercial sans contrat).
+        """
+        signed = func.count(Contract.id).filter(Contract.is_signed.is_(True))
+        unsigned = func.count(Contract.id).filter(Contract.is_signed.is_(False))
+        stmt = (
+            select(
+                Employee.id,
+                Employee.first_name,
+                Employee.last_name,
+                signed,
+                unsigned,
+                func.coalesce(func.sum(Contract.total_amount), 0),
+                func.coalesce(func.sum(Contract.amount_due), 0),
+            )
+            .outerjoin(Contract, Contract.sales_contact_id == Employee.id)
+            .where(Employee.role == Role.SALES, Employee.is_active.is_(True))
+            .group_by(Employee.id)
+            .order_by(
+                func.coalesce(func.sum(Contract.amount_due), 0).desc(), Employee.id
+            )
+        )
+        return [
+            SalesPipeline(
+                employee_id=emp_id,
+                full_name=f"{first} {last}",
+                signed=n_signed,
+                unsigned=n_unsigned,
+                total_amount=Decimal(total),
+                amount_due=Decimal(due),
+            )
+            for emp_id, first, last, n_signed, n_unsigned, total, due in (
+                self.session.execute(stmt)
+            )
+        ]
+
+    def support_load(self) -> list[SupportLoad]:
+        """Événements par support actif (total et non terminés)."""
+        upcoming = func.count(Event.id).filter(Event.end_date > func.now())
+        stmt = (
+            select(
+                Employee.id,
+                Employee.first_name,
+                Employee.last_name,
+                func.count(Event.id),
+                upcoming,
+            )
+            .outerjoin(Event, Event.support_contact_id == Employee.id)
+            .where(Employee.role == Role.SUPPORT, Employee.is_active.is_(True))
+            .group_by(Employee.id)
+            .order_by(upcoming.desc(), Employee.id)
+        )
+        return [
+            SupportLoad(
+                employee_id=emp_id,
+                full_name=f"{first} {last}",
+                events=total,
+                upcoming=n_upcoming,
+            )
+            for emp_id, first, last, total, n_upcoming in self.session.execute(stmt)
+        ]
+
+    def unassigned_upcoming(self) -> tuple[int, int]:
+        """
+        Événements à venir sans support : (total, dans les 7 prochains jours),
+        en un seul parcours.
+        """
+        soon = func.now() + timedelta(days=7)
+        stmt = select(
+            func.count(),
+            func.count().filter(Event.start_date < soon),
+        ).where(Event.support_contact_id.is_(None), Event.end_date > func.now())
+        total, within_week = self.session.execute(stmt).one()
+        return total, within_week
+
+    def clients_without_contract(self) -> int:
+        """Nombre de clients sans aucun contrat (anti-jointure NOT EXISTS)."""
+        has_contract = exists().where(Contract.client_id == Client.id)
+        stmt = select(func.count()).select_from(Client).where(~has_contract)
+        return self.session.scalar(stmt) or 0
+
+    def totals(self) -> tuple[int, int, Decimal, Decimal]:
+        """Tous contrats : (nombre, signés, montant total, restant dû)."""
+        stmt = select(
+            func.count(Contract.id),
+            func.count(Contract.id).filter(Contract.is_signed.is_(True)),
+            func.coalesce(func.sum(Contract.total_amount), 0),
+            func.coalesce(func.sum(Contract.amount_due), 0),
+        )
+        count, signed, total, due = self.session.execute(stmt).one()
+        return count, signed, Decimal(total), Decimal(due)
+
+    def refresh_financial_summary(self, *, concurrently: bool = True) -> datetime:
+        """
+        Recalcule la vue matérialisée et enregistre l'heure du rafraîchissement.
+
+        CONCURRENTLY : les lectures de la vue ne sont pas bloquées pendant le
+        recalcul (s'appuie sur son index unique).
+        """
+        mode = "CONCURRENTLY " if concurrently else ""
+        self.session.execute(
+            text(f"REFRESH MATERIALIZED VIEW {mode}{FINANCIAL_SUMMARY_VIEW}")
+        )
+        stmt = (
+            insert(ReportSnapshot)
+            .values(name=FINANCIAL_SUMMARY_VIEW, refreshed_at=func.now())
+            .on_conflict_do_update(
+                index_elements=[ReportSnapshot.name],
+                set_={"refreshed_at": func.now()},
+            )
+            .returning(ReportSnapshot.refreshed_at)
+        )
+        return self.session.execute(stmt).scalar_one()
+
+    def snapshot_time(self, name: str = FINANCIAL_SUMMARY_VIEW) -> datetime | None:
+        """Heure du dernier rafraîchissement (None : jamais rafraîchie)."""
+        stmt = select(ReportSnapshot.refreshed_at).where(ReportSnapshot.name == name)
+        return self.session.scalar(stmt)
+
+    def financial_by_client(self) -> list[FinancialSummary]:
+        """Totaux par client, lus dans la vue matérialisée (restant dû décroissant)."""
+        label = func.concat_ws(" ", Client.first_name, Client.last_name)
+        return self._financial_rows(
+            financial_summary.c.client_id, label, Client, Client.id
+        )
+
+    def financial_by_sales(self) -> list[FinancialSummary]:
+        """Totaux par commercial, lus dans la vue matérialisée."""
+        label = func.concat_ws(" ", Employee.first_name, Employee.last_name)
+        return self._financial_rows(
+            financial_summary.c.sales_contact_id, label, Employee, Employee.id
+        )
+
+    def _financial_rows(
+        self, key: Any, label: Any, entity: Any, entity_id: Any
+    ) -> list[FinancialSummary]:
+        """Agrège les lignes de la vue par `key`, libellé joint depuis `entity`."""
+        view = financial_summary
+        amount_due = func.sum(view.c.amount_due)
+        stmt = (
+            select(
+                key,
+                label,
+                func.sum(view.c.contracts),
+                func.sum(view.c.signed_contracts),
+                func.sum(view.c.unpaid_contracts),
+                func.sum(view.c.total_amount),
+                amount_due,
+            )
+            .join(entity, entity_id == key)
+            .group_by(key, label)
+            .order_by(amount_due.desc(), key)
+        )
+        return [
+            FinancialSummary(
+                entity_id=row_id,
+                label=row_label,
+                contracts=int(contracts),
+                signed_contracts=int(signed),
+                unpaid_contracts=int(unpaid),
+                total_amount=Decimal(total),
+                amount_due=Decimal(due),
+            )
+            for row_id, row_label, contracts, signed, unpaid, total, due in (
+                self.session.execute(stmt)
+            )
+        ]
+
+    def aging_by_client(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AgingRow]:
+        """Balance âgée des impayés par client (restant dû décroissant)."""
+        label = func.concat_ws(" ", Client.first_name, Client.last_name)
+        return self._aging_rows(
+            Contract.client_id, label, Client, Client.id, page_size=page_size
+        )
+
+    def aging_by_sales(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AgingRow]:
+        """Balance âgée des impayés par commercial du contrat."""
+        label = func.concat_ws(" ", Employee.first_name, Employee.last_name)
+        return self._aging_rows(
+            Contract.sales_contact_id, label, Employee, Employee.id, page_size=page_size
+        )
+
+    def _aging_rows(
+        self, key: Any, label: Any, entity: Any, entity_id: Any, *, page_size: int
+    ) -> Iterator[AgingRow]:
+        """
+        Une seule requête : une colonne par tranche (`sum(...) FILTER (WHERE âge
+        dans la tranche)`), part du restant dû total par fenêtre
+        (`sum(sum(amount_due)) OVER ()`), lue par lots (curseur serveur).
+        """
+        age = func.current_date() - cast(Contract.created_at, Date)
+        due = func.sum(Contract.amount_due)
+        buckets = [
+            func.coalesce(
+                due.filter(age >= low if high is None else age.between(low, high)), 0
+            )
+            for low, high in AGING_BUCKETS
+        ]
+        share = func.round(due * 100 / func.nullif(func.sum(due).over(), 0), 1)
+        stmt = (
+            select(key, label, func.count(Contract.id), *buckets, due, func.max(age))
+            .add_columns(share)
+            .join(entity, entity_id == key)
+            .where(Contract.amount_due > 0)
+            .group_by(key, label)
+            .order_by(due.desc(), key)
+        )
+        result = self.session.execute(stmt, execution_options={"yield_per": page_size})
+        n_buckets = len(AGING_BUCKETS)
+        for row in result:
+            row_id, row_label, contracts = row[:3]
+            amounts = row[3 : 3 + n_buckets]
+            total, oldest, row_share = row[3 + n_buckets :]
+            yield AgingRow(
+                entity_id=row_id,
+                label=row_label,
+                contracts=contracts,
+                buckets=tuple(Decimal(amount) for amount in amounts),
+                amount_due=Decimal(total),
+                oldest_days=int(oldest),
+                share=Decimal(row_share),
+            )
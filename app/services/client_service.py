@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.db.errors import constraint_name
+from app.db.routing import replica_reads
 from app.models.client import Client
 from app.models.contract import Contract
 from app.models.employee import Employee, Role
-from app.repositories.client_repository import ClientRepository
+from app.repositories.client_repository import ClientOverview, ClientRepository
 from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    InvalidSortError,
+    ListFilters,
+)
+from app.services.scopes import SCOPE_MINE, owner_filter, resolve_scope
 
 
 class PermissionDeniedError(Exception):
@@ -27,9 +37,134 @@ class ClientAlreadyExistsError(Exception):
     """Email déjà utilisé par un autre client."""
 
 
-def list_clients(session: Session, current_employee: Employee) -> list[Client]:
+_EMAIL_UNIQUE_CONSTRAINTS = {"uq_clients_email", "uq_clients_email_lower"}
+
+
+# Portée par défaut : un commercial voit son portefeuille
+_DEFAULT_SCOPES = {Role.SALES: SCOPE_MINE}
+
+
+@replica_reads
+def list_clients(
+    session: Session,
+    current_employee: Employee,
+    *,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+) -> list[Client]:
+    """
+    Liste les clients.
+
+    :param scope: "all" ou "mine" (sales_contact_id = moi) ; par défaut selon le rôle.
+    :param filters: filtres / tri complémentaires, appliqués en SQL.
+    """
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="clients")
+
     repo = ClientRepository(session)
-    return repo.list_all()
+    try:
+        return repo.list_filtered(sales_contact_id=owner_id, filters=filters)
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
+
+
+@replica_reads
+def iter_clients(
+    session: Session,
+    current_employee: Employee,
+    *,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Client]:
+    """Comme list_clients, mais chargé page par page au fil de l'itération."""
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="clients")
+
+    repo = ClientRepository(session)
+    try:
+        return repo.iter_filtered(
+            sales_contact_id=owner_id, filters=filters, page_size=page_size
+        )
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
+
+
+@replica_reads
+def count_clients(
+    session: Session,
+    current_employee: Employee,
+    *,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    approx: bool = False,
+) -> int:
+    """
+    Compte les clients (mêmes critères que list_clients) via SELECT count(*).
+
+    :param approx: estimation PostgreSQL instantanée au lieu d'un comptage exact.
+    """
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="clients")
+
+    return ClientRepository(session).count_filtered(
+        sales_contact_id=owner_id, filters=filters, approx=approx
+    )
+
+
+# Taille de page maximale de `clients search`
+SEARCH_MAX_LIMIT = 100
+
+
+@replica_reads
+def search_clients(
+    session: Session,
+    current_employee: Employee,
+    *,
+    query: str,
+    scope: str | None = None,
+    limit: int = 20,
+    page: int = 1,
+) -> list[tuple[Client, float]]:
+    """
+    Recherche des clients par nom, prénom, email ou entreprise.
+
+    Retourne des couples (client, score), du plus pertinent au moins pertinent.
+
+    :param scope: même portée que list_clients.
+    :param page: numéro de page (1 = meilleurs résultats), `limit` résultats par page.
+    """
+    query = (query or "").strip()
+    if not query:
+        raise ValidationError("La recherche ne peut pas être vide.")
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        raise ValidationError(
+            f"La limite doit être comprise entre 1 et {SEARCH_MAX_LIMIT}."
+        )
+    if page < 1:
+        raise ValidationError("Le numéro de page doit être supérieur ou égal à 1.")
+
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="clients")
+
+    return ClientRepository(session).search(
+        query, sales_contact_id=owner_id, limit=limit, offset=(page - 1) * limit
+    )
+
+
+@replica_reads
+def get_client_overview(
+    session: Session, current_employee: Employee, client_id: int
+) -> ClientOverview:
+    """
+    Fiche client : commercial, contrats et événements (avec leur support).
+
+    Lecture ouverte à tous les rôles, comme `clients list`. Une seule requête.
+    """
+    overview = ClientRepository(session).get_overview(client_id)
+    if overview is None:
+        raise NotFoundError("Client introuvable.")
+    return overview
 
 
 def create_client(
@@ -93,51 +228,60 @@ def update_client(
     phone: str | None = None,
     company_name: str | None = None,
 ) -> Client:
-    repo = ClientRepository(session)
-    client = repo.get_by_id(client_id)
-
-    if client is None:
-        raise ValidationError("Client introuvable.")
-
     if current_employee.role == Role.SUPPORT:
         raise PermissionDeniedError("Accès interdit.")
 
-    if (
-        current_employee.role == Role.SALES
-        and client.sales_contact_id != current_employee.id
-    ):
-        raise PermissionDeniedError(
-            "Un commercial ne peut modifier que ses propres clients."
-        )
+    # Validation des valeurs fournies (sans lecture préalable du client)
+    values: dict[str, object] = {}
 
     if first_name is not None:
         first_name = first_name.strip()
         if not first_name:
             raise ValidationError("Le prénom ne peut pas être vide.")
-        client.first_name = first_name
+        values["first_name"] = first_name
 
     if last_name is not None:
         last_name = last_name.strip()
         if not last_name:
             raise ValidationError("Le nom ne peut pas être vide.")
-        client.last_name = last_name
+        values["last_name"] = last_name
 
     if email is not None:
         email = email.strip().lower()
         if not email:
             raise ValidationError("L'email ne peut pas être vide.")
-        existing = repo.get_by_email(email)
-        if existing and existing.id != client.id:
-            raise ClientAlreadyExistsError("Un client avec cet email existe déjà.")
-        client.email = email
+        values["email"] = email
 
     if phone is not None:
-        client.phone = phone.strip() or None
+        values["phone"] = phone.strip() or None
 
     if company_name is not None:
-        client.company_name = company_name.strip() or None
+        values["company_name"] = company_name.strip() or None
+
+    # Règle de propriété portée par le WHERE de l'UPDATE
+    guards = []
+    if current_employee.role == Role.SALES:
+        guards.append(Client.sales_contact_id == current_employee.id)
+
+    # Unicité de l'email : garantie par uq_clients_email(_lower) lors de l'UPDATE
+    repo = ClientRepository(session)
+    try:
+        client = repo.update_guarded(client_id, values, *guards)
+        if client is None:
+            if not repo.exists(client_id):
+                raise ValidationError("Client introuvable.")
+            raise PermissionDeniedError(
+                "Un commercial ne peut modifier que ses propres clients."
+            )
+        session.commit()
+    except IntegrityError as exc:
+        session.rollback()
+        if constraint_name(exc) in _EMAIL_UNIQUE_CONSTRAINTS:
+            raise ClientAlreadyExistsError(
+                "Un client avec cet email existe déjà."
+            ) from exc
+        raise
 
-    session.commit()
     return client
 
 
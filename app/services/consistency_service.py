@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.authorization import AuthorizationError, require_role
+from app.models.employee import Employee, Role
+from app.repositories.consistency_repository import (
+    CHECKS,
+    ConsistencyRepository,
+)
+
+
+class PermissionDeniedError(Exception):
+    """Accès refusé (permissions insuffisantes)."""
+
+
+class ValidationError(Exception):
+    """Données invalides."""
+
+
+# Lignes corrigées par transaction en mode --fix
+DEFAULT_FIX_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class CheckReport:
+    """Résultat d'un contrôle de cohérence."""
+
+    name: str
+    label: str
+    count: int
+    samples: list[int]
+    fixable: bool
+    fixed: int = 0
+
+
+def check_consistency(
+    session: Session,
+    current_employee: Employee,
+    *,
+    fix: bool = False,
+    batch_size: int = DEFAULT_FIX_BATCH_SIZE,
+) -> list[CheckReport]:
+    """
+    Contrôle la cohérence des liens redondants entre tables (MANAGEMENT).
+
+    Les anomalies sont comptées en une requête (anti-jointures). Avec `fix`,
+    les contrôles corrigibles sont traités par lots de `batch_size` lignes,
+    une transaction par lot (verrous courts, reprise possible).
+    """
+    try:
+        require_role(current_employee.role, allowed={Role.MANAGEMENT})
+    except AuthorizationError as exc:
+        raise PermissionDeniedError(str(exc)) from exc
+
+    if batch_size < 1:
+        raise ValidationError("La taille de lot doit être supérieure ou égale à 1.")
+
+    repo = ConsistencyRepository(session)
+    reports = []
+    for result in repo.count(CHECKS):
+        check = result.check
+        fixed = 0
+        if fix and check.fix is not None and result.count:
+            after_id = 0
+            while True:
+                ids = repo.fix_batch(check, after_id=after_id, batch_size=batch_size)
+                session.commit()
+                fixed += len(ids)
+                if len(ids) < batch_size:
+                    break
+                after_id = ids[-1]
+
+        reports.append(
+            CheckReport(
+                name=check.name,
+                label=check.label,
+                count=result.count,
+                samples=result.samples,
+                fixable=check.fix is not None,
+                fixed=fixed,
+            )
+        )
+    return reports
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
+from app.db.errors import translate_check_violations
+from app.db.routing import replica_reads
 from app.models.contract import Contract
 from app.models.employee import Employee, Role
 from app.repositories.client_repository import ClientRepository
 from app.repositories.contract_repository import ContractRepository
 from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    InvalidSortError,
+    ListFilters,
+)
+from app.services.scopes import SCOPE_MINE, owner_filter, resolve_scope
 
 
 class PermissionDeniedError(Exception):
@@ -23,16 +32,107 @@ class NotFoundError(Exception):
     """Entité introuvable."""
 
 
+# Contraintes CHECK de la table contracts -> message métier
+_CHECK_MESSAGES = {
+    "ck_contracts_total_amount_positive": "Le montant total doit être supérieur à 0.",
+    "ck_contracts_amount_due_non_negative": (
+        "Le montant restant ne peut pas être négatif."
+    ),
+    "ck_contracts_amount_due_lte_total": (
+        "Le montant restant ne peut pas dépasser le total."
+    ),
+}
+
+
+# Portée par défaut : un commercial voit ses contrats
+_DEFAULT_SCOPES = {Role.SALES: SCOPE_MINE}
+
+
+@replica_reads
 def list_contracts(
     session: Session,
     current_employee: Employee,
     *,
     unsigned: bool = False,
     unpaid: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
 ) -> list[Contract]:
-    """Liste les contrats, avec filtres optionnels."""
+    """
+    Liste les contrats, avec filtres optionnels.
+
+    :param scope: "all" ou "mine" (sales_contact_id = moi) ; par défaut selon le rôle.
+    :param filters: filtres / tri complémentaires, appliqués en SQL.
+    """
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="contracts")
+
+    repo = ContractRepository(session)
+    try:
+        return repo.list_filtered(
+            unsigned=unsigned,
+            unpaid=unpaid,
+            sales_contact_id=owner_id,
+            filters=filters,
+        )
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
+
+
+@replica_reads
+def iter_contracts(
+    session: Session,
+    current_employee: Employee,
+    *,
+    unsigned: bool = False,
+    unpaid: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Contract]:
+    """Comme list_contracts, mais chargé page par page au fil de l'itération."""
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="contracts")
+
     repo = ContractRepository(session)
-    return repo.list_filtered(unsigned=unsigned, unpaid=unpaid)
+    try:
+        return repo.iter_filtered(
+            unsigned=unsigned,
+            unpaid=unpaid,
+            sales_contact_id=owner_id,
+            filters=filters,
+            page_size=page_size,
+        )
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
+
+
+@replica_reads
+def count_contracts(
+    session: Session,
+    current_employee: Employee,
+    *,
+    unsigned: bool = False,
+    unpaid: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    approx: bool = False,
+) -> int:
+    """
+    Compte les contrats (mêmes critères que list_contracts) via SELECT count(*).
+
+    :param approx: estimation PostgreSQL instantanée au lieu d'un comptage exact.
+    """
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="contracts")
+
+    return ContractRepository(session).count_filtered(
+        unsigned=unsigned,
+        unpaid=unpaid,
+        sales_contact_id=owner_id,
+        filters=filters,
+        approx=approx,
+    )
 
 
 def create_contract(
@@ -80,7 +180,8 @@ def create_contract(
 
     repo = ContractRepository(session)
     repo.add(contract)
-    session.commit()
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        session.commit()
 
     return contract
 
@@ -102,17 +203,17 @@ def sign_contract(
     if current_employee.role != Role.MANAGEMENT:
         raise PermissionDeniedError("Seuls les managers peuvent signer un contrat.")
 
+    # UPDATE ... WHERE is_signed = false RETURNING : une seule requête
     repo = ContractRepository(session)
-    contract = repo.get_by_id(contract_id)
+    contract = repo.update_guarded(
+        contract_id, {"is_signed": True}, Contract.is_signed.is_(False)
+    )
     if contract is None:
-        raise NotFoundError("Contrat introuvable.")
-
-    if contract.is_signed:
+        if not repo.exists(contract_id):
+            raise NotFoundError("Contrat introuvable.")
         raise ValidationError("Le contrat est déjà signé.")
 
-    contract.is_signed = True
     session.commit()
-
     return contract
 
 
@@ -140,40 +241,44 @@ def update_contract(
             "Seuls les commerciaux et les managers peuvent modifier un contrat."
         )
 
-    repo = ContractRepository(session)
-    contract = repo.get_by_id(contract_id)
-    if contract is None:
-        raise NotFoundError("Contrat introuvable.")
-
-    if (
-        current_employee.role == Role.SALES
-        and contract.sales_contact_id != current_employee.id
-    ):
-        raise PermissionDeniedError(
-            "Un commercial ne peut modifier que ses propres contrats."
-        )
-
-    # Nettoyage/validation des valeurs fournies
+    # Validation des valeurs fournies (sans lecture préalable du contrat)
     if total_amount is not None and total_amount <= 0:
         raise ValidationError("Le montant total doit être supérieur à 0.")
 
     if amount_due is not None and amount_due < 0:
         raise ValidationError("Le montant restant ne peut pas être négatif.")
 
-    # Calcul des valeurs finales pour vérifier la cohérence
-    final_total = total_amount if total_amount is not None else contract.total_amount
-    final_due = amount_due if amount_due is not None else contract.amount_due
-
-    if final_due > final_total:
+    if (
+        total_amount is not None
+        and amount_due is not None
+        and amount_due > total_amount
+    ):
         raise ValidationError("Le montant restant ne peut pas dépasser le total.")
 
-    # Application des modifications
+    values: dict[str, object] = {}
     if total_amount is not None:
-        contract.total_amount = total_amount
+        values["total_amount"] = total_amount
     if amount_due is not None:
-        contract.amount_due = amount_due
+        values["amount_due"] = amount_due
+
+    # Règle de propriété portée par le WHERE de l'UPDATE
+    guards = []
+    if current_employee.role == Role.SALES:
+        guards.append(Contract.sales_contact_id == current_employee.id)
+
+    # amount_due <= total_amount sur les valeurs finales : garanti par
+    # ck_contracts_amount_due_lte_total lors de l'UPDATE
+    repo = ContractRepository(session)
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        contract = repo.update_guarded(contract_id, values, *guards)
+        if contract is None:
+            if not repo.exists(contract_id):
+                raise NotFoundError("Contrat introuvable.")
+            raise PermissionDeniedError(
+                "Un commercial ne peut modifier que ses propres contrats."
+            )
+        session.commit()
 
-    session.commit()
     return contract
 
 
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from app.core.authorization import AuthorizationError, require_role
+from app.db.routing import replica_reads
+from app.models.employee import Employee, Role
+from app.repositories.report_repository import (
+    ReportRepository,
+    SalesPipeline,
+    SupportLoad,
+)
+
+
+class PermissionDeniedError(Exception):
+    """Accès refusé (permissions insuffisantes)."""
+
+
+@dataclass(frozen=True)
+class Dashboard:
+    """Indicateurs du tableau de bord management."""
+
+    contracts: int
+    signed_contracts: int
+    total_amount: Decimal
+    amount_due: Decimal
+    sales: list[SalesPipeline]
+    supports: list[SupportLoad]
+    unassigned_upcoming: int
+    unassigned_within_week: int
+    clients_without_contract: int
+
+
+@replica_reads
+def build_dashboard(session: Session, current_employee: Employee) -> Dashboard:
+    """
+    Calcule le tableau de bord (MANAGEMENT uniquement).
+
+    Chaque indicateur est un agrégat PostgreSQL (GROUP BY / count FILTER) :
+    cinq requêtes au total, quel que soit le volume de contrats et d'événements.
+    """
+    try:
+        require_role(current_employee.role, allowed={Role.MANAGEMENT})
+    except AuthorizationError as exc:
+        raise PermissionDeniedError(str(exc)) from exc
+
+    repo = ReportRepository(session)
+    contracts, signed, total_amount, amount_due = repo.totals()
+    unassigned, within_week = repo.unassigned_upcoming()
+
+    return Dashboard(
+        contracts=contracts,
+        signed_contracts=signed,
+        total_amount=total_amount,
+        amount_due=amount_due,
+        sales=repo.sales_pipeline(),
+        supports=repo.support_load(),
+        unassigned_upcoming=unassigned,
+        unassigned_within_week=within_week,
+        clients_without_contract=repo.clients_without_contract(),
+    )
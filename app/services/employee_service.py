@@ -6,11 +6,12 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.authorization import AuthorizationError, require_role
+from app.db.routing import replica_reads
 from app.models.client import Client
 from app.models.contract import Contract
 from app.models.employee import Employee, Role
 from app.models.event import Event
-from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.employee_repository import EmployeeRepository, EmployeeWorkload
 
 
 class NotFoundError(Exception):
@@ -25,6 +26,29 @@ class ValidationError(Exception):
     """Données invalides / action impossible."""
 
 
+@replica_reads
+def employee_workload(
+    session: Session,
+    current_employee: Employee,
+    employee_id: int,
+) -> tuple[Employee, EmployeeWorkload]:
+    """
+    Fiche d'un employé et de son portefeuille (avant réassignation ou
+    désactivation).
+    - MANAGEMENT uniquement
+    - une seule requête d'agrégats
+    """
+    try:
+        require_role(current_employee.role, allowed={Role.MANAGEMENT})
+    except AuthorizationError as exc:
+        raise PermissionDeniedError(str(exc)) from exc
+
+    result = EmployeeRepository(session).get_with_workload(employee_id)
+    if result is None:
+        raise NotFoundError("Employé introuvable.")
+    return result
+
+
 def deactivate_employee(
     session: Session,
     current_employee: Employee,
@@ -57,7 +81,6 @@ def deactivate_employee(
     employee.reactivated_at = None
 
     session.commit()
-    session.refresh(employee)
     return employee
 
 
@@ -89,7 +112,6 @@ def reactivate_employee(
     employee.reactivated_at = datetime.now(timezone.utc)
 
     session.commit()
-    session.refresh(employee)
     return employee
 
 
@@ -153,3 +175,27 @@ def hard_delete_employee(
 
     session.delete(employee)
     session.commit()
+
+
+@replica_reads
+def available_employees(
+    session: Session,
+    current_employee: Employee,
+    *,
+    period_start: datetime,
+    period_end: datetime,
+    role: Role = Role.SUPPORT,
+) -> list[tuple[Employee, int]]:
+    """
+    Employés actifs libres sur la période [period_start, period_end).
+
+    Retourne des couples (employé, charge), la charge étant le nombre
+    d'événements assignés non terminés ; les moins chargés d'abord.
+    - période obligatoire, début < fin
+    """
+    if period_start >= period_end:
+        raise ValidationError("Le début de période doit précéder sa fin.")
+
+    return EmployeeRepository(session).list_available(
+        period_start, period_end, role=role
+    )
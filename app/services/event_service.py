@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import datetime, time, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.db.errors import translate_check_violations
+from app.db.routing import replica_reads
 from app.models.employee import Employee, Role
 from app.models.event import Event
 from app.repositories.client_repository import ClientRepository
 from app.repositories.contract_repository import ContractRepository
 from app.repositories.employee_repository import EmployeeRepository
 from app.repositories.event_repository import EventRepository
+from app.repositories.list_filters import (
+    DEFAULT_PAGE_SIZE,
+    InvalidSortError,
+    ListFilters,
+)
+from app.services.scopes import SCOPE_ALL, SCOPE_MINE, owner_filter, resolve_scope
 
 
 class PermissionDeniedError(Exception):
@@ -24,32 +33,327 @@ class NotFoundError(Exception):
     """Entité introuvable."""
 
 
+# Contraintes CHECK / EXCLUDE de la table events -> message métier
+_CHECK_MESSAGES = {
+    "ck_events_start_before_end": (
+        "La date de début doit être antérieure à la date de fin."
+    ),
+    "ck_events_attendees_non_negative": (
+        "Le nombre de participants ne peut pas être négatif."
+    ),
+    "ex_events_support_no_overlap": (
+        "Ce support est déjà assigné à un autre événement sur ce créneau."
+    ),
+}
+
+
+# Portée par défaut : un support voit les événements qui lui sont assignés
+_DEFAULT_SCOPES = {Role.SUPPORT: SCOPE_MINE}
+
+
+@replica_reads
 def list_events(
     session: Session,
     current_employee: Employee,
     *,
     without_support: bool = False,
     assigned_to_me: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
 ) -> list[Event]:
     """
     Liste les événements accessibles à l'utilisateur courant.
 
     :param without_support: si True, retourne uniquement les événements sans support assigné.
     :param assigned_to_me: si True, retourne uniquement les événements assignés à l'utilisateur courant.
+    :param scope: "all" ou "mine" (support_contact_id = moi) ; par défaut selon le rôle,
+        sauf avec without_support qui porte sur tous les événements.
+    :param filters: filtres / tri complémentaires, appliqués en SQL.
     """
-    repo = EventRepository(session)
+    _check_period(filters)
+    scope = _resolve_event_scope(
+        current_employee, without_support, assigned_to_me, scope
+    )
 
     # Combinaison impossible (un event ne peut pas être "sans support" ET "assigné à moi")
-    if without_support and assigned_to_me:
+    if without_support and scope == SCOPE_MINE:
         return []
 
-    if assigned_to_me:
-        return repo.list_assigned_to(current_employee.id)
+    owner_id = owner_filter(session, current_employee, scope, table="events")
+
+    repo = EventRepository(session)
+    try:
+        return repo.list_filtered(
+            without_support=without_support,
+            support_contact_id=owner_id,
+            filters=filters,
+        )
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
 
-    if without_support:
-        return repo.list_without_support()
 
-    return repo.list_all()
+@replica_reads
+def iter_events(
+    session: Session,
+    current_employee: Employee,
+    *,
+    without_support: bool = False,
+    assigned_to_me: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Event]:
+    """Comme list_events, mais chargé page par page au fil de l'itération."""
+    _check_period(filters)
+    scope = _resolve_event_scope(
+        current_employee, without_support, assigned_to_me, scope
+    )
+    if without_support and scope == SCOPE_MINE:
+        return iter(())
+
+    owner_id = owner_filter(session, current_employee, scope, table="events")
+
+    repo = EventRepository(session)
+    try:
+        return repo.iter_filtered(
+            without_support=without_support,
+            support_contact_id=owner_id,
+            filters=filters,
+            page_size=page_size,
+        )
+    except InvalidSortError as exc:
+        raise ValidationError(str(exc)) from exc
+
+
+@replica_reads
+def count_events(
+    session: Session,
+    current_employee: Employee,
+    *,
+    without_support: bool = False,
+    assigned_to_me: bool = False,
+    scope: str | None = None,
+    filters: ListFilters | None = None,
+    approx: bool = False,
+) -> int:
+    """
+    Compte les événements (mêmes critères que list_events) via SELECT count(*).
+
+    :param approx: estimation PostgreSQL instantanée au lieu d'un comptage exact.
+    """
+    _check_period(filters)
+    scope = _resolve_event_scope(
+        current_employee, without_support, assigned_to_me, scope
+    )
+    if without_support and scope == SCOPE_MINE:
+        return 0
+
+    owner_id = owner_filter(session, current_employee, scope, table="events")
+
+    return EventRepository(session).count_filtered(
+        without_support=without_support,
+        support_contact_id=owner_id,
+        filters=filters,
+        approx=approx,
+    )
+
+
+# Taille de page maximale de `events search`
+SEARCH_MAX_LIMIT = 100
+
+
+@replica_reads
+def search_events(
+    session: Session,
+    current_employee: Employee,
+    *,
+    query: str,
+    scope: str | None = None,
+    limit: int = 20,
+    page: int = 1,
+) -> list[tuple[Event, float, str]]:
+    """
+    Recherche plein texte dans le lieu et les notes des événements.
+
+    Retourne des triplets (événement, score, extrait surligné), du plus
+    pertinent au moins pertinent.
+
+    :param scope: même portée que list_events.
+    :param page: numéro de page (1 = meilleurs résultats), `limit` résultats par page.
+    """
+    query = (query or "").strip()
+    if not query:
+        raise ValidationError("La recherche ne peut pas être vide.")
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        raise ValidationError(
+            f"La limite doit être comprise entre 1 et {SEARCH_MAX_LIMIT}."
+        )
+    if page < 1:
+        raise ValidationError("Le numéro de page doit être supérieur ou égal à 1.")
+
+    scope = resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
+    owner_id = owner_filter(session, current_employee, scope, table="events")
+
+    return EventRepository(session).search(
+        query, support_contact_id=owner_id, limit=limit, offset=(page - 1) * limit
+    )
+
+
+# Cases du calendrier et étendue par défaut de la période affichée
+CALENDAR_UNITS = ("day", "week")
+_CALENDAR_DEFAULT_SPANS = {"day": timedelta(days=7), "week": timedelta(weeks=4)}
+
+
+@replica_reads
+def calendar_events(
+    session: Session,
+    current_employee: Employee,
+    *,
+    period_start: datetime | None = None,
+    period_end: datetime | None = None,
+    unit: str = "day",
+    assigned_to_me: bool = False,
+    scope: str | None = None,
+) -> list[tuple[datetime, list[Event]]]:
+    """
+    Regroupe par jour ou par semaine les événements d'une période.
+
+    :param period_start: début de période (défaut : aujourd'hui, 00:00).
+    :param period_end: fin de période, exclue (défaut : 7 jours, ou 4 semaines
+        en vue "week", après le début).
+    :param unit: "day" ou "week".
+    :return: liste (début de case, événements de la case), dans l'ordre.
+    """
+    if unit not in CALENDAR_UNITS:
+        raise ValidationError(
+            f"Unité de calendrier invalide : {unit!r} ({', '.join(CALENDAR_UNITS)})."
+        )
+
+    if period_start is None:
+        period_start = datetime.combine(datetime.now().date(), time.min)
+    if period_end is None:
+        period_end = period_start + _CALENDAR_DEFAULT_SPANS[unit]
+    _check_period(ListFilters(period_start=period_start, period_end=period_end))
+
+    scope = _resolve_event_scope(current_employee, False, assigned_to_me, scope)
+    owner_id = owner_filter(session, current_employee, scope, table="events")
+
+    buckets: list[tuple[datetime, list[Event]]] = []
+    for bucket, event in EventRepository(session).calendar(
+        period_start, period_end, unit=unit, support_contact_id=owner_id
+    ):
+        if not buckets or buckets[-1][0] != bucket:
+            buckets.append((bucket, []))
+        buckets[-1][1].append(event)
+    return buckets
+
+
+def auto_assign_events(
+    session: Session,
+    current_employee: Employee,
+    *,
+    period_start: datetime | None = None,
+    period_end: datetime | None = None,
+    dry_run: bool = False,
+) -> list[tuple[Event, Employee | None]]:
+    """
+    Assigne un support à chaque événement sans support de la période.
+
+    Règles :
+    - MANAGEMENT uniquement
+    - supports actifs uniquement, jamais sur deux créneaux qui se chevauchent
+    - répartition équilibrée : à chaque événement (par date de début), le support
+      libre le moins chargé (événements non terminés, puis id)
+
+    Le plan est calculé en SQL (EventRepository.plan_assignments, une étape
+    de CTE récursive par événement) sur les événements verrouillés, puis écrit
+    par un seul UPDATE ... FROM (VALUES ...) et un seul commit. Avec `dry_run`,
+    rien n'est écrit. Retourne le plan (événement, support ou None si personne
+    n'est libre).
+    """
+    if current_employee.role != Role.MANAGEMENT:
+        raise PermissionDeniedError(
+            "Seul le management peut assigner automatiquement les événements."
+        )
+    _check_period(ListFilters(period_start=period_start, period_end=period_end))
+
+    events = EventRepository(session).list_unassigned_in(
+        period_start, period_end, lock=not dry_run
+    )
+    if not events:
+        return []
+
+    by_id = {event.id: event for event in events}
+    plan = [
+        (by_id[event_id], support)
+        for event_id, support in EventRepository(session).plan_assignments(list(by_id))
+    ]
+
+    if dry_run:
+        return plan
+
+    # Une écriture concurrente sur un créneau calculé comme libre est refusée
+    # par ex_events_support_no_overlap (ValidationError, rien n'est assigné)
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        EventRepository(session).assign_supports(
+            {event.id: support.id for event, support in plan if support is not None}
+        )
+        session.commit()
+    return plan
+
+
+# Nombre maximal d'événements pris en une fois par `events claim`
+CLAIM_MAX_COUNT = 20
+
+
+def claim_events(
+    session: Session, current_employee: Employee, *, count: int = 1
+) -> list[Event]:
+    """
+    Prend en charge les prochains événements sans support (par date de début).
+
+    Règles :
+    - SUPPORT uniquement ; les événements sont assignés à l'utilisateur courant
+    - `count` événements non terminés, sans chevauchement avec ses autres
+      événements ni entre eux (moins seulement si la file n'en a plus)
+    - plusieurs supports peuvent réclamer en parallèle : les lignes verrouillées
+      par un autre sont sautées (SKIP LOCKED), jamais assignées deux fois
+    """
+    if current_employee.role != Role.SUPPORT:
+        raise PermissionDeniedError(
+            "Seuls les supports peuvent prendre en charge des événements."
+        )
+    if not 1 <= count <= CLAIM_MAX_COUNT:
+        raise ValidationError(
+            f"Le nombre d'événements doit être compris entre 1 et {CLAIM_MAX_COUNT}."
+        )
+
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        claimed = EventRepository(session).claim_unassigned(current_employee.id, count)
+        session.commit()
+    return claimed
+
+
+def _check_period(filters: ListFilters | None) -> None:
+    """Refuse une période vide ou inversée (--from postérieur à --to)."""
+    if filters is None or filters.period_start is None or filters.period_end is None:
+        return
+    if filters.period_start >= filters.period_end:
+        raise ValidationError("Le début de période doit précéder sa fin.")
+
+
+def _resolve_event_scope(
+    current_employee: Employee,
+    without_support: bool,
+    assigned_to_me: bool,
+    scope: str | None,
+) -> str:
+    """Portée effective : --assigned-to-me force "mine", --without-support "all"."""
+    if assigned_to_me:
+        scope = SCOPE_MINE
+    elif scope is None and without_support:
+        scope = SCOPE_ALL
+    return resolve_scope(scope, current_employee.role, _DEFAULT_SCOPES)
 
 
 def create_event(
@@ -117,7 +421,8 @@ def create_event(
 
     repo = EventRepository(session)
     repo.add(event)
-    session.commit()
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        session.commit()
 
     return event
 
@@ -136,6 +441,7 @@ def reassign_event(
     - MANAGEMENT uniquement
     - l'événement doit exister
     - l'employé support doit exister, être ROLE.SUPPORT, et être actif
+    - le support ne doit pas déjà couvrir un événement qui chevauche celui-ci
     """
     if current_employee.role != Role.MANAGEMENT:
         raise PermissionDeniedError("Seul le management peut réassigner un événement.")
@@ -156,8 +462,11 @@ def reassign_event(
     if not support.is_active:
         raise ValidationError("Impossible d'assigner un employé désactivé.")
 
+    # Chevauchement avec un autre événement du support : vérifié par
+    # ex_events_support_no_overlap lors de l'écriture
     event.support_contact_id = support_contact_id
-    session.commit()
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        session.commit()
     return event
 
 
@@ -203,6 +512,7 @@ def update_event(
     - start_date < end_date
     - attendees >= 0
     - location non vide si fourni
+    - pas de chevauchement avec un autre événement du même support
     - assignation support : MANAGEMENT uniquement (via reassign_event)
     """
     if current_employee.role == Role.SALES:
@@ -210,17 +520,6 @@ def update_event(
             "Les commerciaux ne peuvent pas modifier un événement."
         )
 
-    repo = EventRepository(session)
-    event = repo.get_by_id(event_id)
-    if event is None:
-        raise NotFoundError("Événement introuvable.")
-
-    if current_employee.role == Role.SUPPORT:
-        if event.support_contact_id != current_employee.id:
-            raise PermissionDeniedError(
-                "Vous ne pouvez modifier que les événements qui vous sont assignés."
-            )
-
     # Si on veut assigner/réassigner un support depuis update_event :
     # on délègue à reassign_event pour éviter la duplication des règles.
     if support_contact_id is not None:
@@ -231,11 +530,8 @@ def update_event(
             support_contact_id=support_contact_id,
         )
 
-    # Validations + valeurs finales
-    final_start = start_date if start_date is not None else event.start_date
-    final_end = end_date if end_date is not None else event.end_date
-
-    if final_start >= final_end:
+    # Validations des valeurs fournies (sans lecture préalable de l'événement)
+    if start_date is not None and end_date is not None and start_date >= end_date:
         raise ValidationError("La date de début doit être antérieure à la date de fin.")
 
     if attendees is not None and attendees < 0:
@@ -244,17 +540,34 @@ def update_event(
     if location is not None and not location.strip():
         raise ValidationError("Le lieu est requis.")
 
-    # Application des modifications
+    values: dict[str, object] = {}
     if start_date is not None:
-        event.start_date = start_date
+        values["start_date"] = start_date
     if end_date is not None:
-        event.end_date = end_date
+        values["end_date"] = end_date
     if location is not None:
-        event.location = location.strip()
+        values["location"] = location.strip()
     if attendees is not None:
-        event.attendees = attendees
+        values["attendees"] = attendees
     if notes is not None:
-        event.notes = notes.strip() or None
+        values["notes"] = notes.strip() or None
+
+    # Règle d'assignation portée par le WHERE de l'UPDATE
+    guards = []
+    if current_employee.role == Role.SUPPORT:
+        guards.append(Event.support_contact_id == current_employee.id)
+
+    # start_date < end_date sur les valeurs finales : garanti par
+    # ck_events_start_before_end lors de l'UPDATE
+    repo = EventRepository(session)
+    with translate_check_violations(session, _CHECK_MESSAGES, error=ValidationError):
+        event = repo.update_guarded(event_id, values, *guards)
+        if event is None:
+            if not repo.exists(event_id):
+                raise NotFoundError("Événement introuvable.")
+            raise PermissionDeniedError(
+                "Vous ne pouvez modifier que les événements qui vous sont assignés."
+            )
+        session.commit()
 
-    session.commit()
     return event
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.db.routing import replica_reads
+from app.models.employee import Employee, Role
+from app.repositories.inbox_repository import (
+    INBOX_MY_EVENT,
+    INBOX_UNPAID_CONTRACT,
+    INBOX_UNSIGNED_CONTRACT,
+    INBOX_UNSTAFFED_EVENT,
+    InboxItem,
+    InboxRepository,
+)
+
+
+class ValidationError(Exception):
+    """Données invalides."""
+
+
+def _inbox_kinds(employee: Employee) -> dict[str, int | None]:
+    """Types d'éléments suivis par rôle, associés à l'employé propriétaire."""
+    if employee.role == Role.SALES:
+        return {
+            INBOX_UNSIGNED_CONTRACT: employee.id,
+            INBOX_UNPAID_CONTRACT: employee.id,
+            INBOX_UNSTAFFED_EVENT: employee.id,
+        }
+    if employee.role == Role.SUPPORT:
+        return {INBOX_MY_EVENT: employee.id}
+    # MANAGEMENT : événements à venir sans support, tous clients confondus
+    return {INBOX_UNSTAFFED_EVENT: None}
+
+
+@replica_reads
+def build_inbox(
+    session: Session, current_employee: Employee, *, limit: int | None = None
+) -> list[InboxItem]:
+    """
+    File de travail de l'employé connecté, du plus urgent au moins urgent.
+
+    - SALES : contrats non signés, contrats signés avec un restant dû, et
+      événements à venir sans support de ses clients
+    - SUPPORT : ses événements à venir ou en cours
+    - MANAGEMENT : événements à venir sans support
+    Une seule requête (UNION ALL des branches du rôle).
+    """
+    if limit is not None and limit < 1:
+        raise ValidationError("La limite doit être supérieure ou égale à 1.")
+
+    return InboxRepository(session).items(_inbox_kinds(current_employee), limit=limit)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.core.authorization import AuthorizationError, require_role
+from app.db.routing import replica_reads
+from app.models.employee import Employee, Role
+from app.repositories.list_filters import DEFAULT_PAGE_SIZE
+from app.repositories.report_repository import (
+    AgingRow,
+    FinancialSummary,
+    ReportRepository,
+)
+
+
+class PermissionDeniedError(Exception):
+    """Accès refusé (permissions insuffisantes)."""
+
+
+class ValidationError(Exception):
+    """Données invalides."""
+
+
+# Regroupements disponibles pour le rapport financier
+FINANCIAL_GROUPS = ("client", "sales")
+
+
+def _require_management(current_employee: Employee) -> None:
+    try:
+        require_role(current_employee.role, allowed={Role.MANAGEMENT})
+    except AuthorizationError as exc:
+        raise PermissionDeniedError(str(exc)) from exc
+
+
+def refresh_reports(
+    session: Session, current_employee: Employee, *, concurrently: bool = True
+) -> datetime:
+    """
+    Rafraîchit les vues de reporting (MANAGEMENT uniquement).
+
+    Retourne l'heure du nouvel instantané. Prévu pour être lancé à la demande
+    ou planifié (cron) ; avec `concurrently`, les rapports restent lisibles
+    pendant le recalcul.
+    """
+    _require_management(current_employee)
+
+    refreshed_at = ReportRepository(session).refresh_financial_summary(
+        concurrently=concurrently
+    )
+    session.commit()
+    return refreshed_at
+
+
+@replica_reads
+def financial_report(
+    session: Session, current_employee: Employee, *, by: str = "client"
+) -> tuple[list[FinancialSummary], datetime | None]:
+    """
+    Totaux de contrats par client ou par commercial, lus dans l'instantané.
+
+    Retourne (lignes, heure de l'instantané ou None s'il n'a jamais été
+    rafraîchi). Les chiffres n'incluent pas les contrats modifiés depuis.
+    """
+    _require_management(current_employee)
+    _check_group(by)
+
+    repo = ReportRepository(session)
+    rows = repo.financial_by_client() if by == "client" else repo.financial_by_sales()
+    return rows, repo.snapshot_time()
+
+
+@replica_reads
+def aging_report(
+    session: Session,
+    current_employee: Employee,
+    *,
+    by: str = "client",
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[AgingRow]:
+    """
+    Balance âgée des contrats impayés, par client ou par commercial.
+
+    Calculée en direct sur les contrats (âge depuis la création), en une seule
+    requête ; les lignes sont lues par lots de `page_size` au fil du rendu.
+    """
+    _require_management(current_employee)
+    _check_group(by)
+
+    repo = ReportRepository(session)
+    if by == "client":
+        return repo.aging_by_client(page_size=page_size)
+    return repo.aging_by_sales(page_size=page_size)
+
+
+def _check_group(by: str) -> None:
+    if by not in FINANCIAL_GROUPS:
+        raise ValidationError(
+            f"Regroupement invalide : {by!r} ({', '.join(FINANCIAL_GROUPS)})."
+        )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.core.authorization import AuthorizationError, require_role
+from app.db.rls import apply_rls_mode, missing_scope_roles
+from app.models.employee import Employee, Role
+
+
+class PermissionDeniedError(Exception):
+    """Accès refusé (permissions insuffisantes)."""
+
+
+class ValidationError(Exception):
+    """Données invalides."""
+
+
+def set_rls_mode(
+    session: Session, current_employee: Employee, *, enabled: bool
+) -> None:
+    """
+    Pose (ou retire) les policies du mode RLS — MANAGEMENT uniquement.
+
+    À lancer avec le compte propriétaire des tables, une fois les rôles de
+    portée créés par un administrateur ; l'application ne s'en sert qu'avec
+    EPICCRM_RLS=true. Sans mode RLS, aucune policy n'est évaluée.
+    """
+    try:
+        require_role(current_employee.role, allowed={Role.MANAGEMENT})
+    except AuthorizationError as exc:
+        raise PermissionDeniedError(str(exc)) from exc
+
+    if enabled:
+        missing = missing_scope_roles(session)
+        if missing:
+            raise ValidationError(
+                f"Rôles PostgreSQL manquants : {', '.join(missing)} "
+                "(à créer par un administrateur, voir docs/database.md)."
+            )
+
+    apply_rls_mode(session, enabled=enabled)
+    session.commit()
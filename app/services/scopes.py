@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.db.rls import rls_enabled, set_rls_scope
+from app.models.employee import Employee, Role
+
+SCOPE_ALL = "all"
+SCOPE_MINE = "mine"
+SCOPES = (SCOPE_ALL, SCOPE_MINE)
+
+
+def resolve_scope(
+    scope: str | None, role: Role, defaults: dict[Role, str] | None = None
+) -> str:
+    """Retourne la portée demandée, ou la portée par défaut du rôle."""
+    if scope is None:
+        return (defaults or {}).get(role, SCOPE_ALL)
+    if scope not in SCOPES:
+        raise ValueError(f"Portée inconnue : {scope!r}.")
+    return scope
+
+
+def owner_filter(
+    session: Session, current_employee: Employee, scope: str, *, table: str
+) -> int | None:
+    """
+    Retourne l'id propriétaire à filtrer en SQL (None = aucun filtre).
+
+    En mode RLS (EPICCRM_RLS), la portée est transmise à PostgreSQL pour la
+    transaction et ce sont les policies qui écartent les lignes.
+    """
+    if scope != SCOPE_MINE:
+        return None
+
+    if rls_enabled():
+        set_rls_scope(session, table=table, employee_id=current_employee.id)
+        return None
+
+    return current_employee.id
@@ -0,0 +1,40 @@
+"""add foreign key indexes
+
+Revision ID: 3f9b0c7d2e58
+Revises: e4a8d2f61c39
+Create Date: 2026-10-19 11:26:52.310447
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9b0c7d2e58"
+down_revision: Union[str, Sequence[str], None] = "e4a8d2f61c39"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Le mode RLS (optionnel) n'est pas posé par migration : ses policies sont
+# créées par `epicevents db rls enable` (voir app/db/rls.py).
+FK_INDEXES = (
+    ("clients", "sales_contact_id"),
+    ("contracts", "client_id"),
+    ("contracts", "sales_contact_id"),
+    ("events", "contract_id"),
+    ("events", "client_id"),
+    ("events", "support_contact_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in FK_INDEXES:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(FK_INDEXES):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
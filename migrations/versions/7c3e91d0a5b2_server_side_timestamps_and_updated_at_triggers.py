@@ -0,0 +1,66 @@
+"""server-side created_at defaults and updated_at triggers
+
+Revision ID: 7c3e91d0a5b2
+Revises: b61f2c8e4a17
+Create Date: 2026-10-19 10:03:17.554920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e91d0a5b2"
+down_revision: Union[str, Sequence[str], None] = "b61f2c8e4a17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# clients.created_at a déjà NOW() par défaut (c9d16711bf82)
+CREATED_AT_TABLES = ("employees", "contracts", "events")
+UPDATED_AT_TABLES = ("clients", "contracts", "events")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in CREATED_AT_TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+        )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+
+    for table in UPDATED_AT_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            "FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*) "
+            "EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    for table in CREATED_AT_TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(timezone=True),
+            server_default=None,
+        )
@@ -0,0 +1,62 @@
+"""add contract financial summary materialized view and report snapshots
+
+Revision ID: a3c9e7f5d218
+Revises: f2b8d6e1a493
+Create Date: 2026-10-19 18:04:12.381907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c9e7f5d218"
+down_revision: Union[str, Sequence[str], None] = "f2b8d6e1a493"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FINANCIAL_SUMMARY_VIEW = "contract_financial_summary"
+
+FINANCIAL_SUMMARY_SQL = """
+    SELECT client_id,
+           sales_contact_id,
+           count(*) AS contracts,
+           count(*) FILTER (WHERE is_signed) AS signed_contracts,
+           count(*) FILTER (WHERE amount_due > 0) AS unpaid_contracts,
+           sum(total_amount) AS total_amount,
+           sum(amount_due) AS amount_due
+    FROM contracts
+    GROUP BY client_id, sales_contact_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "report_snapshots",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    op.execute(
+        f"CREATE MATERIALIZED VIEW {FINANCIAL_SUMMARY_VIEW} AS "
+        f"{FINANCIAL_SUMMARY_SQL} WITH DATA"
+    )
+    # Index unique requis par REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        f"CREATE UNIQUE INDEX ux_{FINANCIAL_SUMMARY_VIEW} "
+        f"ON {FINANCIAL_SUMMARY_VIEW} (client_id, sales_contact_id)"
+    )
+    op.execute(
+        "INSERT INTO report_snapshots (name, refreshed_at) "
+        f"VALUES ('{FINANCIAL_SUMMARY_VIEW}', now())"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {FINANCIAL_SUMMARY_VIEW}")
+    op.drop_table("report_snapshots")
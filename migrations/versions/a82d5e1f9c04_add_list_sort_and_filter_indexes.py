@@ -0,0 +1,50 @@
+"""add indexes backing list filters and sortable columns
+
+Revision ID: a82d5e1f9c04
+Revises: 3f9b0c7d2e58
+Create Date: 2026-10-19 14:02:17.584213
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a82d5e1f9c04"
+down_revision: Union[str, Sequence[str], None] = "3f9b0c7d2e58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colonnes triables / filtrables des commandes `list`
+SORT_INDEXES = (
+    ("employees", "created_at"),
+    ("employees", "last_name"),
+    ("clients", "created_at"),
+    ("clients", "last_name"),
+    ("contracts", "created_at"),
+    ("contracts", "amount_due"),
+    ("events", "created_at"),
+    ("events", "start_date"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in SORT_INDEXES:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+    op.create_index(
+        "ix_clients_company_name_lower",
+        "clients",
+        [sa.text("lower(company_name)")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_clients_company_name_lower", table_name="clients")
+
+    for table, column in reversed(SORT_INDEXES):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
@@ -0,0 +1,40 @@
+"""add lower(email) unique indexes on employees and clients
+
+Revision ID: b61f2c8e4a17
+Revises: 0d47bbb3cd0c
+Create Date: 2026-10-19 09:12:41.208311
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b61f2c8e4a17"
+down_revision: Union[str, Sequence[str], None] = "0d47bbb3cd0c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "uq_employees_email_lower",
+        "employees",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+    op.create_index(
+        "uq_clients_email_lower",
+        "clients",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_clients_email_lower", table_name="clients")
+    op.drop_index("uq_employees_email_lower", table_name="employees")
@@ -0,0 +1,88 @@
+"""add client search document with pg_trgm GIN index
+
+Revision ID: c5e7a9d3f812
+Revises: a82d5e1f9c04
+Create Date: 2026-10-19 15:11:43.902117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e7a9d3f812"
+down_revision: Union[str, Sequence[str], None] = "a82d5e1f9c04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT_SQL = (
+    "first_name || ' ' || last_name || ' ' || email || ' ' "
+    "|| coalesce(company_name, '')"
+)
+
+
+# Colonnes stockées de clients : la condition WHEN du trigger updated_at ne
+# peut pas référencer de colonne générée (OLD.* / NEW.* l'inclurait). Liste à
+# tenir alignée sur le modèle (tests/integration/db/test_timestamps_server_side).
+CLIENT_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "company_name",
+    "sales_contact_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _create_updated_at_trigger(condition: str) -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_clients_updated_at ON clients")
+    op.execute(
+        "CREATE TRIGGER trg_clients_updated_at BEFORE UPDATE ON clients "
+        f"FOR EACH ROW WHEN ({condition}) EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    old_row = ", ".join(f"OLD.{name}" for name in CLIENT_COLUMNS)
+    new_row = ", ".join(f"NEW.{name}" for name in CLIENT_COLUMNS)
+    _create_updated_at_trigger(f"ROW({old_row}) IS DISTINCT FROM ROW({new_row})")
+
+    op.add_column(
+        "clients",
+        sa.Column(
+            "search_document",
+            sa.Text(),
+            sa.Computed(SEARCH_DOCUMENT_SQL, persisted=True),
+            nullable=False,
+        ),
+    )
+
+    # L'index trigrammes n'est créé que si pg_trgm est disponible sur le
+    # serveur (paquet contrib) ; sinon `clients search` se replie sur ILIKE.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+            ) THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX ix_clients_search_trgm
+                    ON clients USING gin (search_document gin_trgm_ops);
+            END IF;
+        END
+        $$
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # L'extension pg_trgm est conservée (elle peut servir à d'autres objets)
+    op.execute("DROP INDEX IF EXISTS ix_clients_search_trgm")
+    op.drop_column("clients", "search_document")
+    _create_updated_at_trigger("OLD.* IS DISTINCT FROM NEW.*")
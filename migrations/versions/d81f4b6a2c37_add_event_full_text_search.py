@@ -0,0 +1,81 @@
+"""add event full-text search vector with GIN index
+
+Revision ID: d81f4b6a2c37
+Revises: c5e7a9d3f812
+Create Date: 2026-10-19 16:02:18.447215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d81f4b6a2c37"
+down_revision: Union[str, Sequence[str], None] = "c5e7a9d3f812"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('french', coalesce(location, '')), 'A') || "
+    "setweight(to_tsvector('french', coalesce(notes, '')), 'B')"
+)
+
+# Colonnes stockées de events : la condition WHEN du trigger updated_at ne
+# peut pas référencer de colonne générée (voir c5e7a9d3f812).
+EVENT_COLUMNS = (
+    "id",
+    "contract_id",
+    "client_id",
+    "support_contact_id",
+    "start_date",
+    "end_date",
+    "location",
+    "attendees",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+
+
+def _create_updated_at_trigger(condition: str) -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_events_updated_at ON events")
+    op.execute(
+        "CREATE TRIGGER trg_events_updated_at BEFORE UPDATE ON events "
+        f"FOR EACH ROW WHEN ({condition}) EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    old_row = ", ".join(f"OLD.{name}" for name in EVENT_COLUMNS)
+    new_row = ", ".join(f"NEW.{name}" for name in EVENT_COLUMNS)
+    _create_updated_at_trigger(f"ROW({old_row}) IS DISTINCT FROM ROW({new_row})")
+
+    op.add_column(
+        "events",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_events_search_vector",
+        "events",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_events_search_vector", table_name="events", postgresql_using="gin"
+    )
+    op.drop_column("events", "search_vector")
+    _create_updated_at_trigger("OLD.* IS DISTINCT FROM NEW.*")
@@ -0,0 +1,34 @@
+"""add GiST index on event period (tstzrange)
+
+Revision ID: e4a7c2d9b610
+Revises: d81f4b6a2c37
+Create Date: 2026-10-19 16:48:05.129874
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7c2d9b610"
+down_revision: Union[str, Sequence[str], None] = "d81f4b6a2c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_events_period",
+        "events",
+        [sa.text("tstzrange(start_date, end_date)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_events_period", table_name="events", postgresql_using="gist")
@@ -0,0 +1,37 @@
+"""add contract and event check constraints
+
+Revision ID: e4a8d2f61c39
+Revises: 7c3e91d0a5b2
+Create Date: 2026-10-19 10:41:05.871233
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a8d2f61c39"
+down_revision: Union[str, Sequence[str], None] = "7c3e91d0a5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHECK_CONSTRAINTS = (
+    ("contracts", "ck_contracts_total_amount_positive", "total_amount > 0"),
+    ("contracts", "ck_contracts_amount_due_non_negative", "amount_due >= 0"),
+    ("contracts", "ck_contracts_amount_due_lte_total", "amount_due <= total_amount"),
+    ("events", "ck_events_start_before_end", "start_date < end_date"),
+    ("events", "ck_events_attendees_non_negative", "attendees >= 0"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, name, condition in CHECK_CONSTRAINTS:
+        op.create_check_constraint(name, table, condition)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, name, _ in reversed(CHECK_CONSTRAINTS):
+        op.drop_constraint(name, table, type_="check")
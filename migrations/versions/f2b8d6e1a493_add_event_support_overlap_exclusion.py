@@ -0,0 +1,35 @@
+"""add exclusion constraint against overlapping support assignments
+
+Revision ID: f2b8d6e1a493
+Revises: e4a7c2d9b610
+Create Date: 2026-10-19 17:21:37.604518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d6e1a493"
+down_revision: Union[str, Sequence[str], None] = "e4a7c2d9b610"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Échoue si des événements d'un même support se chevauchent déjà :
+    # les réassigner avant d'appliquer la migration.
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT ex_events_support_no_overlap "
+        "EXCLUDE USING gist ("
+        "int4range(support_contact_id, support_contact_id, '[]') WITH =, "
+        "tstzrange(start_date, end_date) WITH &&"
+        ") WHERE (support_contact_id IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ex_events_support_no_overlap", "events")
@@ -6,12 +6,13 @@ import sys
 
 import pytest
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 import app.db.config as db_config
 import app.models  # noqa: F401
 from app.db.base import Base
+from app.db.rls import SCOPE_ROLES, apply_rls_mode
 
 load_dotenv()
 
@@ -99,6 +100,25 @@ def db_session(engine, apply_migrations):
     connection.close()
 
 
+@pytest.fixture
+def rls_mode(db_session, monkeypatch):
+    """
+    Session en mode EPICCRM_RLS : rôles de portée (tâche d'administrateur) et
+    policies créés dans la transaction du test, donc annulés avec elle.
+    """
+    monkeypatch.setenv("EPICCRM_RLS", "true")
+    for role in SCOPE_ROLES:
+        db_session.execute(
+            text(
+                "DO $$ BEGIN "
+                f"IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{role}') "
+                f"THEN CREATE ROLE {role} NOLOGIN; END IF; END $$"
+            )
+        )
+    apply_rls_mode(db_session, enabled=True)
+    return db_session
+
+
 def reload_module(module_name: str):
     """Force le rechargement d'un module Python pour tester un import à froid."""
     if module_name in sys.modules:
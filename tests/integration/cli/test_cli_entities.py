@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from decimal import Decimal
 
 from app.core import jwt_service, token_store
@@ -59,7 +60,7 @@ def test_cli_clients_create_and_list(monkeypatch, tmp_path, capsys, db_session):
     assert result.exit_code == 0
     assert "✅ Client créé" in result.output
 
-    result = invoke_cli(["clients", "list"])
+    result = invoke_cli(["clients", "list", "--format", "table"])
     assert result.exit_code == 0
     assert "Clients" in result.output
     assert "jean@test.com" in result.output
@@ -91,7 +92,7 @@ def test_cli_contracts_create_and_list(monkeypatch, tmp_path, capsys, db_session
     assert result.exit_code == 0
     assert "✅ Contrat créé" in result.output
 
-    result = invoke_cli(["contracts", "list"])
+    result = invoke_cli(["contracts", "list", "--format", "table"])
     assert result.exit_code == 0
     assert "Contrats" in result.output
     assert str(client_id) in result.output
@@ -146,7 +147,41 @@ def test_cli_events_create_and_list(monkeypatch, tmp_path, capsys, db_session):
     assert result.exit_code == 0
     assert "✅ Événement créé" in result.output
 
-    result = invoke_cli(["events", "list"])
+    result = invoke_cli(["events", "list", "--format", "table"])
     assert result.exit_code == 0
     assert "Événements" in result.output
     assert str(contract_id) in result.output
+
+
+def test_cli_clients_list_streams_when_piped(monkeypatch, tmp_path, capsys, db_session):
+    """Sortie non-TTY : format plain par défaut, ndjson / csv à la demande."""
+    patch_cli_env(monkeypatch, db_session, tmp_path)
+
+    sales = create_employee(db_session, email="sales-fmt@test.com", role=Role.SALES)
+    seed_tokens(monkeypatch, tmp_path, sales.id)
+
+    result = invoke_cli(["clients", "create", "Jean", "Dupont", "fmt@test.com"])
+    assert result.exit_code == 0
+
+    result = invoke_cli(["clients", "list"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("ID Client  Nom complet")
+    assert "fmt@test.com" in lines[1]
+
+    result = invoke_cli(["clients", "list", "--format", "ndjson"])
+    assert result.exit_code == 0
+    row = json.loads(result.output.splitlines()[0])
+    assert row["email"] == "fmt@test.com"
+    assert row["full_name"] == "Jean Dupont"
+
+    result = invoke_cli(["clients", "list", "--format", "csv"])
+    assert result.exit_code == 0
+    assert result.output.splitlines()[0].startswith("client_id,full_name,email")
+
+    result = invoke_cli(
+        ["clients", "list", "--format", "table", "--pager", "--page-size", "1"]
+    )
+    assert result.exit_code == 0
+    assert "fmt@test.com" in result.output
+    assert "1 client(s)" in result.output
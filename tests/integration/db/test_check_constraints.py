@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.db.errors import constraint_name
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee
+from app.models.event import Event
+
+
+@pytest.fixture()
+def client(db_session) -> Client:
+    employee = Employee(
+        first_name="Jane",
+        last_name="Darc",
+        email="jane.checks@test.com",
+        role="SALES",
+        password_hash="hash",
+    )
+    db_session.add(employee)
+    db_session.flush()
+
+    client = Client(
+        first_name="Client",
+        last_name="ABC",
+        email="client.checks@test.com",
+        sales_contact_id=employee.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    return client
+
+
+@pytest.mark.parametrize(
+    ("total", "due", "expected"),
+    [
+        ("0", "0", "ck_contracts_total_amount_positive"),
+        ("100", "-1", "ck_contracts_amount_due_non_negative"),
+        ("100", "150", "ck_contracts_amount_due_lte_total"),
+    ],
+)
+def test_contract_check_constraints(db_session, client, total, due, expected):
+    """Vérifie que les invariants de montants sont garantis par la base."""
+    db_session.add(
+        Contract(
+            client_id=client.id,
+            sales_contact_id=client.sales_contact_id,
+            total_amount=Decimal(total),
+            amount_due=Decimal(due),
+        )
+    )
+
+    with pytest.raises(IntegrityError) as exc_info:
+        db_session.flush()
+    assert constraint_name(exc_info.value) == expected
+
+
+@pytest.mark.parametrize(
+    ("hours", "attendees", "expected"),
+    [
+        (-1, 10, "ck_events_start_before_end"),
+        (2, -1, "ck_events_attendees_non_negative"),
+    ],
+)
+def test_event_check_constraints(db_session, client, hours, attendees, expected):
+    """Vérifie que les invariants de dates/participants sont garantis par la base."""
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=client.sales_contact_id,
+        total_amount=Decimal("100"),
+        amount_due=Decimal("0"),
+        is_signed=True,
+    )
+    db_session.add(contract)
+    db_session.flush()
+
+    start = datetime.now(timezone.utc)
+    db_session.add(
+        Event(
+            contract_id=contract.id,
+            client_id=client.id,
+            start_date=start,
+            end_date=start + timedelta(hours=hours),
+            location="Paris",
+            attendees=attendees,
+        )
+    )
+
+    with pytest.raises(IntegrityError) as exc_info:
+        db_session.flush()
+    assert constraint_name(exc_info.value) == expected
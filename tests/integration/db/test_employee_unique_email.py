@@ -27,3 +27,29 @@ def test_employee_email_unique_constraint(db_session):
     db_session.add(employee2)
     with pytest.raises(IntegrityError):
         db_session.flush()
+
+
+def test_employee_email_unique_is_case_insensitive(db_session):
+    """Vérifie que l'unicité de l'email employé ignore la casse (index lower(email))."""
+    db_session.add(
+        Employee(
+            first_name="Jean",
+            last_name="Dupont",
+            email="jean.case@test.com",
+            role=Role.SALES,
+            password_hash="hash",
+        )
+    )
+    db_session.flush()
+
+    db_session.add(
+        Employee(
+            first_name="Jean2",
+            last_name="Dupont2",
+            email="Jean.Case@Test.com",
+            role=Role.SALES,
+            password_hash="hash",
+        )
+    )
+    with pytest.raises(IntegrityError):
+        db_session.flush()
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.event_service import claim_events
+
+
+@pytest.fixture()
+def committed_events(engine, apply_migrations):
+    """Données réellement commitées : visibles depuis plusieurs connexions."""
+    with Session(engine) as session:
+        sales = Employee(
+            first_name="S",
+            last_name="Claim",
+            email="sales.claim@test.com",
+            role=Role.SALES,
+            password_hash="hash",
+        )
+        supports = [
+            Employee(
+                first_name="Sup",
+                last_name=str(idx),
+                email=f"support.claim{idx}@test.com",
+                role=Role.SUPPORT,
+                password_hash="hash",
+            )
+            for idx in range(2)
+        ]
+        session.add_all([sales, *supports])
+        session.flush()
+        client = Client(
+            first_name="C",
+            last_name="Claim",
+            email="client.claim@test.com",
+            sales_contact_id=sales.id,
+        )
+        session.add(client)
+        session.flush()
+        contract = Contract(
+            client_id=client.id,
+            sales_contact_id=sales.id,
+            total_amount=Decimal("100"),
+            amount_due=Decimal("0"),
+            is_signed=True,
+        )
+        session.add(contract)
+        session.flush()
+        start = datetime.now(timezone.utc) + timedelta(days=2)
+        events = [
+            Event(
+                client_id=client.id,
+                contract_id=contract.id,
+                start_date=start + timedelta(days=idx),
+                end_date=start + timedelta(days=idx, hours=2),
+                location="Paris",
+                attendees=1,
+            )
+            for idx in range(2)
+        ]
+        session.add_all(events)
+        session.commit()
+        ids = {
+            "supports": [s.id for s in supports],
+            "events": [ev.id for ev in events],
+            "contract": contract.id,
+            "client": client.id,
+            "employees": [sales.id, *(s.id for s in supports)],
+        }
+
+    yield ids
+
+    with Session(engine) as session:
+        session.execute(delete(Event).where(Event.id.in_(ids["events"])))
+        session.execute(delete(Contract).where(Contract.id == ids["contract"]))
+        session.execute(delete(Client).where(Client.id == ids["client"]))
+        session.execute(delete(Employee).where(Employee.id.in_(ids["employees"])))
+        session.commit()
+
+
+def test_concurrent_claims_skip_locked_rows(engine, committed_events):
+    """Deux supports qui réclament en même temps obtiennent des événements distincts."""
+    first_id, second_id = committed_events["events"]
+    support_id = committed_events["supports"][1]
+
+    with Session(engine) as agent_a, Session(engine) as agent_b:
+        # Agent A : transaction ouverte, verrou posé sur le premier événement
+        claimed_a = agent_a.execute(
+            select(Event.id)
+            .where(Event.id.in_(committed_events["events"]))
+            .order_by(Event.start_date)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one()
+        assert claimed_a == first_id
+
+        # Agent B ne l'attend pas : il prend le suivant
+        claimed_b = claim_events(
+            session=agent_b,
+            current_employee=agent_b.get(Employee, support_id),
+            count=2,
+        )
+        assert [ev.id for ev in claimed_b] == [second_id]
+
+        agent_a.rollback()
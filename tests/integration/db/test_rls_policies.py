@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select, text, update
+
+from app.core.security import hash_password
+from app.db.rls import set_rls_scope
+from app.models.client import Client
+from app.models.employee import Employee, Role
+from app.services.client_service import list_clients
+from app.services.rls_service import (
+    PermissionDeniedError,
+    ValidationError,
+    set_rls_mode,
+)
+
+
+def _employee(db_session, email: str, role: Role = Role.SALES) -> Employee:
+    employee = Employee(
+        first_name="Employee",
+        last_name="Rls",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(employee)
+    db_session.flush()
+    return employee
+
+
+def _client(db_session, email: str, sales: Employee) -> Client:
+    client = Client(
+        first_name="Client",
+        last_name="Rls",
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    return client
+
+
+def _policies(db_session) -> set[str]:
+    return set(
+        db_session.scalars(
+            text("SELECT policyname FROM pg_policies WHERE tablename = 'clients'")
+        )
+    )
+
+
+def test_mine_scope_is_filtered_by_policy(rls_mode):
+    """En mode RLS, la policy écarte les clients d'un autre commercial."""
+    alice = _employee(rls_mode, "alice.rls@test.com")
+    bob = _employee(rls_mode, "bob.rls@test.com")
+    own = _client(rls_mode, "own.rls@test.com", alice)
+    other = _client(rls_mode, "other.rls@test.com", bob)
+
+    mine = list_clients(session=rls_mode, current_employee=alice, scope="mine")
+    assert [client.id for client in mine] == [own.id]
+
+    # Même sans le filtre applicatif, la policy ne laisse voir que ses lignes
+    visible = rls_mode.scalars(select(Client.id).order_by(Client.id)).all()
+    assert other.id not in visible
+
+
+def test_scope_policy_uses_foreign_key_index(rls_mode):
+    """La policy de portée (sans OR) se résout par l'index de sales_contact_id."""
+    alice = _employee(rls_mode, "alice.rls@test.com")
+    set_rls_scope(rls_mode, table="clients", employee_id=alice.id)
+    rls_mode.execute(text("SET LOCAL enable_seqscan = off"))
+
+    plan = "\n".join(rls_mode.scalars(text("EXPLAIN SELECT id FROM clients")).all())
+
+    assert "ix_clients_sales_contact_id" in plan
+    assert "sales_contact_id =" in plan
+    assert " OR " not in plan
+
+
+def test_scope_does_not_restrict_later_writes(rls_mode):
+    """La portée d'une lecture est effacée avant les écritures de la transaction."""
+    alice = _employee(rls_mode, "alice.rls@test.com")
+    bob = _employee(rls_mode, "bob.rls@test.com")
+    other = _client(rls_mode, "other.rls@test.com", bob)
+
+    assert list_clients(session=rls_mode, current_employee=alice, scope="mine") == []
+
+    updated = rls_mode.execute(
+        update(Client)
+        .where(Client.id == other.id)
+        .values(company_name="Reprise")
+        .returning(Client.id)
+    ).all()
+
+    assert updated == [(other.id,)]
+    assert (
+        rls_mode.scalar(select(Client.company_name).where(Client.id == other.id))
+        == "Reprise"
+    )
+
+
+def test_set_rls_mode_toggles_policies(rls_mode):
+    """`db rls enable|disable` pose puis retire les policies (MANAGEMENT)."""
+    manager = _employee(rls_mode, "mgmt.rls@test.com", Role.MANAGEMENT)
+    sales = _employee(rls_mode, "sales.rls@test.com")
+
+    with pytest.raises(PermissionDeniedError):
+        set_rls_mode(rls_mode, sales, enabled=False)
+
+    set_rls_mode(rls_mode, manager, enabled=False)
+    assert _policies(rls_mode) == set()
+
+    set_rls_mode(rls_mode, manager, enabled=True)
+    assert "clients_scope" in _policies(rls_mode)
+
+
+def test_set_rls_mode_reports_missing_roles(db_session, monkeypatch):
+    """Sans les rôles de portée, l'activation est refusée avec un message clair."""
+    manager = _employee(db_session, "mgmt.rls@test.com", Role.MANAGEMENT)
+    monkeypatch.setattr(
+        "app.services.rls_service.missing_scope_roles",
+        lambda session: ["epiccrm_scope_clients"],
+    )
+
+    with pytest.raises(ValidationError, match="epiccrm_scope_clients"):
+        set_rls_mode(db_session, manager, enabled=True)
@@ -0,0 +1,152 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert, select, text, update
+
+from app.models.client import Client
+from app.models.employee import Employee
+from app.models.event import Event
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[3] / "migrations" / "versions"
+
+
+def _sales(db_session) -> Employee:
+    employee = Employee(
+        first_name="Jane",
+        last_name="Darc",
+        email="jane.timestamps@test.com",
+        role="SALES",
+        password_hash="hash",
+    )
+    db_session.add(employee)
+    db_session.flush()
+    return employee
+
+
+def test_created_at_set_by_server_on_core_insert(db_session):
+    """Vérifie que created_at est rempli par la base même hors ORM (INSERT Core)."""
+    employee = _sales(db_session)
+
+    client_id = db_session.execute(
+        insert(Client)
+        .values(
+            first_name="Bulk",
+            last_name="Insert",
+            email="bulk.insert@test.com",
+            sales_contact_id=employee.id,
+        )
+        .returning(Client.id)
+    ).scalar_one()
+
+    created_at = db_session.execute(
+        select(Client.created_at).where(Client.id == client_id)
+    ).scalar_one()
+    assert created_at is not None
+
+
+def test_updated_at_maintained_by_trigger_on_bulk_update(db_session):
+    """Vérifie que le trigger renseigne updated_at lors d'un UPDATE en masse."""
+    employee = _sales(db_session)
+    client = Client(
+        first_name="Client",
+        last_name="ABC",
+        email="client.trigger@test.com",
+        sales_contact_id=employee.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    assert client.updated_at is None
+
+    db_session.execute(
+        update(Client)
+        .where(Client.id == client.id)
+        .values(company_name="ACME")
+        .execution_options(synchronize_session=False)
+    )
+
+    updated_at = db_session.execute(
+        select(Client.updated_at).where(Client.id == client.id)
+    ).scalar_one()
+    assert updated_at is not None
+
+
+def test_updated_at_untouched_by_noop_update(db_session):
+    """Vérifie qu'un UPDATE sans changement effectif ne modifie pas updated_at."""
+    employee = _sales(db_session)
+    client = Client(
+        first_name="Client",
+        last_name="Noop",
+        email="client.noop@test.com",
+        sales_contact_id=employee.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+
+    db_session.execute(
+        text("UPDATE clients SET first_name = first_name WHERE id = :id"),
+        {"id": client.id},
+    )
+
+    updated_at = db_session.execute(
+        select(Client.updated_at).where(Client.id == client.id)
+    ).scalar_one()
+    assert updated_at is None
+
+
+def test_updated_at_trigger_skips_noop_rows_without_calling_function(db_session):
+    """Le WHEN du trigger écarte les lignes inchangées (aucun appel de fonction)."""
+    definitions = dict(
+        db_session.execute(
+            text(
+                "SELECT tgname, pg_get_triggerdef(oid) FROM pg_trigger "
+                "WHERE tgname LIKE 'trg_%_updated_at'"
+            )
+        ).all()
+    )
+
+    assert "WHEN ((old.* IS DISTINCT FROM new.*))" in (
+        definitions["trg_contracts_updated_at"]
+    )
+    # Tables à colonnes générées : colonnes stockées listées explicitement
+    assert "old.search_document" not in definitions["trg_clients_updated_at"]
+    assert "old.company_name" in definitions["trg_clients_updated_at"]
+    assert "old.search_vector" not in definitions["trg_events_updated_at"]
+    assert "old.notes" in definitions["trg_events_updated_at"]
+
+
+@pytest.mark.parametrize(
+    ("filename", "attribute", "model"),
+    [
+        ("c5e7a9d3f812_add_client_trigram_search.py", "CLIENT_COLUMNS", Client),
+        ("d81f4b6a2c37_add_event_full_text_search.py", "EVENT_COLUMNS", Event),
+    ],
+)
+def test_migration_trigger_columns_match_model(filename, attribute, model):
+    """Les colonnes du WHEN posé par migration suivent les colonnes stockées."""
+    path = MIGRATIONS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    stored = [col.name for col in model.__table__.columns if col.computed is None]
+    assert list(getattr(migration, attribute)) == stored
+
+
+def test_orm_update_fetches_trigger_value_with_returning(db_session):
+    """Vérifie que l'ORM récupère updated_at (trigger) dans l'UPDATE lui-même."""
+    employee = _sales(db_session)
+    client = Client(
+        first_name="Client",
+        last_name="Orm",
+        email="client.orm@test.com",
+        sales_contact_id=employee.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+
+    client.company_name = "ACME"
+    db_session.flush()
+
+    assert "updated_at" in client.__dict__
+    assert client.updated_at is not None
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
+from decimal import Decimal
 from types import SimpleNamespace
 
 from app.cli.commands import clients as clients_cmds
 from app.models.employee import Role
+from app.repositories.client_repository import ClientOverview, ContractLine, EventLine
 from tests.unit.cli.helpers.rich_table import (
     capture_table,
     get_table,
@@ -176,3 +179,200 @@ def test_cmd_clients_create_unexpected_error_rollbacks(
     assert "❌ Erreur lors de la création du client" in out
     assert dummy_session_rb.rolled_back is True
     assert dummy_session_rb.closed is True
+
+
+def test_cmd_clients_list_passes_scope_to_service(monkeypatch, dummy_session_rb):
+    """clients list: transmet la portée (--scope / --mine) au service."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        clients_cmds,
+        "get_current_employee",
+        lambda s: SimpleNamespace(role=Role.SALES),
+    )
+
+    captured = {}
+
+    def fake_list_clients(**kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(clients_cmds, "list_clients", fake_list_clients)
+
+    clients_cmds.cmd_clients_list(SimpleNamespace(scope="mine"))
+
+    assert captured["scope"] == "mine"
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_clients_list_passes_filters_to_service(monkeypatch, dummy_session_rb):
+    """clients list: compile --company / --sort en ListFilters pour le service."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        clients_cmds,
+        "get_current_employee",
+        lambda s: SimpleNamespace(role=Role.MANAGEMENT),
+    )
+
+    captured = {}
+
+    def fake_list_clients(**kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(clients_cmds, "list_clients", fake_list_clients)
+
+    clients_cmds.cmd_clients_list(
+        SimpleNamespace(company="ACME", sales_id=3, sort="created_at:desc")
+    )
+
+    filters = captured["filters"]
+    assert filters.company == "ACME"
+    assert filters.sales_contact_id == 3
+    assert filters.sort == "created_at:desc"
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_clients_list_invalid_sort_shows_error(
+    monkeypatch, capsys, dummy_session_rb
+):
+    """clients list: un tri non autorisé affiche une erreur de validation."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        clients_cmds,
+        "get_current_employee",
+        lambda s: SimpleNamespace(role=Role.MANAGEMENT),
+    )
+    monkeypatch.setattr(
+        clients_cmds,
+        "list_clients",
+        lambda **k: (_ for _ in ()).throw(clients_cmds.ValidationError("Tri")),
+    )
+
+    clients_cmds.cmd_clients_list(SimpleNamespace(sort="email"))
+
+    assert "Données invalides" in capsys.readouterr().out
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_clients_list_count_mode(monkeypatch, capsys, dummy_session_rb):
+    """clients list --count: affiche le total sans charger les clients."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        clients_cmds,
+        "get_current_employee",
+        lambda s: SimpleNamespace(role=Role.MANAGEMENT),
+    )
+    monkeypatch.setattr(
+        clients_cmds,
+        "list_clients",
+        lambda **k: (_ for _ in ()).throw(AssertionError("list_clients appelé")),
+    )
+
+    captured = {}
+
+    def fake_count_clients(**kwargs):
+        captured.update(kwargs)
+        return 42
+
+    monkeypatch.setattr(clients_cmds, "count_clients", fake_count_clients)
+
+    clients_cmds.cmd_clients_list(SimpleNamespace(approx=True))
+
+    out = capsys.readouterr().out
+    assert "≈ 42 client(s)" in out
+    assert captured["approx"] is True
+    assert dummy_session_rb.closed is True
+
+
+def _overview() -> ClientOverview:
+    created = datetime(2030, 1, 2, 10, 0, tzinfo=timezone.utc)
+    client = SimpleNamespace(
+        id=7,
+        first_name="Jean",
+        last_name="Vue",
+        email="vue@test.com",
+        phone=None,
+        company_name="Acme",
+        sales_contact_id=3,
+        sales_contact=SimpleNamespace(first_name="Ada", last_name="Sales"),
+        created_at=created,
+        updated_at=None,
+    )
+    return ClientOverview(
+        client=client,
+        contracts=[
+            ContractLine(
+                id=11,
+                total_amount=Decimal("1000.00"),
+                amount_due=Decimal("250.00"),
+                is_signed=True,
+                created_at=created,
+                sales_name="Ada Sales",
+            )
+        ],
+        events=[
+            EventLine(
+                id=21,
+                contract_id=11,
+                start_date=created,
+                end_date=created,
+                location="Paris",
+                attendees=20,
+                support_name=None,
+            )
+        ],
+    )
+
+
+def test_cmd_clients_show_renders_nested_view(monkeypatch, dummy_session_rb):
+    """clients show: fiche, puis tables des contrats et des événements."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(clients_cmds, "get_current_employee", lambda s: object())
+    monkeypatch.setattr(
+        clients_cmds, "get_client_overview", lambda s, e, client_id: _overview()
+    )
+    printed = []
+    monkeypatch.setattr(
+        clients_cmds.console, "print", lambda obj, **_k: printed.append(obj)
+    )
+
+    clients_cmds.cmd_clients_show(SimpleNamespace(client_id=7, format="table"))
+
+    fiche, contracts, events = (get_table({"obj": obj}) for obj in printed)
+    assert fiche.title == "Client #7"
+    assert "Ada Sales" in list(fiche.columns[1].cells)
+    assert list(contracts.columns[1].cells) == ["Signé"]
+    assert list(events.columns[-1].cells) == ["— non assigné"]
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_clients_show_json_document(monkeypatch, capsys, dummy_session_rb):
+    """clients show --format json: un document imbriqué."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(clients_cmds, "get_current_employee", lambda s: object())
+    monkeypatch.setattr(
+        clients_cmds, "get_client_overview", lambda s, e, client_id: _overview()
+    )
+
+    clients_cmds.cmd_clients_show(SimpleNamespace(client_id=7, format="json"))
+    document = json.loads(capsys.readouterr().out)
+
+    assert document["sales_contact"] == {"id": 3, "full_name": "Ada Sales"}
+    assert document["contracts"][0]["amount_due"] == "250.00"
+    assert document["events"][0]["support_name"] is None
+
+
+def test_cmd_clients_show_not_found(monkeypatch, capsys, dummy_session_rb):
+    """clients show: message d'erreur si le client n'existe pas."""
+    monkeypatch.setattr(clients_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(clients_cmds, "get_current_employee", lambda s: object())
+
+    def fake_overview(s, e, client_id):
+        raise clients_cmds.NotFoundError("Client introuvable.")
+
+    monkeypatch.setattr(clients_cmds, "get_client_overview", fake_overview)
+
+    clients_cmds.cmd_clients_show(SimpleNamespace(client_id=404, format="table"))
+
+    assert "Client introuvable." in capsys.readouterr().out
+    assert dummy_session_rb.closed is True
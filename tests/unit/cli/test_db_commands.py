@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.cli.commands import db as db_cmds
+from app.services.consistency_service import CheckReport
+from tests.unit.cli.helpers.rich_table import get_table
+
+
+def test_cmd_db_check_consistency_reports_remaining(monkeypatch, dummy_session_rb):
+    """db check-consistency: table des contrôles puis anomalies restantes."""
+    monkeypatch.setattr(db_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(db_cmds, "get_current_employee", lambda s: object())
+    captured = {}
+
+    def fake_check(session, employee, **kwargs):
+        captured.update(kwargs)
+        return [
+            CheckReport(
+                name="contract_sales_mismatch",
+                label="Contrat suivi par un autre commercial que son client",
+                count=7,
+                samples=[1, 2, 3, 4, 5],
+                fixable=True,
+            ),
+            CheckReport(
+                name="inactive_client_sales",
+                label="Client suivi par un commercial désactivé",
+                count=0,
+                samples=[],
+                fixable=False,
+            ),
+        ]
+
+    monkeypatch.setattr(db_cmds, "check_consistency", fake_check)
+    printed = []
+    monkeypatch.setattr(db_cmds.console, "print", lambda obj, **_k: printed.append(obj))
+
+    db_cmds.cmd_db_check_consistency(
+        SimpleNamespace(fix=False, batch_size=500, format="table")
+    )
+    table = get_table({"obj": printed[0]})
+
+    assert captured == {"fix": False, "batch_size": 500}
+    assert list(table.columns[3].cells) == ["1, 2, 3, 4, 5, …", "—"]
+    assert list(table.columns[4].cells) == ["0", "—"]
+    assert "7 anomalie(s) restante(s)" in printed[1]
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_db_rls_reports_missing_roles(monkeypatch, dummy_session_rb):
+    """db rls enable: rôles de portée absents -> message d'erreur, rien appliqué."""
+    monkeypatch.setattr(db_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(db_cmds, "get_current_employee", lambda s: object())
+
+    def fake_set(session, employee, *, enabled):
+        assert enabled is True
+        raise db_cmds.RlsValidationError("Rôles PostgreSQL manquants : x")
+
+    monkeypatch.setattr(db_cmds, "set_rls_mode", fake_set)
+    errors = []
+    monkeypatch.setattr(db_cmds, "error", errors.append)
+
+    db_cmds.cmd_db_rls(SimpleNamespace(mode="enable"))
+
+    assert errors == ["Données invalides : Rôles PostgreSQL manquants : x"]
+    assert dummy_session_rb.closed is True
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 from types import SimpleNamespace
 
 from app.cli.commands import employees as employees_cmds
 from app.models.employee import Role
+from app.repositories.employee_repository import EmployeeWorkload
+from tests.unit.cli.helpers.rich_table import capture_table, get_table
 
 
 class BootstrapSession:
@@ -71,7 +74,7 @@ def test_cmd_create_employee_bootstrap_requires_management(monkeypatch, capsys):
 
 
 def test_cmd_create_employee_bootstrap_management_success(monkeypatch, capsys):
-    """DB vide: MANAGEMENT => création OK (commit + refresh + print)."""
+    """DB vide: MANAGEMENT => création OK (commit + print, sans refresh)."""
     session = BootstrapSession(employees_count=0)
     monkeypatch.setattr(employees_cmds, "get_session", lambda: session)
 
@@ -97,7 +100,8 @@ def test_cmd_create_employee_bootstrap_management_success(monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "✅ Employé créé" in out
     assert session.committed is True
-    assert session.refreshed is True
+    # expire_on_commit=False : l'objet reste chargé, aucun SELECT de rechargement
+    assert session.refreshed is False
     assert session.closed is True
 
 
@@ -215,7 +219,7 @@ def test_cmd_employees_list_empty(monkeypatch, capsys, dummy_session_rb):
         lambda _s: SimpleNamespace(role=Role.SALES),
     )
 
-    repo = SimpleNamespace(list_all=lambda: [])
+    repo = SimpleNamespace(list_all=lambda **_k: [])
     monkeypatch.setattr(employees_cmds, "EmployeeRepository", lambda _s: repo)
 
     employees_cmds.cmd_employees_list(SimpleNamespace(role=None))
@@ -235,7 +239,7 @@ def test_cmd_employees_list_prints(monkeypatch, capsys, dummy_session_rb):
     )
 
     repo = SimpleNamespace(
-        list_all=lambda: [
+        list_all=lambda **_k: [
             SimpleNamespace(
                 id=1,
                 first_name="A",
@@ -272,7 +276,7 @@ def test_cmd_employees_list_with_role_filter(monkeypatch, capsys, dummy_session_
     monkeypatch.setattr(employees_cmds, "Role", Role)
 
     repo = SimpleNamespace(
-        list_by_role=lambda _role: [
+        list_by_role=lambda _role, **_k: [
             SimpleNamespace(
                 id=2,
                 first_name="B",
@@ -396,3 +400,42 @@ def test_cmd_employees_delete_soft_success(monkeypatch, capsys, dummy_session_rb
     out = capsys.readouterr().out
     assert "✅ Employé désactivé" in out
     assert dummy_session_rb.closed is True
+
+
+def test_cmd_employees_show_renders_workload(monkeypatch, dummy_session_rb):
+    """employees show: fiche de l'employé et compteurs de son portefeuille."""
+    monkeypatch.setattr(employees_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        employees_cmds, "get_current_employee", lambda s: SimpleNamespace()
+    )
+    employee = SimpleNamespace(
+        id=5,
+        first_name="Ada",
+        last_name="Sales",
+        email="ada@test.com",
+        role=Role.SALES,
+        is_active=True,
+    )
+    load = EmployeeWorkload(
+        clients=2,
+        contracts=3,
+        signed_contracts=2,
+        unpaid_contracts=1,
+        total_amount=Decimal("1700.00"),
+        amount_due=Decimal("600.00"),
+        upcoming_events=0,
+        past_events=0,
+    )
+    monkeypatch.setattr(
+        employees_cmds, "employee_workload", lambda s, e, employee_id: (employee, load)
+    )
+    printed = capture_table(monkeypatch, employees_cmds)
+
+    employees_cmds.cmd_employees_show(SimpleNamespace(employee_id=5, format="table"))
+    table = get_table(printed)
+
+    assert table.title == "Employé #5"
+    values = dict(zip(table.columns[0].cells, table.columns[1].cells))
+    assert values["Clients suivis"] == "2"
+    assert values["Restant dû"] == "600.00"
+    assert dummy_session_rb.closed is True
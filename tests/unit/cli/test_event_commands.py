@@ -363,3 +363,72 @@ def test_cmd_events_list_passes_assigned_to_me_filter(monkeypatch, dummy_session
     assert "session" in captured
     assert "current_employee" in captured
     assert dummy_session_rb.closed is True
+
+
+def test_cmd_events_calendar_shows_bucket_label_once(monkeypatch, dummy_session_rb):
+    """events calendar: une ligne par événement, libellé de case sur la 1re."""
+    monkeypatch.setattr(events_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        events_cmds, "get_current_employee", lambda s: SimpleNamespace()
+    )
+
+    def _ev(event_id: int, hour: int) -> SimpleNamespace:
+        start = datetime(2030, 3, 4, hour, 0)
+        return SimpleNamespace(
+            id=event_id, start_date=start, end_date=start, location="Paris"
+        )
+
+    captured = {}
+
+    def fake_calendar(**kwargs):
+        captured.update(kwargs)
+        return [(datetime(2030, 3, 4), [_ev(1, 9), _ev(2, 14)])]
+
+    monkeypatch.setattr(events_cmds, "calendar_events", fake_calendar)
+    printed = capture_table(monkeypatch, events_cmds)
+
+    events_cmds.cmd_events_calendar(SimpleNamespace(by="day"))
+    table = get_table(printed)
+
+    assert captured["unit"] == "day"
+    assert table_headers(table)[:2] == ["Case", "ID Event"]
+    assert list(table.columns[0].cells) == ["lun. 04/03/30 · 2", ""]
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_events_auto_assign_dry_run_reports_plan(
+    monkeypatch, capsys, dummy_session_rb
+):
+    """events auto-assign --dry-run: affiche le plan et le nombre simulé."""
+    monkeypatch.setattr(events_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        events_cmds, "get_current_employee", lambda s: SimpleNamespace()
+    )
+
+    start = datetime(2030, 3, 4, 9, 0)
+    ev = SimpleNamespace(id=7, start_date=start, end_date=start, location="Paris")
+    support = SimpleNamespace(id=3, first_name="Ada", last_name="Support")
+    captured = {}
+
+    def fake_auto_assign(**kwargs):
+        captured.update(kwargs)
+        return [(ev, support), (ev, None)]
+
+    monkeypatch.setattr(events_cmds, "auto_assign_events", fake_auto_assign)
+    # Table puis messages (info / warning) : tout est collecté dans l'ordre
+    printed = []
+    monkeypatch.setattr(
+        events_cmds.console, "print", lambda obj, **_k: printed.append(obj)
+    )
+
+    events_cmds.cmd_events_auto_assign(SimpleNamespace(dry_run=True))
+    table = get_table({"obj": printed[0]})
+
+    assert captured["dry_run"] is True
+    assert "Simulation : 1 événement(s)" in printed[1]
+    assert "1 événement(s) sans support libre" in printed[2]
+    assert list(table.columns[-1].cells) == [
+        "Ada Support (id=3)",
+        "— aucun support libre",
+    ]
+    assert dummy_session_rb.closed is True
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.cli.commands import inbox as inbox_cmds
+from app.repositories.inbox_repository import (
+    INBOX_MY_EVENT,
+    INBOX_UNPAID_CONTRACT,
+    LATER,
+    URGENT,
+    InboxItem,
+)
+from tests.unit.cli.helpers.rich_table import get_table
+
+_ITEMS = [
+    InboxItem(
+        kind=INBOX_MY_EVENT,
+        urgency=URGENT,
+        item_id=3,
+        client_name="Client Acme",
+        date=datetime(2030, 1, 2, 9, 0),
+        amount=None,
+        location="Paris",
+    ),
+    InboxItem(
+        kind=INBOX_UNPAID_CONTRACT,
+        urgency=LATER,
+        item_id=8,
+        client_name="Client Beta",
+        date=datetime(2029, 12, 1, 9, 0),
+        amount=Decimal("300.00"),
+        location=None,
+    ),
+]
+
+
+def test_cmd_inbox_one_table_per_urgency(monkeypatch, dummy_session_rb):
+    """inbox: une table par niveau d'urgence, dans l'ordre."""
+    monkeypatch.setattr(inbox_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(inbox_cmds, "get_current_employee", lambda s: object())
+    monkeypatch.setattr(inbox_cmds, "build_inbox", lambda s, e, limit: _ITEMS)
+    printed = []
+    monkeypatch.setattr(
+        inbox_cmds.console, "print", lambda obj, **_k: printed.append(obj)
+    )
+
+    inbox_cmds.cmd_inbox(SimpleNamespace(format="table"))
+    urgent, later = (get_table({"obj": obj}) for obj in printed)
+
+    assert urgent.title == "Urgent"
+    assert list(urgent.columns[0].cells) == ["Événement à préparer"]
+    assert later.title == "Plus tard"
+    assert list(later.columns[-1].cells) == ["300.00 €"]
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_inbox_csv_keeps_urgency_column(monkeypatch, capsys, dummy_session_rb):
+    """inbox --format csv: liste à plat, urgence en première colonne."""
+    monkeypatch.setattr(inbox_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(inbox_cmds, "get_current_employee", lambda s: object())
+    monkeypatch.setattr(inbox_cmds, "build_inbox", lambda s, e, limit: _ITEMS)
+
+    inbox_cmds.cmd_inbox(SimpleNamespace(format="csv"))
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0] == "urgency,kind,item_id,client,date,detail"
+    assert lines[1].startswith("Urgent,Événement à préparer,3,")
+    assert len(lines) == 3
+
+
+def test_cmd_inbox_empty(monkeypatch, capsys, dummy_session_rb):
+    """inbox: message si rien à faire."""
+    monkeypatch.setattr(inbox_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(inbox_cmds, "get_current_employee", lambda s: object())
+    monkeypatch.setattr(inbox_cmds, "build_inbox", lambda s, e, limit: [])
+
+    inbox_cmds.cmd_inbox(SimpleNamespace(format="table"))
+
+    assert "Rien à faire." in capsys.readouterr().out
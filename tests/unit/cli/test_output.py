@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import json
+
+from app.cli import output
+from app.cli.output import Column, render_rows, resolve_format
+
+COLUMNS = (Column("id", "ID"), Column("name", "Nom"))
+ROWS = [{"id": "1", "name": "Jean\nDupont"}, {"id": "2", "name": "A,B"}]
+
+
+class _Stream(io.StringIO):
+    def __init__(self, tty: bool) -> None:
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+def _render(monkeypatch, fmt: str, rows=ROWS) -> str:
+    out = io.StringIO()
+    monkeypatch.setattr(output.sys, "stdout", out)
+    render_rows(
+        iter(rows), COLUMNS, fmt=fmt, title="T", unit="ligne(s)", empty_message="Vide"
+    )
+    return out.getvalue()
+
+
+def test_resolve_format_auto_detects_tty():
+    """Sans --format : table si terminal, plain sinon ; sinon format explicite."""
+    assert resolve_format(None, _Stream(tty=True)) == "table"
+    assert resolve_format(None, _Stream(tty=False)) == "plain"
+    assert resolve_format("JSON", _Stream(tty=True)) == "json"
+
+
+def test_render_plain_and_tsv_flatten_multiline_cells(monkeypatch):
+    """plain / tsv : une ligne par enregistrement."""
+    assert _render(monkeypatch, "plain").splitlines() == [
+        "ID  Nom",
+        "1  Jean Dupont",
+        "2  A,B",
+    ]
+    assert _render(monkeypatch, "tsv").splitlines()[1] == "1\tJean Dupont"
+
+
+def test_render_csv_quotes_values(monkeypatch):
+    """csv : en-têtes = clés, valeurs échappées."""
+    assert _render(monkeypatch, "csv").splitlines()[0] == "id,name"
+    assert '"A,B"' in _render(monkeypatch, "csv")
+
+
+def test_render_json_and_ndjson(monkeypatch):
+    """json : tableau valide (même vide) ; ndjson : un objet par ligne."""
+    assert json.loads(_render(monkeypatch, "json")) == ROWS
+    assert json.loads(_render(monkeypatch, "json", rows=[])) == []
+
+    lines = _render(monkeypatch, "ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == ROWS
+
+
+def test_render_paged_table_uses_fixed_widths(monkeypatch):
+    """--pager : largeurs figées sur l'échantillon, lignes suivantes tronquées."""
+    monkeypatch.setattr(output, "PAGER_SAMPLE_SIZE", 1)
+    captured: list[str] = []
+    monkeypatch.setattr(
+        output.click, "echo_via_pager", lambda lines: captured.extend(lines)
+    )
+
+    rows = [{"id": "1", "name": "Jean"}, {"id": "22", "name": "Jean-Christophe"}]
+    render_rows(
+        iter(rows),
+        (Column("id", "ID", justify="right"), Column("name", "Nom")),
+        fmt="table",
+        title="Clients",
+        unit="client(s)",
+        empty_message="Vide",
+        pager=True,
+    )
+
+    assert captured[0] == "Clients\n"
+    assert captured[1] == "ID | Nom\n"
+    assert captured[3] == " 1 | Jean\n"
+    assert captured[4] == "22 | Jea…\n"
+    assert captured[-1] == "\n2 client(s)\n"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.cli.commands import reports as reports_cmds
+from app.repositories.report_repository import AgingRow
+
+
+def test_cmd_reports_aging_streams_csv(monkeypatch, capsys, dummy_session_rb):
+    """reports aging --format csv: une ligne par entité, tranches en colonnes."""
+    monkeypatch.setattr(reports_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        reports_cmds, "get_current_employee", lambda s: SimpleNamespace()
+    )
+    captured = {}
+
+    def fake_aging(session, employee, **kwargs):
+        captured.update(kwargs)
+        yield AgingRow(
+            entity_id=4,
+            label="Client Acme",
+            contracts=2,
+            buckets=(Decimal("100.00"), Decimal("0"), Decimal("0"), Decimal("50.00")),
+            amount_due=Decimal("150.00"),
+            oldest_days=120,
+            share=Decimal("100.0"),
+        )
+
+    monkeypatch.setattr(reports_cmds, "aging_report", fake_aging)
+
+    reports_cmds.cmd_reports_aging(
+        SimpleNamespace(by="client", page_size=50, format="csv")
+    )
+    lines = capsys.readouterr().out.splitlines()
+
+    assert captured == {"by": "client", "page_size": 50}
+    assert lines == [
+        "entity_id,label,contracts,bucket_0_30,bucket_31_60,bucket_61_90,"
+        "bucket_91_plus,amount_due,oldest_days,share",
+        "4,Client Acme,2,100.00,0,0,50.00,150.00,120,100.0",
+    ]
+    assert dummy_session_rb.closed is True
+
+
+def test_cmd_reports_financial_shows_snapshot_age(
+    monkeypatch, capsys, dummy_session_rb
+):
+    """reports financial: l'âge de l'instantané précède la table."""
+    monkeypatch.setattr(reports_cmds, "get_session", lambda: dummy_session_rb)
+    monkeypatch.setattr(
+        reports_cmds, "get_current_employee", lambda s: SimpleNamespace()
+    )
+    refreshed_at = datetime.now(timezone.utc) - timedelta(hours=2, minutes=5)
+    monkeypatch.setattr(
+        reports_cmds,
+        "financial_report",
+        lambda session, employee, by: ([], refreshed_at),
+    )
+
+    reports_cmds.cmd_reports_financial(SimpleNamespace(by="client", format="table"))
+    out = capsys.readouterr().out
+
+    assert "il y a 2 h 05 min" in out
+    assert "Aucun contrat dans l'instantané." in out
+
+
+def test_fmt_age_never_refreshed():
+    assert reports_cmds._fmt_age(None) == "jamais rafraîchi"
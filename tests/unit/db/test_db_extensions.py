@@ -0,0 +1,21 @@
+from sqlalchemy import event
+
+from app.db.extensions import extension_installed
+
+
+def test_extension_installed_queries_catalog_once_per_engine(db_session):
+    """Le catalogue n'est interrogé qu'au premier appel pour un moteur donné."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        first = extension_installed(db_session, "plpgsql")
+        second = extension_installed(db_session, "plpgsql")
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    assert first is second is True
+    assert len([s for s in statements if "pg_extension" in s]) == 1
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import OperationalError
+
+from app.core.security import hash_password
+from app.db import routing
+from app.db.routing import RoutingSession, primary_reads, replica_reads
+from app.models.employee import Employee, Role
+
+
+@replica_reads
+def _read_ids(session):
+    return session.scalars(select(Employee.id)).all()
+
+
+@replica_reads
+def _iter_ids(session):
+    yield from session.scalars(select(Employee.id)).all()
+    yield from session.scalars(select(Employee.id)).all()
+
+
+@pytest.fixture
+def replica(engine, apply_migrations, monkeypatch):
+    """Second engine sur la même base, utilisé comme replica."""
+    replica_engine = create_engine(os.environ["DATABASE_URL"])
+    monkeypatch.setattr(routing, "get_replica_engine", lambda: replica_engine)
+    monkeypatch.delenv("EPICCRM_READ_PRIMARY", raising=False)
+    yield replica_engine
+    replica_engine.dispose()
+
+
+@pytest.fixture
+def executed(engine, replica):
+    """Liste des moteurs ("primary" / "replica") ayant exécuté chaque requête."""
+    log: list[str] = []
+
+    def on_primary(*_args):
+        log.append("primary")
+
+    def on_replica(conn, cursor, statement, *_args):
+        # Le contrôle de retard n'est pas une lecture applicative
+        if "pg_is_in_recovery" not in statement:
+            log.append("replica")
+
+    event.listen(engine, "before_cursor_execute", on_primary)
+    event.listen(replica, "before_cursor_execute", on_replica)
+    yield log
+    event.remove(engine, "before_cursor_execute", on_primary)
+    event.remove(replica, "before_cursor_execute", on_replica)
+
+
+def test_marked_reads_go_to_replica_others_to_primary(engine, executed):
+    session = RoutingSession(bind=engine)
+    try:
+        session.scalars(select(Employee.id)).all()
+        _read_ids(session)
+    finally:
+        session.close()
+
+    assert executed == ["primary", "replica"]
+
+
+def test_lazy_results_are_read_on_replica_while_iterating(engine, executed):
+    session = RoutingSession(bind=engine)
+    try:
+        results = _iter_ids(session)
+        assert executed == []
+        list(results)
+    finally:
+        session.close()
+
+    assert executed == ["replica", "replica"]
+
+
+def test_stale_or_unreachable_replica_falls_back_to_primary(
+    engine, executed, monkeypatch
+):
+    monkeypatch.setattr(routing.config, "REPLICA_MAX_LAG_SECONDS", 5.0)
+    monkeypatch.setattr(routing, "replica_lag", lambda _engine: 60.0)
+    session = RoutingSession(bind=engine)
+    try:
+        _read_ids(session)
+    finally:
+        session.close()
+
+    def unreachable(_engine):
+        raise OperationalError("SELECT 1", {}, Exception("connexion refusée"))
+
+    monkeypatch.setattr(routing, "replica_lag", unreachable)
+    session = RoutingSession(bind=engine)
+    try:
+        _read_ids(session)
+    finally:
+        session.close()
+
+    assert executed == ["primary", "primary"]
+
+
+def test_session_reads_its_own_writes_on_primary(engine, executed):
+    session = RoutingSession(bind=engine)
+    try:
+        session.add(
+            Employee(
+                first_name="Read",
+                last_name="Writes",
+                email="ryw@test.com",
+                role=Role.SUPPORT,
+                password_hash=hash_password("Secret123!"),
+            )
+        )
+        session.flush()
+        executed.clear()
+
+        ids = _read_ids(session)
+        assert len(ids) >= 1
+    finally:
+        session.rollback()
+        session.close()
+
+    assert executed == ["primary"]
+
+
+def test_forced_primary_reads_and_locking_reads(engine, executed, monkeypatch):
+    session = RoutingSession(bind=engine)
+    try:
+        with primary_reads(session):
+            _read_ids(session)
+
+        replica_reads(lambda s: s.scalars(select(Employee.id).with_for_update()).all())(
+            session
+        )
+
+        monkeypatch.setenv("EPICCRM_READ_PRIMARY", "true")
+        _read_ids(session)
+    finally:
+        session.rollback()
+        session.close()
+
+    assert executed == ["primary", "primary", "primary"]
+
+
+def test_replica_reads_is_transparent_without_replica(engine, monkeypatch):
+    monkeypatch.setattr(routing, "get_replica_engine", lambda: None)
+    session = RoutingSession(bind=engine)
+    try:
+        assert isinstance(_read_ids(session), list)
+    finally:
+        session.close()
@@ -19,3 +19,5 @@ def test_sessionmaker_called_with_expected_args(monkeypatch):
     assert mod.SessionLocal == "SESSIONMAKER_RETURN"
     assert calls["autoflush"] is False
     assert calls["autocommit"] is False
+    assert calls["expire_on_commit"] is False
+    assert calls["class_"].__name__ == "RoutingSession"
@@ -44,6 +44,13 @@ def test_clients_email_unique_constraint_named(clients_table: Table):
     assert "uq_clients_email" in {c.name for c in clients_table.constraints}
 
 
+def test_clients_email_lower_unique_index(clients_table: Table):
+    """Vérifie l'index UNIQUE fonctionnel uq_clients_email_lower (lower(email))."""
+    indexes = {ix.name: ix for ix in clients_table.indexes}
+    assert "uq_clients_email_lower" in indexes
+    assert indexes["uq_clients_email_lower"].unique is True
+
+
 def test_clients_sales_contact_fk(clients_table: Table):
     """Vérifie la FK clients.sales_contact_id -> employees.id."""
     fks = list(clients_table.foreign_key_constraints)
@@ -40,6 +40,16 @@ def test_contracts_columns(contracts_table: Table):
     assert isinstance(cols.created_at.type, DateTime)
 
 
+def test_contracts_check_constraints_named(contracts_table: Table):
+    """Vérifie la présence des contraintes CHECK nommées sur les montants."""
+    names = {c.name for c in contracts_table.constraints}
+    assert {
+        "ck_contracts_total_amount_positive",
+        "ck_contracts_amount_due_non_negative",
+        "ck_contracts_amount_due_lte_total",
+    } <= names
+
+
 def test_contracts_client_fk(contracts_table: Table):
     """Vérifie la FK contracts.client_id -> clients.id."""
     fks = list(contracts_table.foreign_key_constraints)
@@ -47,6 +47,13 @@ def test_employees_email_unique_constraint_named(employees_table: Table):
     assert "uq_employees_email" in {c.name for c in employees_table.constraints}
 
 
+def test_employees_email_lower_unique_index(employees_table: Table):
+    """Vérifie l'index UNIQUE fonctionnel uq_employees_email_lower (lower(email))."""
+    indexes = {ix.name: ix for ix in employees_table.indexes}
+    assert "uq_employees_email_lower" in indexes
+    assert indexes["uq_employees_email_lower"].unique is True
+
+
 def test_employee_instance_creation():
     """Vérifie qu'une instance Employee se crée avec les champs attendus."""
     employee = Employee(
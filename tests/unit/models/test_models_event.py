@@ -45,6 +45,12 @@ def test_events_columns(events_table: Table):
     assert isinstance(cols.created_at.type, DateTime)
 
 
+def test_events_check_constraints_named(events_table: Table):
+    """Vérifie la présence des contraintes CHECK nommées sur dates et participants."""
+    names = {c.name for c in events_table.constraints}
+    assert {"ck_events_start_before_end", "ck_events_attendees_non_negative"} <= names
+
+
 def test_events_contract_fk(events_table: Table):
     """Vérifie la FK events.contract_id -> contracts.id."""
     fks = list(events_table.foreign_key_constraints)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import pytest
+
 from app.core.security import hash_password
 from app.models.client import Client
 from app.models.contract import Contract
@@ -10,7 +12,9 @@ from app.models.employee import Employee, Role
 from app.models.event import Event
 from app.repositories.client_repository import ClientRepository
 from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
 from app.repositories.event_repository import EventRepository
+from app.repositories.list_filters import InvalidSortError, ListFilters
 
 
 def test_client_repository_add_and_get_by_id(db_session):
@@ -42,6 +46,32 @@ def test_client_repository_add_and_get_by_id(db_session):
     assert loaded.email == "repo-client@test.com"
 
 
+def test_get_by_email_is_case_insensitive(db_session):
+    emp = Employee(
+        first_name="Sales",
+        last_name="Guy",
+        email="repo-case@test.com",
+        role=Role.SALES,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+
+    client = Client(
+        first_name="A",
+        last_name="B",
+        email="repo-case-client@test.com",
+        sales_contact_id=emp.id,
+    )
+    ClientRepository(db_session).add(client)
+    db_session.commit()
+
+    assert EmployeeRepository(db_session).get_by_email(" Repo-Case@TEST.com") is emp
+    assert (
+        ClientRepository(db_session).get_by_email("REPO-case-client@test.com") is client
+    )
+
+
 def test_contract_repository_add_and_get_by_id(db_session):
     emp = Employee(
         first_name="Mgmt",
@@ -144,3 +174,178 @@ def test_event_repository_add_and_get_by_id(db_session):
     loaded = repo.get_by_id(event.id)
     assert loaded is not None
     assert loaded.location == "Paris"
+
+
+def test_contract_repository_list_filters_and_sort(db_session):
+    emp = Employee(
+        first_name="Sales",
+        last_name="Guy",
+        email="repo-filters@test.com",
+        role=Role.SALES,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+
+    acme = Client(
+        first_name="A",
+        last_name="B",
+        email="repo-acme@test.com",
+        company_name="ACME",
+        sales_contact_id=emp.id,
+    )
+    other = Client(
+        first_name="C",
+        last_name="D",
+        email="repo-other@test.com",
+        company_name="Other",
+        sales_contact_id=emp.id,
+    )
+    db_session.add_all([acme, other])
+    db_session.commit()
+
+    small = Contract(
+        client_id=acme.id,
+        sales_contact_id=emp.id,
+        total_amount=Decimal("100.00"),
+        amount_due=Decimal("50.00"),
+        is_signed=True,
+    )
+    big = Contract(
+        client_id=acme.id,
+        sales_contact_id=emp.id,
+        total_amount=Decimal("900.00"),
+        amount_due=Decimal("800.00"),
+        is_signed=True,
+    )
+    foreign = Contract(
+        client_id=other.id,
+        sales_contact_id=emp.id,
+        total_amount=Decimal("900.00"),
+        amount_due=Decimal("900.00"),
+        is_signed=True,
+    )
+    db_session.add_all([small, big, foreign])
+    db_session.commit()
+
+    repo = ContractRepository(db_session)
+
+    assert repo.list_filtered(filters=ListFilters(company="acme")) == [small, big]
+    assert repo.list_filtered(
+        filters=ListFilters(client_id=acme.id, min_due=Decimal("100"))
+    ) == [big]
+    assert repo.list_filtered(
+        filters=ListFilters(company="ACME", sort="amount_due:desc")
+    ) == [big, small]
+    assert (
+        repo.list_filtered(
+            filters=ListFilters(created_after=datetime.now(timezone.utc) + timedelta(1))
+        )
+        == []
+    )
+
+
+def test_list_filtered_rejects_unknown_sort_column(db_session):
+    repo = ClientRepository(db_session)
+
+    with pytest.raises(InvalidSortError):
+        repo.list_filtered(filters=ListFilters(sort="password_hash"))
+
+    with pytest.raises(InvalidSortError):
+        repo.list_filtered(filters=ListFilters(sort="created_at:sideways"))
+
+
+def test_count_filtered_matches_list_filtered(db_session):
+    emp = Employee(
+        first_name="Sales",
+        last_name="Guy",
+        email="repo-count@test.com",
+        role=Role.SALES,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+
+    client = Client(
+        first_name="A",
+        last_name="B",
+        email="repo-count-client@test.com",
+        sales_contact_id=emp.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+
+    for signed in (True, False, False):
+        db_session.add(
+            Contract(
+                client_id=client.id,
+                sales_contact_id=emp.id,
+                total_amount=Decimal("100.00"),
+                amount_due=Decimal("100.00"),
+                is_signed=signed,
+            )
+        )
+    db_session.commit()
+
+    repo = ContractRepository(db_session)
+    filters = ListFilters(client_id=client.id)
+
+    assert repo.count_filtered(unsigned=True, filters=filters) == 2
+    assert repo.count_filtered(filters=filters) == len(
+        repo.list_filtered(filters=filters)
+    )
+
+    # Estimation : entier positif, sans matérialiser les lignes
+    approx = repo.count_filtered(unsigned=True, filters=filters, approx=True)
+    assert isinstance(approx, int)
+    assert approx >= 0
+
+    assert EmployeeRepository(db_session).count(Role.SALES) >= 1
+    assert EmployeeRepository(db_session).count(approx=True) >= 0
+
+
+def test_iter_filtered_keyset_pages_match_list(db_session):
+    emp = Employee(
+        first_name="Sales",
+        last_name="Guy",
+        email="repo-keyset@test.com",
+        role=Role.SALES,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+
+    client = Client(
+        first_name="A",
+        last_name="B",
+        email="repo-keyset-client@test.com",
+        sales_contact_id=emp.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+
+    # Montants dupliqués : la clé (amount_due, id) départage les pages
+    for due in ("10.00", "30.00", "30.00", "20.00", "30.00"):
+        db_session.add(
+            Contract(
+                client_id=client.id,
+                sales_contact_id=emp.id,
+                total_amount=Decimal("100.00"),
+                amount_due=Decimal(due),
+                is_signed=True,
+            )
+        )
+    db_session.commit()
+
+    repo = ContractRepository(db_session)
+    filters = ListFilters(client_id=client.id, sort="amount_due:desc")
+
+    paged = list(repo.iter_filtered(filters=filters, page_size=2))
+
+    assert paged == repo.list_filtered(filters=filters)
+    assert [c.amount_due for c in paged] == sorted(
+        (c.amount_due for c in paged), reverse=True
+    )
+
+    with pytest.raises(InvalidSortError):
+        repo.iter_filtered(filters=ListFilters(sort="is_signed"))
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
 import pytest
+from sqlalchemy import event, text
 
 from app.core.security import hash_password
+from app.models.contract import Contract
 from app.models.employee import Employee, Role
+from app.models.event import Event
 from app.services.client_service import (
     ClientAlreadyExistsError,
+    NotFoundError,
     PermissionDeniedError,
     ValidationError,
     create_client,
+    get_client_overview,
     list_clients,
+    search_clients,
 )
 
 
@@ -104,3 +113,220 @@ def test_create_client_duplicate_email_raises(db_session):
             phone=None,
             company_name=None,
         )
+
+
+def test_create_client_no_reload_query_after_commit(db_session):
+    """Avec expire_on_commit=False, lire le client créé n'émet aucun SELECT."""
+    db_session.expire_on_commit = False
+    sales = _create_employee(db_session, email="sales5@test.com", role=Role.SALES)
+
+    client = create_client(
+        session=db_session,
+        current_employee=sales,
+        first_name="Jean",
+        last_name="Dupont",
+        email="no-reload@test.com",
+        phone=None,
+        company_name=None,
+    )
+
+    statements: list[str] = []
+    event.listen(
+        db_session.bind,
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *a: statements.append(stmt),
+    )
+
+    assert client.id is not None
+    assert client.created_at is not None
+    assert client.sales_contact_id == sales.id
+    assert statements == []
+
+
+def _create_clients_for(db_session, sales: Employee, other: Employee) -> None:
+    for idx, owner in enumerate([sales, other, other]):
+        create_client(
+            session=db_session,
+            current_employee=owner,
+            first_name="Client",
+            last_name=str(idx),
+            email=f"scope{idx}@test.com",
+        )
+
+
+def test_list_clients_sales_defaults_to_own_portfolio(db_session):
+    sales = _create_employee(db_session, email="sales6@test.com", role=Role.SALES)
+    other = _create_employee(db_session, email="sales7@test.com", role=Role.SALES)
+    _create_clients_for(db_session, sales, other)
+
+    mine = list_clients(session=db_session, current_employee=sales)
+    everyone = list_clients(session=db_session, current_employee=sales, scope="all")
+
+    assert [c.sales_contact_id for c in mine] == [sales.id]
+    assert len(everyone) == 3
+
+
+def test_list_clients_management_defaults_to_all(db_session):
+    sales = _create_employee(db_session, email="sales8@test.com", role=Role.SALES)
+    other = _create_employee(db_session, email="sales9@test.com", role=Role.SALES)
+    mgmt = _create_employee(db_session, email="mgmt2@test.com", role=Role.MANAGEMENT)
+    _create_clients_for(db_session, sales, other)
+
+    assert len(list_clients(session=db_session, current_employee=mgmt)) == 3
+
+
+def test_list_clients_rls_mode_sets_transaction_scope(rls_mode):
+    """En mode RLS, la lecture "mine" endosse le rôle de portée (SET LOCAL ROLE)."""
+    sales = _create_employee(rls_mode, email="sales10@test.com", role=Role.SALES)
+
+    list_clients(session=rls_mode, current_employee=sales, scope="mine")
+
+    settings = rls_mode.execute(
+        text("SELECT current_user, current_setting('epiccrm.employee_id', true)")
+    ).one()
+    assert tuple(settings) == ("epiccrm_scope_clients", str(sales.id))
+
+
+def test_search_clients_matches_across_fields_and_pages(db_session):
+    mgmt = _create_employee(db_session, email="mgmt3@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="sales11@test.com", role=Role.SALES)
+    for idx, company in enumerate(("Acme", "ACME Corp", "Globex")):
+        create_client(
+            session=db_session,
+            current_employee=sales,
+            first_name="Client",
+            last_name=f"Search{idx}",
+            email=f"search{idx}@test.com",
+            company_name=company,
+        )
+
+    results = search_clients(session=db_session, current_employee=mgmt, query="acme")
+    assert {c.company_name for c, _score in results} == {"Acme", "ACME Corp"}
+
+    # Les jokers LIKE saisis sont pris littéralement
+    assert search_clients(session=db_session, current_employee=mgmt, query="%") == []
+
+    first = search_clients(
+        session=db_session, current_employee=mgmt, query="search", limit=2
+    )
+    second = search_clients(
+        session=db_session, current_employee=mgmt, query="search", limit=2, page=2
+    )
+    assert len(first) == 2
+    assert len(second) == 1
+    assert {c.id for c, _ in first}.isdisjoint({c.id for c, _ in second})
+
+
+def test_search_clients_rejects_empty_query(db_session):
+    mgmt = _create_employee(db_session, email="mgmt4@test.com", role=Role.MANAGEMENT)
+
+    with pytest.raises(ValidationError):
+        search_clients(session=db_session, current_employee=mgmt, query="  ")
+
+
+def test_get_client_overview_loads_everything_in_one_query(db_session):
+    sales = _create_employee(db_session, email="sales12@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="sup1@test.com", role=Role.SUPPORT)
+    client = create_client(
+        session=db_session,
+        current_employee=sales,
+        first_name="Jean",
+        last_name="Vue",
+        email="vue360@test.com",
+        company_name="Acme",
+    )
+    signed = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000.50"),
+        amount_due=Decimal("250.25"),
+        is_signed=True,
+    )
+    pending = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("300"),
+        amount_due=Decimal("300"),
+        is_signed=False,
+    )
+    db_session.add_all([signed, pending])
+    db_session.commit()
+
+    start = datetime(2030, 5, 1, 9, 0, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            Event(
+                client_id=client.id,
+                contract_id=signed.id,
+                support_contact_id=None,
+                start_date=start + timedelta(days=7),
+                end_date=start + timedelta(days=7, hours=3),
+                location="Lyon",
+                attendees=50,
+            ),
+            Event(
+                client_id=client.id,
+                contract_id=signed.id,
+                support_contact_id=support.id,
+                start_date=start,
+                end_date=start + timedelta(hours=2),
+                location="Paris",
+                attendees=20,
+            ),
+        ]
+    )
+    db_session.commit()
+    client_id, signed_id, pending_id = client.id, signed.id, pending.id
+    db_session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, stmt, *args):
+        statements.append(stmt)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        overview = get_client_overview(db_session, sales, client_id)
+        # Le commercial du client est chargé par la même requête
+        assert overview.client.sales_contact.email == "sales12@test.com"
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert overview.client.email == "vue360@test.com"
+    assert [(ct.id, ct.is_signed) for ct in overview.contracts] == [
+        (signed_id, True),
+        (pending_id, False),
+    ]
+    assert overview.contracts[0].amount_due == Decimal("250.25")
+    assert overview.contracts[0].sales_name == "Test User"
+
+    # Événements par date de début, support absent -> None
+    assert [(ev.location, ev.support_name) for ev in overview.events] == [
+        ("Paris", "Test User"),
+        ("Lyon", None),
+    ]
+    assert overview.events[0].start_date == start
+
+
+def test_get_client_overview_without_contracts(db_session):
+    sales = _create_employee(db_session, email="sales13@test.com", role=Role.SALES)
+    client = create_client(
+        session=db_session,
+        current_employee=sales,
+        first_name="Jean",
+        last_name="Seul",
+        email="seul@test.com",
+    )
+
+    overview = get_client_overview(db_session, sales, client.id)
+
+    assert overview.contracts == []
+    assert overview.events == []
+
+
+def test_get_client_overview_unknown_client(db_session):
+    sales = _create_employee(db_session, email="sales14@test.com", role=Role.SALES)
+
+    with pytest.raises(NotFoundError):
+        get_client_overview(db_session, sales, 999999)
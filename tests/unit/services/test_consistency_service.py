@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, text
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.consistency_service import (
+    PermissionDeniedError,
+    ValidationError,
+    check_consistency,
+)
+
+
+def _create_employee(
+    db_session, *, email: str, role: Role, is_active: bool = True
+) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+        is_active=is_active,
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_client(db_session, *, email: str, sales: Employee) -> Client:
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def _create_contract(db_session, client: Client, *, sales: Employee) -> Contract:
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000"),
+        amount_due=Decimal("0"),
+        is_signed=True,
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def _create_event(
+    db_session, contract: Contract, *, client_id: int, support=None, in_days=10
+) -> Event:
+    start = datetime.now(timezone.utc) + timedelta(days=in_days)
+    ev = Event(
+        client_id=client_id,
+        contract_id=contract.id,
+        support_contact_id=support.id if support else None,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def _by_name(reports):
+    return {r.name: r for r in reports}
+
+
+def test_check_consistency_reports_and_fixes_in_batches(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    other = _create_employee(db_session, email="o@test.com", role=Role.SALES)
+    gone = _create_employee(
+        db_session, email="gone@test.com", role=Role.SUPPORT, is_active=False
+    )
+
+    acme = _create_client(db_session, email="acme@test.com", sales=sales)
+    beta = _create_client(db_session, email="beta@test.com", sales=sales)
+    # Contrats suivis par un autre commercial que le client
+    drifted = [_create_contract(db_session, acme, sales=other) for _ in range(3)]
+    contract = _create_contract(db_session, acme, sales=sales)
+    # Événement rattaché au mauvais client, et un autre suivi par un support parti
+    wrong_client = _create_event(db_session, contract, client_id=beta.id)
+    orphaned_support = _create_event(
+        db_session, contract, client_id=acme.id, support=gone
+    )
+
+    reports = _by_name(check_consistency(db_session, manager))
+    assert reports["contract_sales_mismatch"].count == 3
+    assert reports["contract_sales_mismatch"].samples == sorted(c.id for c in drifted)
+    assert reports["event_client_mismatch"].samples == [wrong_client.id]
+    assert reports["inactive_event_support"].samples == [orphaned_support.id]
+    assert reports["inactive_client_sales"].count == 0
+    assert all(r.fixed == 0 for r in reports.values())
+
+    reports = _by_name(check_consistency(db_session, manager, fix=True, batch_size=2))
+    # Signalement seul : une réassignation de contrat peut être volontaire
+    assert reports["contract_sales_mismatch"].fixed == 0
+    assert reports["event_client_mismatch"].fixed == 1
+    assert reports["inactive_event_support"].fixed == 1
+
+    assert set(
+        db_session.scalars(
+            select(Contract.sales_contact_id).where(Contract.client_id == acme.id)
+        )
+    ) == {sales.id, other.id}
+    db_session.expire_all()
+    assert db_session.get(Event, wrong_client.id).client_id == acme.id
+    assert db_session.get(Event, orphaned_support.id).support_contact_id is None
+
+    reports = _by_name(check_consistency(db_session, manager))
+    assert reports.pop("contract_sales_mismatch").count == 3
+    assert sum(r.count for r in reports.values()) == 0
+
+
+def test_check_consistency_detects_orphaned_references(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    acme = _create_client(db_session, email="acme@test.com", sales=sales)
+
+    # Clés étrangères contournées (import partiel, contrainte désactivée...)
+    db_session.execute(text("SET LOCAL session_replication_role = replica"))
+    db_session.execute(
+        text(
+            "INSERT INTO contracts (client_id, sales_contact_id, total_amount, "
+            "amount_due, is_signed) VALUES (:client_id, 999999, 10, 0, false)"
+        ),
+        {"client_id": acme.id},
+    )
+    db_session.execute(text("SET LOCAL session_replication_role = DEFAULT"))
+
+    reports = _by_name(check_consistency(db_session, manager))
+
+    assert reports["orphan_contracts_sales_contact_id"].count == 1
+    assert not reports["orphan_contracts_sales_contact_id"].fixable
+    assert reports["orphan_contracts_client_id"].count == 0
+
+
+def test_check_consistency_management_only(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+
+    with pytest.raises(PermissionDeniedError):
+        check_consistency(db_session, sales)
+
+
+def test_check_consistency_rejects_invalid_batch_size(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+
+    with pytest.raises(ValidationError):
+        check_consistency(db_session, manager, fix=True, batch_size=0)
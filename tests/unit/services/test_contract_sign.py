@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.services.contract_service import (
+    NotFoundError,
+    PermissionDeniedError,
+    ValidationError,
+    sign_contract,
+)
+
+
+def _create_employee(db_session, *, email: str, role: Role) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_contract(db_session, *, sales: Employee, is_signed: bool) -> Contract:
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email=f"client-{is_signed}@test.com",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("1000.00"),
+        is_signed=is_signed,
+    )
+    db_session.add(contract)
+    db_session.commit()
+    db_session.refresh(contract)
+    return contract
+
+
+def test_sign_contract_management_ok(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    contract = _create_contract(db_session, sales=sales, is_signed=False)
+
+    signed = sign_contract(
+        session=db_session, current_employee=manager, contract_id=contract.id
+    )
+
+    assert signed.id == contract.id
+    assert signed.is_signed is True
+
+
+def test_sign_contract_already_signed_raises_validation(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    contract = _create_contract(db_session, sales=sales, is_signed=True)
+
+    with pytest.raises(ValidationError):
+        sign_contract(
+            session=db_session, current_employee=manager, contract_id=contract.id
+        )
+
+
+def test_sign_contract_not_found(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+
+    with pytest.raises(NotFoundError):
+        sign_contract(session=db_session, current_employee=manager, contract_id=999999)
+
+
+def test_sign_contract_denied_if_not_management(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    contract = _create_contract(db_session, sales=sales, is_signed=False)
+
+    with pytest.raises(PermissionDeniedError):
+        sign_contract(
+            session=db_session, current_employee=sales, contract_id=contract.id
+        )
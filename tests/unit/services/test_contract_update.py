@@ -3,6 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 
 from app.core.security import hash_password
 from app.models.client import Client
@@ -171,3 +172,37 @@ def test_update_contract_due_ok_if_total_updated_too(db_session, manager, contra
     )
     assert updated.total_amount == Decimal("1500.00")
     assert updated.amount_due == Decimal("1200.00")
+
+
+def test_update_contract_maps_check_violation(db_session, manager, contract):
+    """Une contrainte CHECK violée par l'UPDATE est traduite en ValidationError."""
+    with pytest.raises(ValidationError, match="ne peut pas dépasser le total"):
+        update_contract(
+            session=db_session,
+            current_employee=manager,
+            contract_id=contract.id,
+            amount_due=Decimal("5000.00"),
+        )
+
+
+def test_update_contract_single_update_statement(db_session, sales, contract):
+    """La mise à jour autorisée se fait en un seul UPDATE ... RETURNING."""
+    db_session.expire_on_commit = False
+    statements: list[str] = []
+    event.listen(
+        db_session.connection(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *a: statements.append(stmt),
+    )
+
+    updated = update_contract(
+        session=db_session,
+        current_employee=sales,
+        contract_id=contract.id,
+        amount_due=Decimal("100.00"),
+    )
+
+    assert updated.amount_due == Decimal("100.00")
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE CONTRACTS")
+    assert "RETURNING" in statements[0].upper()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.dashboard_service import PermissionDeniedError, build_dashboard
+
+
+def _create_employee(
+    db_session, *, email: str, role: Role, is_active: bool = True
+) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name=email.split("@")[0],
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+        is_active=is_active,
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_client(db_session, *, email: str, sales: Employee) -> Client:
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def _create_contract(db_session, client, *, total, due, signed) -> Contract:
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=client.sales_contact_id,
+        total_amount=Decimal(total),
+        amount_due=Decimal(due),
+        is_signed=signed,
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def _create_event(db_session, contract, start, *, support=None) -> Event:
+    ev = Event(
+        client_id=contract.client_id,
+        contract_id=contract.id,
+        support_contact_id=support.id if support else None,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def test_build_dashboard_aggregates(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice@test.com", role=Role.SALES)
+    bob = _create_employee(db_session, email="bob@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="sup@test.com", role=Role.SUPPORT)
+    _create_employee(db_session, email="old@test.com", role=Role.SALES, is_active=False)
+
+    acme = _create_client(db_session, email="acme@test.com", sales=alice)
+    _create_client(db_session, email="idle@test.com", sales=bob)
+    signed = _create_contract(db_session, acme, total="1000", due="400", signed=True)
+    _create_contract(db_session, acme, total="500", due="500", signed=False)
+
+    now = datetime.now(timezone.utc)
+    _create_event(db_session, signed, now - timedelta(days=30), support=support)
+    _create_event(db_session, signed, now + timedelta(days=2), support=support)
+    _create_event(db_session, signed, now + timedelta(days=3))
+    _create_event(db_session, signed, now + timedelta(days=20))
+
+    dashboard = build_dashboard(db_session, manager)
+
+    assert (dashboard.contracts, dashboard.signed_contracts) == (2, 1)
+    assert dashboard.total_amount == Decimal("1500")
+    assert dashboard.amount_due == Decimal("900")
+    # Commerciaux actifs, y compris sans contrat ; les plus gros restants dus d'abord
+    assert [
+        (s.employee_id, s.signed, s.unsigned, s.amount_due) for s in dashboard.sales
+    ] == [(alice.id, 1, 1, Decimal("900")), (bob.id, 0, 0, Decimal("0"))]
+    assert [(s.employee_id, s.events, s.upcoming) for s in dashboard.supports] == [
+        (support.id, 2, 1)
+    ]
+    assert (dashboard.unassigned_upcoming, dashboard.unassigned_within_week) == (2, 1)
+    assert dashboard.clients_without_contract == 1
+
+
+def test_build_dashboard_management_only(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+
+    with pytest.raises(PermissionDeniedError):
+        build_dashboard(db_session, sales)
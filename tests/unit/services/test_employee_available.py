@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.employee_service import ValidationError, available_employees
+
+
+def _create_employee(
+    db_session, *, email: str, role: Role, is_active: bool = True
+) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+        is_active=is_active,
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_contract(db_session, *, sales: Employee) -> Contract:
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email="client-available@test.com",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("0.00"),
+        is_signed=True,
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def _assign(db_session, contract: Contract, support: Employee, start: datetime):
+    db_session.add(
+        Event(
+            client_id=contract.client_id,
+            contract_id=contract.id,
+            support_contact_id=support.id,
+            start_date=start,
+            end_date=start + timedelta(hours=3),
+            location="Paris",
+            attendees=10,
+        )
+    )
+    db_session.commit()
+
+
+def test_available_employees_excludes_busy_and_orders_by_workload(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    busy = _create_employee(db_session, email="busy@test.com", role=Role.SUPPORT)
+    loaded = _create_employee(db_session, email="loaded@test.com", role=Role.SUPPORT)
+    free = _create_employee(db_session, email="free@test.com", role=Role.SUPPORT)
+    _create_employee(
+        db_session, email="inactive@test.com", role=Role.SUPPORT, is_active=False
+    )
+    contract = _create_contract(db_session, sales=sales)
+
+    window = datetime.now(timezone.utc) + timedelta(days=10)
+    _assign(db_session, contract, busy, window + timedelta(hours=1))
+    _assign(db_session, contract, loaded, window + timedelta(days=3))
+    _assign(db_session, contract, loaded, window + timedelta(days=4))
+
+    result = available_employees(
+        session=db_session,
+        current_employee=manager,
+        period_start=window,
+        period_end=window + timedelta(days=1),
+    )
+
+    assert [(e.id, load) for e, load in result] == [(free.id, 0), (loaded.id, 2)]
+
+
+def test_available_employees_rejects_inverted_period(db_session):
+    manager = _create_employee(db_session, email="m2@test.com", role=Role.MANAGEMENT)
+    now = datetime.now(timezone.utc)
+
+    with pytest.raises(ValidationError):
+        available_employees(
+            session=db_session,
+            current_employee=manager,
+            period_start=now,
+            period_end=now - timedelta(hours=1),
+        )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.employee_service import (
+    NotFoundError,
+    PermissionDeniedError,
+    employee_workload,
+)
+
+
+def _create_employee(db_session, *, email: str, role: Role) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_client(db_session, *, email: str, sales: Employee) -> Client:
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def _create_contract(db_session, client: Client, *, total, due, signed) -> Contract:
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=client.sales_contact_id,
+        total_amount=Decimal(total),
+        amount_due=Decimal(due),
+        is_signed=signed,
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def _assign(db_session, contract: Contract, support: Employee, start: datetime):
+    db_session.add(
+        Event(
+            client_id=contract.client_id,
+            contract_id=contract.id,
+            support_contact_id=support.id,
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            location="Paris",
+            attendees=10,
+        )
+    )
+    db_session.commit()
+
+
+def test_employee_workload_sales_portfolio(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    other = _create_employee(db_session, email="o@test.com", role=Role.SALES)
+
+    acme = _create_client(db_session, email="acme@test.com", sales=sales)
+    _create_client(db_session, email="beta@test.com", sales=sales)
+    gamma = _create_client(db_session, email="gamma@test.com", sales=other)
+    _create_contract(db_session, acme, total="1000", due="400", signed=True)
+    _create_contract(db_session, acme, total="500", due="0", signed=True)
+    _create_contract(db_session, acme, total="200", due="200", signed=False)
+    _create_contract(db_session, gamma, total="900", due="900", signed=True)
+
+    # Objets expirés par les commits : rechargés avant la mesure
+    sales_id = sales.id
+    db_session.refresh(manager)
+    statements: list[str] = []
+
+    def record(conn, cursor, stmt, *args):
+        statements.append(stmt)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        employee, load = employee_workload(db_session, manager, sales_id)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert employee.id == sales_id
+    assert (load.clients, load.contracts) == (2, 3)
+    assert (load.signed_contracts, load.unpaid_contracts) == (2, 2)
+    assert load.total_amount == Decimal("1700")
+    assert load.amount_due == Decimal("600")
+    assert (load.upcoming_events, load.past_events) == (0, 0)
+
+
+def test_employee_workload_support_events(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="sup@test.com", role=Role.SUPPORT)
+    client = _create_client(db_session, email="acme@test.com", sales=sales)
+    contract = _create_contract(db_session, client, total="1000", due="0", signed=True)
+
+    now = datetime.now(timezone.utc)
+    _assign(db_session, contract, support, now - timedelta(days=10))
+    _assign(db_session, contract, support, now + timedelta(days=3))
+    _assign(db_session, contract, support, now + timedelta(days=6))
+
+    _employee, load = employee_workload(db_session, manager, support.id)
+
+    assert (load.upcoming_events, load.past_events) == (2, 1)
+    assert (load.clients, load.contracts) == (0, 0)
+    assert load.amount_due == Decimal("0")
+
+
+def test_employee_workload_requires_management(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+
+    with pytest.raises(PermissionDeniedError):
+        employee_workload(db_session, sales, sales.id)
+
+
+def test_employee_workload_unknown_employee(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+
+    with pytest.raises(NotFoundError):
+        employee_workload(db_session, manager, 999999)
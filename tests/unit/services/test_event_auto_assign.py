@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.event_service import PermissionDeniedError, auto_assign_events
+
+
+def _create_employee(
+    db_session, *, email: str, role: Role, is_active: bool = True
+) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+        is_active=is_active,
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+@pytest.fixture()
+def contract(db_session) -> Contract:
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email="c@test.com",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    ct = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("0.00"),
+        is_signed=True,
+    )
+    db_session.add(ct)
+    db_session.commit()
+    return ct
+
+
+def _create_event(db_session, contract, start, *, support_id=None) -> Event:
+    ev = Event(
+        client_id=contract.client_id,
+        contract_id=contract.id,
+        support_contact_id=support_id,
+        start_date=start,
+        end_date=start + timedelta(hours=4),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def test_auto_assign_balances_load_and_respects_overlaps(db_session, contract):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice@test.com", role=Role.SUPPORT)
+    bob = _create_employee(db_session, email="bob@test.com", role=Role.SUPPORT)
+    _create_employee(
+        db_session, email="off@test.com", role=Role.SUPPORT, is_active=False
+    )
+
+    day = datetime.now(timezone.utc) + timedelta(days=20)
+    # Alice est déjà occupée le matin : l'événement de 9h revient à Bob
+    _create_event(db_session, contract, day, support_id=alice.id)
+    morning = _create_event(db_session, contract, day + timedelta(hours=1))
+    # Deux événements simultanés l'après-midi : un par support
+    noon_a = _create_event(db_session, contract, day + timedelta(hours=6))
+    noon_b = _create_event(db_session, contract, day + timedelta(hours=6))
+    # Troisième simultané : plus personne de libre
+    noon_c = _create_event(db_session, contract, day + timedelta(hours=6))
+
+    preview = auto_assign_events(
+        session=db_session, current_employee=manager, dry_run=True
+    )
+    expected = {
+        morning.id: bob.id,
+        noon_a.id: alice.id,
+        noon_b.id: bob.id,
+        noon_c.id: None,
+    }
+    assert {ev.id: (s.id if s else None) for ev, s in preview} == expected
+    # Simulation : rien n'est écrit
+    db_session.expire_all()
+    assert db_session.get(Event, morning.id).support_contact_id is None
+
+    auto_assign_events(session=db_session, current_employee=manager)
+    db_session.expire_all()
+    assigned = {
+        ev_id: db_session.get(Event, ev_id).support_contact_id for ev_id in expected
+    }
+    assert assigned == expected
+
+
+def test_auto_assign_counts_earlier_picks_in_load(db_session, contract):
+    """Créneaux successifs libres : les choix précédents comptent dans la charge."""
+    manager = _create_employee(db_session, email="m4@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice4@test.com", role=Role.SUPPORT)
+    bob = _create_employee(db_session, email="bob4@test.com", role=Role.SUPPORT)
+    day = datetime.now(timezone.utc) + timedelta(days=50)
+    events = [
+        _create_event(db_session, contract, day + timedelta(days=offset))
+        for offset in range(4)
+    ]
+
+    plan = auto_assign_events(
+        session=db_session, current_employee=manager, dry_run=True
+    )
+
+    assert [(ev.id, s.id) for ev, s in plan] == [
+        (events[0].id, alice.id),
+        (events[1].id, bob.id),
+        (events[2].id, alice.id),
+        (events[3].id, bob.id),
+    ]
+
+
+def test_auto_assign_returns_up_to_date_events(db_session, contract):
+    """Les événements du plan reflètent l'assignation, sans rechargement."""
+    db_session.expire_on_commit = False
+    manager = _create_employee(db_session, email="m3@test.com", role=Role.MANAGEMENT)
+    support = _create_employee(db_session, email="s3@test.com", role=Role.SUPPORT)
+    event = _create_event(
+        db_session, contract, datetime.now(timezone.utc) + timedelta(days=40)
+    )
+
+    plan = auto_assign_events(session=db_session, current_employee=manager)
+
+    assert [(ev, s) for ev, s in plan] == [(event, support)]
+    assert event.support_contact_id == support.id
+    assert event.updated_at is not None
+
+
+def test_auto_assign_window_and_permissions(db_session, contract):
+    manager = _create_employee(db_session, email="m2@test.com", role=Role.MANAGEMENT)
+    support = _create_employee(db_session, email="sup@test.com", role=Role.SUPPORT)
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    inside = _create_event(db_session, contract, start)
+    _create_event(db_session, contract, start + timedelta(days=5))
+
+    plan = auto_assign_events(
+        session=db_session,
+        current_employee=manager,
+        period_start=start,
+        period_end=start + timedelta(days=1),
+    )
+    assert [(ev.id, s.id) for ev, s in plan] == [(inside.id, support.id)]
+
+    with pytest.raises(PermissionDeniedError):
+        auto_assign_events(session=db_session, current_employee=support)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.services.event_service import (
+    PermissionDeniedError,
+    ValidationError,
+    claim_events,
+)
+
+
+def _create_employee(db_session, *, email: str, role: Role) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+@pytest.fixture()
+def contract(db_session) -> Contract:
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+    client = Client(
+        first_name="Client",
+        last_name="Test",
+        email="c@test.com",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    ct = Contract(
+        client_id=client.id,
+        sales_contact_id=sales.id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("0.00"),
+        is_signed=True,
+    )
+    db_session.add(ct)
+    db_session.commit()
+    return ct
+
+
+def _create_event(db_session, contract, start, *, support_id=None) -> Event:
+    ev = Event(
+        client_id=contract.client_id,
+        contract_id=contract.id,
+        support_contact_id=support_id,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def test_claim_events_takes_next_non_overlapping_events(db_session, contract):
+    support = _create_employee(db_session, email="sup@test.com", role=Role.SUPPORT)
+    day = datetime.now(timezone.utc) + timedelta(days=3)
+
+    # Terminé : jamais proposé
+    _create_event(db_session, contract, day - timedelta(days=10))
+    # Chevauche un événement déjà assigné au support : ignoré
+    _create_event(db_session, contract, day, support_id=support.id)
+    _create_event(db_session, contract, day + timedelta(hours=1))
+    first = _create_event(db_session, contract, day + timedelta(hours=4))
+    # Chevauche `first` : non retenu dans le même lot
+    _create_event(db_session, contract, day + timedelta(hours=5))
+    second = _create_event(db_session, contract, day + timedelta(days=1))
+
+    claimed = claim_events(session=db_session, current_employee=support, count=3)
+
+    assert [ev.id for ev in claimed] == [first.id, second.id]
+    assert all(ev.support_contact_id == support.id for ev in claimed)
+
+
+def test_claim_events_fills_count_past_overlapping_candidates(db_session, contract):
+    """Les candidats écartés (chevauchement) sont remplacés par les suivants."""
+    support = _create_employee(db_session, email="sup3@test.com", role=Role.SUPPORT)
+    day = datetime.now(timezone.utc) + timedelta(days=3)
+
+    first = _create_event(db_session, contract, day)
+    _create_event(db_session, contract, day + timedelta(hours=1))
+    _create_event(db_session, contract, day + timedelta(hours=1))
+    second = _create_event(db_session, contract, day + timedelta(days=1))
+    _create_event(db_session, contract, day + timedelta(days=2))
+
+    claimed = claim_events(session=db_session, current_employee=support, count=2)
+
+    assert [ev.id for ev in claimed] == [first.id, second.id]
+
+
+def test_claim_events_rules(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    support = _create_employee(db_session, email="sup2@test.com", role=Role.SUPPORT)
+
+    with pytest.raises(PermissionDeniedError):
+        claim_events(session=db_session, current_employee=manager)
+    with pytest.raises(ValidationError):
+        claim_events(session=db_session, current_employee=support, count=0)
+
+    assert claim_events(session=db_session, current_employee=support) == []
@@ -237,3 +237,35 @@ def test_reassign_event_target_employee_must_be_active(db_session):
             event_id=ev.id,
             support_contact_id=inactive_support.id,
         )
+
+
+def test_reassign_event_rejects_overlapping_support(db_session):
+    manager = _create_employee(db_session, email="m9@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s9@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="sup19@test.com", role=Role.SUPPORT)
+
+    client = _create_client(db_session, email="c9@test.com", sales_contact_id=sales.id)
+    contract = _create_contract(
+        db_session, client_id=client.id, sales_contact_id=sales.id, is_signed=True
+    )
+    _create_event(
+        db_session,
+        client_id=client.id,
+        contract_id=contract.id,
+        support_contact_id=support.id,
+    )
+    # Même créneau (à quelques microsecondes près), sans support
+    ev = _create_event(
+        db_session,
+        client_id=client.id,
+        contract_id=contract.id,
+        support_contact_id=None,
+    )
+
+    with pytest.raises(ValidationError, match="créneau"):
+        reassign_event(
+            session=db_session,
+            current_employee=manager,
+            event_id=ev.id,
+            support_contact_id=support.id,
+        )
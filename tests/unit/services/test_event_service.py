@@ -4,17 +4,23 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import text
 
 from app.core.security import hash_password
 from app.models.client import Client
 from app.models.contract import Contract
 from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.repositories.list_filters import ListFilters
 from app.services.event_service import (
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
+    calendar_events,
+    count_events,
     create_event,
     list_events,
+    search_events,
 )
 
 
@@ -188,3 +194,200 @@ def test_create_event_success(db_session):
     assert event.client_id == client.id
     assert event.contract_id == contract.id
     assert event.location == "Paris"
+
+
+def _create_event(db_session, *, client: Client, contract: Contract, support_id):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    ev = Event(
+        client_id=client.id,
+        contract_id=contract.id,
+        support_contact_id=support_id,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def test_list_events_scopes(db_session):
+    sales = _create_employee(db_session, email="s-scope@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="su-scope@test.com", role=Role.SUPPORT)
+    client = _create_client(
+        db_session, email="c-scope@test.com", sales_contact_id=sales.id
+    )
+    contract = _create_contract(
+        db_session, client_id=client.id, sales_contact_id=sales.id, is_signed=True
+    )
+    mine = _create_event(
+        db_session, client=client, contract=contract, support_id=support.id
+    )
+    unassigned = _create_event(
+        db_session, client=client, contract=contract, support_id=None
+    )
+
+    # SUPPORT : par défaut, uniquement ses événements
+    assert list_events(session=db_session, current_employee=support) == [mine]
+    assert list_events(session=db_session, current_employee=support, scope="all") == [
+        mine,
+        unassigned,
+    ]
+    # --without-support porte sur tous les événements
+    assert list_events(
+        session=db_session, current_employee=support, without_support=True
+    ) == [unassigned]
+    # SALES : par défaut, tous les événements
+    assert len(list_events(session=db_session, current_employee=sales)) == 2
+
+
+def test_search_events_ranks_location_and_notes_with_snippets(db_session):
+    mgmt = _create_employee(db_session, email="m-search@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s-search@test.com", role=Role.SALES)
+    client = _create_client(
+        db_session, email="c-search@test.com", sales_contact_id=sales.id
+    )
+    contract = _create_contract(
+        db_session, client_id=client.id, sales_contact_id=sales.id, is_signed=True
+    )
+    in_location = _create_event(
+        db_session, client=client, contract=contract, support_id=None
+    )
+    in_location.location = "Château de Lyon"
+    in_notes = _create_event(
+        db_session, client=client, contract=contract, support_id=None
+    )
+    in_notes.notes = "Prévoir des navettes depuis les châteaux voisins."
+    _create_event(db_session, client=client, contract=contract, support_id=None)
+    db_session.commit()
+
+    results = search_events(session=db_session, current_employee=mgmt, query="château")
+
+    # Le lieu (poids A) passe devant les notes (poids B) ; racines françaises
+    assert [ev.id for ev, _score, _snippet in results] == [in_location.id, in_notes.id]
+    assert "*Château*" in results[0][2]
+    assert "*châteaux*" in results[1][2]
+
+    excluded = search_events(
+        session=db_session, current_employee=mgmt, query="château -lyon"
+    )
+    assert [ev.id for ev, _score, _snippet in excluded] == [in_notes.id]
+
+
+def test_search_events_rejects_empty_query(db_session):
+    mgmt = _create_employee(
+        db_session, email="m-search2@test.com", role=Role.MANAGEMENT
+    )
+
+    with pytest.raises(ValidationError):
+        search_events(session=db_session, current_employee=mgmt, query="")
+
+
+def _create_event_at(db_session, *, client, contract, start, hours=2):
+    ev = Event(
+        client_id=client.id,
+        contract_id=contract.id,
+        start_date=start,
+        end_date=start + timedelta(hours=hours),
+        location="Paris",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def test_list_events_period_filter_keeps_overlapping_events(db_session):
+    mgmt = _create_employee(db_session, email="m-period@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s-period@test.com", role=Role.SALES)
+    client = _create_client(
+        db_session, email="c-period@test.com", sales_contact_id=sales.id
+    )
+    contract = _create_contract(
+        db_session, client_id=client.id, sales_contact_id=sales.id, is_signed=True
+    )
+    day = datetime(2030, 3, 4, tzinfo=timezone.utc)
+    before = _create_event_at(
+        db_session, client=client, contract=contract, start=day - timedelta(days=2)
+    )
+    # Commencé la veille, terminé pendant la période : retenu
+    spanning = _create_event_at(
+        db_session,
+        client=client,
+        contract=contract,
+        start=day - timedelta(hours=3),
+        hours=5,
+    )
+    inside = _create_event_at(
+        db_session, client=client, contract=contract, start=day + timedelta(hours=9)
+    )
+    after = _create_event_at(
+        db_session, client=client, contract=contract, start=day + timedelta(days=1)
+    )
+
+    period = ListFilters(period_start=day, period_end=day + timedelta(days=1))
+    result = list_events(session=db_session, current_employee=mgmt, filters=period)
+    assert [ev.id for ev in result] == [spanning.id, inside.id]
+    assert count_events(session=db_session, current_employee=mgmt, filters=period) == 2
+
+    # Borne ouverte
+    open_end = ListFilters(period_start=day + timedelta(hours=12))
+    assert [
+        ev.id
+        for ev in list_events(
+            session=db_session, current_employee=mgmt, filters=open_end
+        )
+    ] == [after.id]
+    assert before.id not in {ev.id for ev in result}
+
+    with pytest.raises(ValidationError):
+        list_events(
+            session=db_session,
+            current_employee=mgmt,
+            filters=ListFilters(period_start=day, period_end=day),
+        )
+
+
+def test_calendar_events_groups_by_day_and_week(db_session):
+    mgmt = _create_employee(db_session, email="m-cal@test.com", role=Role.MANAGEMENT)
+    sales = _create_employee(db_session, email="s-cal@test.com", role=Role.SALES)
+    client = _create_client(
+        db_session, email="c-cal@test.com", sales_contact_id=sales.id
+    )
+    contract = _create_contract(
+        db_session, client_id=client.id, sales_contact_id=sales.id, is_signed=True
+    )
+    monday = datetime(2030, 3, 4, 10, tzinfo=timezone.utc)
+    first = _create_event_at(db_session, client=client, contract=contract, start=monday)
+    second = _create_event_at(
+        db_session, client=client, contract=contract, start=monday + timedelta(hours=4)
+    )
+    third = _create_event_at(
+        db_session, client=client, contract=contract, start=monday + timedelta(days=2)
+    )
+
+    db_session.execute(text("SET LOCAL TIME ZONE 'UTC'"))
+    start = datetime(2030, 3, 4)
+    by_day = calendar_events(
+        session=db_session,
+        current_employee=mgmt,
+        period_start=start,
+        period_end=start + timedelta(days=7),
+    )
+    assert [(b.day, [ev.id for ev in evs]) for b, evs in by_day] == [
+        (4, [first.id, second.id]),
+        (6, [third.id]),
+    ]
+
+    by_week = calendar_events(
+        session=db_session,
+        current_employee=mgmt,
+        period_start=start,
+        unit="week",
+    )
+    assert len(by_week) == 1
+    assert [ev.id for ev in by_week[0][1]] == [first.id, second.id, third.id]
+
+    with pytest.raises(ValidationError):
+        calendar_events(session=db_session, current_employee=mgmt, unit="month")
@@ -238,3 +238,43 @@ def test_update_event_support_assignment_management_only(
         support_contact_id=support2.id,
     )
     assert updated.support_contact_id == support2.id
+
+
+def test_update_event_maps_check_violation(
+    db_session, manager, event_assigned_to_support
+):
+    """Une contrainte CHECK violée par l'UPDATE est traduite en ValidationError."""
+    with pytest.raises(ValidationError, match="antérieure"):
+        update_event(
+            session=db_session,
+            current_employee=manager,
+            event_id=event_assigned_to_support.id,
+            start_date=event_assigned_to_support.end_date + timedelta(hours=1),
+        )
+
+
+def test_update_event_rejects_overlap_for_same_support(
+    db_session, manager, support, client, signed_contract, event_assigned_to_support
+):
+    """Déplacer un événement sur un créneau déjà couvert par son support échoue."""
+    # Contigu (début = fin du premier) : accepté, les plages sont semi-ouvertes
+    start = event_assigned_to_support.end_date
+    other = Event(
+        client_id=client.id,
+        contract_id=signed_contract.id,
+        support_contact_id=support.id,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location="Lyon",
+        attendees=5,
+    )
+    db_session.add(other)
+    db_session.commit()
+
+    with pytest.raises(ValidationError, match="créneau"):
+        update_event(
+            session=db_session,
+            current_employee=manager,
+            event_id=other.id,
+            start_date=event_assigned_to_support.start_date + timedelta(minutes=30),
+        )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.models.event import Event
+from app.repositories.inbox_repository import (
+    INBOX_MY_EVENT,
+    INBOX_UNPAID_CONTRACT,
+    INBOX_UNSIGNED_CONTRACT,
+    INBOX_UNSTAFFED_EVENT,
+    LATER,
+    SOON,
+    URGENT,
+)
+from app.services.inbox_service import ValidationError, build_inbox
+
+NOW = datetime.now(timezone.utc)
+
+
+def _create_employee(db_session, *, email: str, role: Role) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name="User",
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_client(db_session, *, email: str, sales: Employee) -> Client:
+    client = Client(
+        first_name="Client",
+        last_name=email.split("@")[0],
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def _create_contract(
+    db_session, client: Client, *, due, signed, age_days: int = 0
+) -> Contract:
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=client.sales_contact_id,
+        total_amount=Decimal("1000"),
+        amount_due=Decimal(due),
+        is_signed=signed,
+        created_at=NOW - timedelta(days=age_days),
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def _create_event(db_session, contract, *, in_days: int, support=None) -> Event:
+    start = NOW + timedelta(days=in_days)
+    ev = Event(
+        client_id=contract.client_id,
+        contract_id=contract.id,
+        support_contact_id=support.id if support else None,
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+        location=f"Salle J+{in_days}",
+        attendees=10,
+    )
+    db_session.add(ev)
+    db_session.commit()
+    return ev
+
+
+def _setup(db_session):
+    sales = _create_employee(db_session, email="sales@test.com", role=Role.SALES)
+    other = _create_employee(db_session, email="other@test.com", role=Role.SALES)
+    support = _create_employee(db_session, email="sup@test.com", role=Role.SUPPORT)
+
+    mine = _create_client(db_session, email="mine@test.com", sales=sales)
+    theirs = _create_client(db_session, email="theirs@test.com", sales=other)
+
+    unsigned = _create_contract(db_session, mine, due="1000", signed=False, age_days=45)
+    unpaid = _create_contract(db_session, mine, due="300", signed=True, age_days=10)
+    paid = _create_contract(db_session, mine, due="0", signed=True)
+    _create_contract(db_session, theirs, due="500", signed=False)
+    other_signed = _create_contract(db_session, theirs, due="0", signed=True)
+
+    unstaffed = _create_event(db_session, paid, in_days=3)
+    staffed = _create_event(db_session, paid, in_days=60, support=support)
+    other_unstaffed = _create_event(db_session, other_signed, in_days=20)
+    return {
+        "sales": sales,
+        "support": support,
+        "unsigned": unsigned,
+        "unpaid": unpaid,
+        "unstaffed": unstaffed,
+        "staffed": staffed,
+        "other_unstaffed": other_unstaffed,
+    }
+
+
+def test_sales_inbox_grouped_by_urgency(db_session):
+    data = _setup(db_session)
+    sales = data["sales"]
+    db_session.refresh(sales)
+
+    statements: list[str] = []
+
+    def record(conn, cursor, stmt, *args):
+        statements.append(stmt)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        items = build_inbox(db_session, sales)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert "UNION ALL" in statements[0]
+    assert [(i.kind, i.item_id, i.urgency) for i in items] == [
+        (INBOX_UNSIGNED_CONTRACT, data["unsigned"].id, URGENT),
+        (INBOX_UNSTAFFED_EVENT, data["unstaffed"].id, URGENT),
+        (INBOX_UNPAID_CONTRACT, data["unpaid"].id, SOON),
+    ]
+    assert items[2].amount == Decimal("300")
+    assert items[1].location == "Salle J+3"
+
+
+def test_support_inbox_lists_own_upcoming_events(db_session):
+    data = _setup(db_session)
+
+    items = build_inbox(db_session, data["support"])
+
+    assert [(i.kind, i.item_id, i.urgency) for i in items] == [
+        (INBOX_MY_EVENT, data["staffed"].id, LATER),
+    ]
+
+
+def test_management_inbox_lists_all_unstaffed_events(db_session):
+    data = _setup(db_session)
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+
+    items = build_inbox(db_session, manager)
+
+    assert [(i.item_id, i.urgency) for i in items] == [
+        (data["unstaffed"].id, URGENT),
+        (data["other_unstaffed"].id, SOON),
+    ]
+    assert build_inbox(db_session, manager, limit=1)[0].item_id == data["unstaffed"].id
+
+
+def test_inbox_rejects_invalid_limit(db_session):
+    sales = _create_employee(db_session, email="sales@test.com", role=Role.SALES)
+
+    with pytest.raises(ValidationError):
+        build_inbox(db_session, sales, limit=0)
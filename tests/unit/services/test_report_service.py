@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee, Role
+from app.services.report_service import (
+    PermissionDeniedError,
+    ValidationError,
+    aging_report,
+    financial_report,
+    refresh_reports,
+)
+
+
+def _create_employee(db_session, *, email: str, role: Role) -> Employee:
+    emp = Employee(
+        first_name="Test",
+        last_name=email.split("@")[0],
+        email=email,
+        role=role,
+        password_hash=hash_password("Secret123!"),
+    )
+    db_session.add(emp)
+    db_session.commit()
+    db_session.refresh(emp)
+    return emp
+
+
+def _create_client(db_session, *, email: str, last_name: str, sales: Employee):
+    client = Client(
+        first_name="Client",
+        last_name=last_name,
+        email=email,
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def _create_contract(
+    db_session, client, *, total, due, signed, age_days: int | None = None
+) -> Contract:
+    contract = Contract(
+        client_id=client.id,
+        sales_contact_id=client.sales_contact_id,
+        total_amount=Decimal(total),
+        amount_due=Decimal(due),
+        is_signed=signed,
+    )
+    if age_days is not None:
+        contract.created_at = datetime.now(timezone.utc) - timedelta(days=age_days)
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+def test_financial_report_reads_refreshed_snapshot(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice@test.com", role=Role.SALES)
+    bob = _create_employee(db_session, email="bob@test.com", role=Role.SALES)
+
+    acme = _create_client(db_session, email="a@test.com", last_name="Acme", sales=alice)
+    beta = _create_client(db_session, email="b@test.com", last_name="Beta", sales=bob)
+    _create_contract(db_session, acme, total="1000", due="400", signed=True)
+    _create_contract(db_session, acme, total="500", due="0", signed=False)
+    _create_contract(db_session, beta, total="2000", due="1500", signed=False)
+
+    refreshed_at = refresh_reports(db_session, manager)
+    assert refreshed_at is not None
+
+    rows, snapshot = financial_report(db_session, manager, by="client")
+    assert snapshot == refreshed_at
+    # Tri par restant dû décroissant
+    assert [(r.label, r.contracts, r.amount_due) for r in rows] == [
+        ("Client Beta", 1, Decimal("1500")),
+        ("Client Acme", 2, Decimal("400")),
+    ]
+    acme_row = rows[1]
+    assert acme_row.entity_id == acme.id
+    assert acme_row.signed_contracts == 1
+    assert acme_row.unpaid_contracts == 1
+    assert acme_row.total_amount == Decimal("1500")
+
+    rows, _ = financial_report(db_session, manager, by="sales")
+    assert [(r.entity_id, r.total_amount) for r in rows] == [
+        (bob.id, Decimal("2000")),
+        (alice.id, Decimal("1500")),
+    ]
+
+
+def test_financial_report_is_a_snapshot_until_refresh(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice@test.com", role=Role.SALES)
+    acme = _create_client(db_session, email="a@test.com", last_name="Acme", sales=alice)
+    _create_contract(db_session, acme, total="1000", due="400", signed=True)
+
+    refresh_reports(db_session, manager)
+    _create_contract(db_session, acme, total="300", due="300", signed=False)
+
+    rows, _ = financial_report(db_session, manager)
+    assert rows[0].contracts == 1
+
+    refresh_reports(db_session, manager, concurrently=False)
+    rows, _ = financial_report(db_session, manager)
+    assert rows[0].contracts == 2
+    assert rows[0].amount_due == Decimal("700")
+
+
+def test_reports_are_management_only(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+
+    with pytest.raises(PermissionDeniedError):
+        refresh_reports(db_session, sales)
+    with pytest.raises(PermissionDeniedError):
+        financial_report(db_session, sales)
+
+
+def test_financial_report_rejects_unknown_grouping(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+
+    with pytest.raises(ValidationError):
+        financial_report(db_session, manager, by="region")
+
+
+def test_aging_report_buckets_unpaid_contracts_by_age(db_session):
+    manager = _create_employee(db_session, email="m@test.com", role=Role.MANAGEMENT)
+    alice = _create_employee(db_session, email="alice@test.com", role=Role.SALES)
+    bob = _create_employee(db_session, email="bob@test.com", role=Role.SALES)
+
+    acme = _create_client(db_session, email="a@test.com", last_name="Acme", sales=alice)
+    beta = _create_client(db_session, email="b@test.com", last_name="Beta", sales=bob)
+    _create_contract(db_session, acme, total="500", due="100", signed=True, age_days=5)
+    _create_contract(db_session, acme, total="500", due="200", signed=True, age_days=45)
+    _create_contract(
+        db_session, acme, total="500", due="300", signed=True, age_days=120
+    )
+    _create_contract(db_session, acme, total="500", due="0", signed=True, age_days=200)
+    _create_contract(
+        db_session, beta, total="900", due="900", signed=False, age_days=75
+    )
+
+    rows = list(aging_report(db_session, manager, by="client", page_size=1))
+
+    assert [r.entity_id for r in rows] == [beta.id, acme.id]
+    beta_row, acme_row = rows
+    assert beta_row.buckets == (0, 0, Decimal("900"), 0)
+    assert beta_row.share == Decimal("60.0")
+
+    # Le contrat soldé n'entre pas dans la balance
+    assert acme_row.contracts == 3
+    assert acme_row.buckets == (Decimal("100"), Decimal("200"), 0, Decimal("300"))
+    assert acme_row.amount_due == Decimal("600")
+    assert acme_row.oldest_days == 120
+    assert acme_row.share == Decimal("40.0")
+
+    rows = list(aging_report(db_session, manager, by="sales"))
+    assert [(r.entity_id, r.amount_due) for r in rows] == [
+        (bob.id, Decimal("900")),
+        (alice.id, Decimal("600")),
+    ]
+
+
+def test_aging_report_is_management_only(db_session):
+    sales = _create_employee(db_session, email="s@test.com", role=Role.SALES)
+
+    with pytest.raises(PermissionDeniedError):
+        aging_report(db_session, sales)